@@ -0,0 +1,109 @@
+"""
+Compare entry point discovery backends on synthetic environments.
+
+Each synthetic environment is a single site-packages style directory holding
+the requested number of distributions.  Every distribution declares a
+console script, and one in ten also declares ``qt_designer_widgets`` and
+``qt_designer_event.*`` entry points.
+
+Usage::
+
+    python benchmarks/bench_discovery.py --sizes 50 500 5000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from pyqt_designer_plugin_entry_points import backends, cache, core
+
+EVENT_SIGNALS = ('formEditorSet', 'formWindowAdded')
+
+
+def make_environment(site_dir, count):
+    """Create ``count`` synthetic distributions in ``site_dir``."""
+    for idx in range(count):
+        name = f'synthetic_dist_{idx:05d}'
+        dist_info = os.path.join(site_dir, f'{name}-1.0.{idx}.dist-info')
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, 'METADATA'), 'wt') as f:
+            f.write(f'Metadata-Version: 2.1\nName: {name}\n'
+                    f'Version: 1.0.{idx}\n')
+
+        lines = ['[console_scripts]', f'{name} = {name}.cli:main']
+        if idx % 10 == 0:
+            lines += [f'[{core.ENTRYPOINT_WIDGET_KEY}]',
+                      f'Widget{idx} = {name}.widgets:Widget{idx}']
+            for signal_name in EVENT_SIGNALS:
+                lines += [f'[{core.ENTRYPOINT_EVENT_KEY}.{signal_name}]',
+                          f'hook{idx} = {name}.hooks:{signal_name}']
+
+        with open(os.path.join(dist_info, 'entry_points.txt'), 'wt') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def time_call(func, repeat):
+    """Run ``func`` ``repeat`` times, returning the median time and result."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times), result
+
+
+def count_entries(table):
+    return sum(len(entries) for entries in table.values())
+
+
+def run(sizes, repeat):
+    print(f'{"Distributions":>13} {"Backend":<18} {"Median (ms)":>12} '
+          f'{"Entries":>8}')
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            site_dir = os.path.join(tmp_dir, 'site-packages')
+            make_environment(site_dir, size)
+            path = [site_dir]
+
+            index_filename = os.path.join(tmp_dir, 'index.json')
+            table = core.scan_entry_points(path=path)
+            backends.write_static_index(table, index_filename)
+
+            cache_filename = os.path.join(tmp_dir, 'cache.json')
+            cache.save_table(cache.compute_fingerprint(path=path), table,
+                             filename=cache_filename)
+
+            def warm_cache():
+                fingerprint = cache.compute_fingerprint(path=path)
+                return cache.load_table(fingerprint, filename=cache_filename)
+
+            candidates = [
+                (name, lambda name=name: core.scan_entry_points(
+                    path=path, backend=name))
+                for name in ('entrypoints', 'importlib')
+            ]
+            candidates += [
+                ('static', lambda: core.scan_entry_points(
+                    path=path,
+                    backend=backends.StaticIndexBackend(index_filename))),
+                ('entrypoints+cache', warm_cache),
+            ]
+
+            for name, func in candidates:
+                elapsed, result = time_call(func, repeat)
+                print(f'{size:>13} {name:<18} {elapsed * 1e3:>12.2f} '
+                      f'{count_entries(result):>8}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[50, 500, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare form-load time with shared and per-widget copied designer info.
+
+A form load is simulated by creating the requested number of widgets through
+a wrapped plugin's ``createWidget()``, as Qt Designer does when opening a
+form.  The ``copied`` plugin reproduces the previous behavior of passing a
+new dictionary copy of the designer information to every
+``init_for_designer()`` call; the ``shared`` plugin is the current wrapper,
+which passes the one read-only record.
+
+Usage::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_form_load.py \\
+        --sizes 1000 10000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import time
+import tracemalloc
+
+from PyQt5 import QtWidgets
+
+from pyqt_designer_plugin_entry_points import core
+
+
+class BenchWidget(QtWidgets.QWidget):
+    @classmethod
+    def get_designer_info(cls):
+        return dict(group='Benchmark', tooltip='Benchmark widget',
+                    extensions=None, icon=None)
+
+    def init_for_designer(self, info):
+        self.designer_group = info['group']
+
+
+SharedPlugin = core.DesignerPluginWrapper.from_class(BenchWidget)
+
+
+class CopiedPlugin(SharedPlugin):
+    def createWidget(self, parent):
+        widget = self.widget_class(parent=parent)
+        widget.init_for_designer(dict(self._info))
+        return widget
+
+
+def load_form(plugin, count):
+    """Create ``count`` widgets on a form, returning the time taken."""
+    form = QtWidgets.QWidget()
+    t0 = time.perf_counter()
+    for _ in range(count):
+        plugin.createWidget(form)
+    elapsed = time.perf_counter() - t0
+    form.deleteLater()
+    QtWidgets.QApplication.processEvents()
+    return elapsed
+
+
+def measure_allocations(plugin, count):
+    """Peak memory allocated by Python while loading the form."""
+    form = QtWidgets.QWidget()
+    tracemalloc.start()
+    try:
+        for _ in range(count):
+            plugin.createWidget(form)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        form.deleteLater()
+        QtWidgets.QApplication.processEvents()
+
+
+def run(sizes, repeat):
+    print(f'{"Widgets":>8} {"Plugin":<8} {"Median (ms)":>12} '
+          f'{"Peak (kB)":>10}')
+    for size in sizes:
+        for name, plugin_cls in (('copied', CopiedPlugin),
+                                 ('shared', SharedPlugin)):
+            plugin = plugin_cls()
+            elapsed = statistics.median(load_form(plugin, size)
+                                        for _ in range(repeat))
+            peak = measure_allocations(plugin, size)
+            print(f'{size:>8} {name:<8} {elapsed * 1e3:>12.2f} '
+                  f'{peak / 1024:>10.1f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    run(args.sizes, args.repeat)
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
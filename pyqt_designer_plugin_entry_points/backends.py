@@ -0,0 +1,353 @@
+"""
+Entry point discovery backends.
+
+A backend scans the distributions on ``sys.path`` and returns a table of
+entry point group name to a list of ``entrypoints.EntryPoint``.  The backend
+is selected by name, either through the ``backend`` argument of
+:func:`core.get_entry_point_table` or the ``PYQT_DESIGNER_PLUGIN_BACKEND``
+environment variable:
+
+* ``entrypoints`` - the ``entrypoints`` package (default)
+* ``importlib`` - ``importlib.metadata``, or its ``importlib_metadata``
+  backport
+* ``static`` - a precomputed JSON index, written by
+  :func:`write_static_index` and located by the ``PYQT_DESIGNER_PLUGIN_INDEX``
+  environment variable
+"""
+import glob
+import itertools
+import json
+import logging
+import os
+import sys
+
+import entrypoints
+
+from . import cache, manifest
+
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_BACKEND'
+INDEX_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_INDEX'
+DEFAULT_BACKEND = 'entrypoints'
+STATIC_INDEX_VERSION = 1
+
+
+def _parse_entry(group, name, value, distro):
+    """Parse an entry point, explaining invalid manifest entries."""
+    try:
+        return entrypoints.EntryPoint.from_string(value, name, distro)
+    except entrypoints.BadEntryPoint:
+        if group == manifest.MANIFEST_GROUP:
+            manifest.log_bad_entry(name, value, distro)
+        raise
+
+
+def _add_config_entries(table, config, distro, group_filter):
+    """Add entries from a parsed entry_points.txt ``config`` to ``table``."""
+    for group in config.sections():
+        if not group_filter(group):
+            continue
+
+        entries = table.setdefault(group, [])
+        for name, epstr in config[group].items():
+            with entrypoints.BadEntryPoint.err_to_warnings():
+                entries.append(_parse_entry(group, name, epstr, distro))
+
+
+def _iter_filtered_configs(path, distribution_filter):
+    """
+    Like ``entrypoints.iter_files_distros``, but only parse the entry points
+    of distributions for which ``distribution_filter`` returns True.
+    """
+    if path is None:
+        path = sys.path
+
+    distro_names_seen = set()
+    for folder in path:
+        if not os.path.isdir(folder) or folder.rstrip('/\\').endswith('.egg'):
+            # Eggs and zip files are left to entrypoints
+            for config, distro in entrypoints.iter_files_distros(
+                    path=[folder]):
+                if distro.name in distro_names_seen:
+                    continue
+                distro_names_seen.add(distro.name)
+                if distribution_filter(distro.name):
+                    yield config, distro
+            continue
+
+        for ep_path in itertools.chain(
+                glob.iglob(os.path.join(glob.escape(folder), '*.dist-info',
+                                        'entry_points.txt')),
+                glob.iglob(os.path.join(glob.escape(folder), '*.egg-info',
+                                        'entry_points.txt'))):
+            name_version = os.path.splitext(
+                os.path.basename(os.path.dirname(ep_path)))[0]
+            distro = entrypoints.Distribution.from_name_version(name_version)
+            if distro.name in distro_names_seen:
+                continue
+            distro_names_seen.add(distro.name)
+            if not distribution_filter(distro.name):
+                continue
+
+            config = entrypoints.CaseSensitiveConfigParser(
+                delimiters=('=', ))
+            config.read([ep_path])
+            yield config, distro
+
+
+class DiscoveryBackend:
+    """
+    Base class for entry point discovery backends.
+
+    Attributes
+    ----------
+    name : str
+        The name used to select the backend.
+    cacheable : bool
+        Whether scan results may be stored in the on-disk cache.
+    """
+
+    name = None
+    cacheable = True
+
+    def scan(self, group_filter, path=None, distribution_filter=None):
+        """
+        Scan for entry points.
+
+        Parameters
+        ----------
+        group_filter : callable
+            Called with each group name; only groups for which it returns
+            True are included.
+        path : list of str, optional
+            Defaults to ``sys.path``.
+        distribution_filter : callable, optional
+            Called with each distribution name; only distributions for which
+            it returns True are included.  Where possible, the metadata of
+            other distributions is not read at all.
+
+        Returns
+        -------
+        table : dict
+            Dictionary of group name to list of EntryPoint.
+        """
+        raise NotImplementedError()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} name={self.name!r}>'
+
+
+class EntrypointsBackend(DiscoveryBackend):
+    """Discovery using the ``entrypoints`` package."""
+
+    name = 'entrypoints'
+
+    def scan(self, group_filter, path=None, distribution_filter=None):
+        if distribution_filter is None:
+            configs = entrypoints.iter_files_distros(path=path)
+        else:
+            configs = _iter_filtered_configs(path, distribution_filter)
+
+        table = {}
+        for config, distro in configs:
+            _add_config_entries(table, config, distro, group_filter)
+        return table
+
+
+class ImportlibMetadataBackend(DiscoveryBackend):
+    """Discovery using ``importlib.metadata``."""
+
+    name = 'importlib'
+
+    def scan(self, group_filter, path=None, distribution_filter=None):
+        if importlib_metadata is None:
+            raise RuntimeError(
+                'importlib.metadata (or the importlib_metadata backport) is '
+                'required for the importlib discovery backend'
+            )
+
+        kwargs = {} if path is None else dict(path=path)
+        table = {}
+        distro_names_seen = set()
+        for dist in importlib_metadata.distributions(**kwargs):
+            eps = [ep for ep in dist.entry_points if group_filter(ep.group)]
+            if not eps:
+                continue
+
+            # Only read the metadata of distributions that are of interest
+            distro = entrypoints.Distribution(dist.metadata['Name'],
+                                              dist.version)
+            if distro.name in distro_names_seen:
+                continue
+            distro_names_seen.add(distro.name)
+            if (distribution_filter is not None and
+                    not distribution_filter(distro.name)):
+                continue
+
+            for ep in eps:
+                with entrypoints.BadEntryPoint.err_to_warnings():
+                    table.setdefault(ep.group, []).append(
+                        _parse_entry(ep.group, ep.name, ep.value, distro))
+        return table
+
+
+class StaticIndexBackend(DiscoveryBackend):
+    """
+    Discovery from a precomputed JSON index.
+
+    The index is not validated against the environment; it must be
+    regenerated whenever plugin distributions are installed or upgraded.
+
+    Parameters
+    ----------
+    filename : str, optional
+        The index filename.  Defaults to the ``PYQT_DESIGNER_PLUGIN_INDEX``
+        environment variable.
+    """
+
+    name = 'static'
+    cacheable = False
+
+    def __init__(self, filename=None):
+        self.filename = filename
+
+    def scan(self, group_filter, path=None, distribution_filter=None):
+        table = read_static_index(self.filename)
+        return {
+            group: [entry for entry in entries
+                    if distribution_filter is None or entry.distro is None or
+                    distribution_filter(entry.distro.name)]
+            for group, entries in table.items()
+            if group_filter(group)
+        }
+
+
+def scan_distribution(dist_dir, group_filter):
+    """
+    Read the entry points of a single ``.dist-info`` or ``.egg-info``
+    directory.
+
+    Parameters
+    ----------
+    dist_dir : str
+        The distribution metadata directory.
+    group_filter : callable
+        Called with each group name; only groups for which it returns True
+        are included.
+
+    Returns
+    -------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    """
+    name_version = os.path.splitext(os.path.basename(dist_dir))[0]
+    distro = entrypoints.Distribution.from_name_version(name_version)
+    config = entrypoints.CaseSensitiveConfigParser(delimiters=('=', ))
+    config.read([os.path.join(dist_dir, 'entry_points.txt')])
+
+    table = {}
+    _add_config_entries(table, config, distro, group_filter)
+    return table
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (EntrypointsBackend, ImportlibMetadataBackend,
+                    StaticIndexBackend)
+}
+
+
+def get_backend(backend=None):
+    """
+    Get a discovery backend instance.
+
+    Parameters
+    ----------
+    backend : str or DiscoveryBackend, optional
+        The backend name, or an instance.  Defaults to the
+        ``PYQT_DESIGNER_PLUGIN_BACKEND`` environment variable, or
+        ``entrypoints``.
+
+    Returns
+    -------
+    backend : DiscoveryBackend
+    """
+    if isinstance(backend, DiscoveryBackend):
+        return backend
+
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV_VAR, '').strip() or \
+            DEFAULT_BACKEND
+
+    try:
+        return BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(
+            f'Unknown discovery backend {backend!r}; options are: '
+            f'{", ".join(BACKENDS)}'
+        ) from None
+
+
+def get_static_index_filename(filename=None):
+    """The static index filename, from the argument or environment."""
+    filename = filename or os.environ.get(INDEX_ENV_VAR)
+    if not filename:
+        raise ValueError(
+            f'No static index specified; set {INDEX_ENV_VAR} to the index '
+            f'filename'
+        )
+    return filename
+
+
+def read_static_index(filename=None):
+    """
+    Read a static entry point index.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Defaults to the ``PYQT_DESIGNER_PLUGIN_INDEX`` environment variable.
+
+    Returns
+    -------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    """
+    filename = get_static_index_filename(filename)
+    with open(filename, 'rt') as f:
+        index = json.load(f)
+
+    if index.get('version') != STATIC_INDEX_VERSION:
+        raise ValueError(
+            f'Unsupported static index version in {filename}: '
+            f'{index.get("version")}'
+        )
+    return cache.table_from_rows(index.get('entries', []))
+
+
+def write_static_index(table, filename=None):
+    """
+    Write a static entry point index.
+
+    Parameters
+    ----------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    filename : str, optional
+        Defaults to the ``PYQT_DESIGNER_PLUGIN_INDEX`` environment variable.
+    """
+    filename = get_static_index_filename(filename)
+    index = dict(version=STATIC_INDEX_VERSION,
+                 entries=cache.table_to_rows(table))
+    with open(filename, 'wt') as f:
+        json.dump(index, f, indent=1)
+    logger.info('Wrote static entry point index: %s', filename)
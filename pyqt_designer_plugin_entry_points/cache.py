@@ -0,0 +1,221 @@
+"""
+Persistent on-disk cache of the discovered entry point table.
+
+Walking every distribution on ``sys.path`` to find the designer entry points
+is slow on network filesystems.  The resolved table is stored per Python
+environment in the user cache directory and reused as long as the
+fingerprint of ``sys.path`` (the entries themselves and the distribution
+metadata directories found in them) is unchanged.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import zipfile
+
+import entrypoints
+
+from .utils import atomic_write_json, env_flag
+
+CACHE_VERSION = 1
+CACHE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_CACHE'
+CACHE_DIR_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_CACHE_DIR'
+
+_DISTRIBUTION_SUFFIXES = ('.dist-info', '.egg-info', '.egg')
+
+logger = logging.getLogger(__name__)
+
+
+def cache_enabled():
+    """Is the on-disk cache enabled?  Set the environment variable to 0 to
+    disable it."""
+    return env_flag(CACHE_ENV_VAR, default=True)
+
+
+def get_cache_dir():
+    """The user-level cache directory for this package."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return cache_dir
+
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pyqt_designer_plugin_entry_points')
+
+
+def get_cache_filename(basename='entry_points'):
+    """The cache filename for the current Python environment."""
+    env_hash = hashlib.sha1(sys.prefix.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(get_cache_dir(), f'{basename}-{env_hash}.json')
+
+
+def _fingerprint_folder(folder, update):
+    """Add a single sys.path entry to the fingerprint hash."""
+    update(f'path:{folder}')
+    try:
+        if not os.path.isdir(folder):
+            if zipfile.is_zipfile(folder):
+                st = os.stat(folder)
+                update(f'zip:{st.st_size}:{st.st_mtime_ns}')
+            return
+
+        with os.scandir(folder) as it:
+            dist_entries = sorted(
+                (entry for entry in it
+                 if entry.name.endswith(_DISTRIBUTION_SUFFIXES)),
+                key=lambda entry: entry.name
+            )
+    except OSError:
+        return
+
+    for entry in dist_entries:
+        # The inode comes for free with the directory listing and changes
+        # on reinstallation; in-place (editable) egg-info directories are
+        # rewritten without a new inode, so stat their entry points file.
+        update(f'dist:{entry.name}:{entry.inode()}')
+        if entry.name.endswith('.egg-info'):
+            try:
+                st = os.stat(os.path.join(entry.path, 'entry_points.txt'))
+            except OSError:
+                continue
+            update(f'ep:{st.st_mtime_ns}')
+
+
+def compute_fingerprint(path=None, extra=()):
+    """
+    Compute a cheap fingerprint of the distributions found on ``path``.
+
+    Parameters
+    ----------
+    path : list of str, optional
+        Defaults to ``sys.path``.
+    extra : iterable of str, optional
+        Additional strings to include in the fingerprint.
+
+    Returns
+    -------
+    fingerprint : str
+    """
+    if path is None:
+        path = sys.path
+
+    sha = hashlib.sha1()
+
+    def update(value):
+        sha.update(value.encode('utf-8', 'surrogateescape'))
+        sha.update(b'\0')
+
+    update(f'version:{CACHE_VERSION}')
+    for item in extra:
+        update(f'extra:{item}')
+
+    for folder in path:
+        _fingerprint_folder(folder or os.curdir, update)
+
+    return sha.hexdigest()
+
+
+def entry_to_row(group, entry):
+    """Convert an EntryPoint to a JSON-serializable row."""
+    distro = entry.distro
+    return dict(
+        group=group,
+        name=entry.name,
+        module=entry.module_name,
+        attr=entry.object_name,
+        extras=entry.extras,
+        distribution=distro.name if distro is not None else None,
+        version=distro.version if distro is not None else None,
+    )
+
+
+def entry_from_row(row):
+    """Convert a cached row back to an EntryPoint."""
+    distro = None
+    if row.get('distribution') is not None:
+        distro = entrypoints.Distribution(row['distribution'],
+                                          row.get('version'))
+    return entrypoints.EntryPoint(row['name'], row['module'], row['attr'],
+                                  extras=row.get('extras'), distro=distro)
+
+
+def table_to_rows(table):
+    """Convert an entry point table to a list of JSON-serializable rows."""
+    return [entry_to_row(group, entry)
+            for group, entries in table.items()
+            for entry in entries]
+
+
+def table_from_rows(rows):
+    """Convert a list of rows back to an entry point table."""
+    table = {}
+    for row in rows:
+        table.setdefault(row['group'], []).append(entry_from_row(row))
+    return table
+
+
+def load_table(fingerprint, filename=None):
+    """
+    Load the cached entry point table, if it matches ``fingerprint``.
+
+    Returns
+    -------
+    table : dict or None
+        Dictionary of group name to list of EntryPoint, or None if the cache
+        is missing, unreadable, or stale.
+    """
+    filename = filename or get_cache_filename()
+    try:
+        with open(filename, 'rt') as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        logger.debug('Unable to read entry point cache %s: %s', filename, ex)
+        return None
+
+    if (cached.get('version') != CACHE_VERSION or
+            cached.get('fingerprint') != fingerprint):
+        logger.debug('Entry point cache %s is stale', filename)
+        return None
+
+    return table_from_rows(cached.get('entries', []))
+
+
+def save_table(fingerprint, table, filename=None):
+    """
+    Save the entry point table to the cache.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The fingerprint the table was generated with.
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    filename : str, optional
+        Defaults to the per-environment cache filename.
+    """
+    filename = filename or get_cache_filename()
+    cached = dict(
+        version=CACHE_VERSION,
+        fingerprint=fingerprint,
+        entries=table_to_rows(table),
+    )
+
+    try:
+        atomic_write_json(filename, cached)
+    except Exception as ex:
+        logger.debug('Unable to write entry point cache %s: %s', filename, ex)
+        return False
+
+    return True
+
+
+def clear(filename=None):
+    """Remove the cached entry point table."""
+    filename = filename or get_cache_filename()
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        ...
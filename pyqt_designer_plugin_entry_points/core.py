@@ -1,12 +1,31 @@
+import collections.abc
+import functools
 import logging
 import sys
-import traceback
+import time
 
-import entrypoints
-from PyQt5 import QtCore, QtDesigner, QtGui
+from PyQt5 import QtCore, QtDesigner, QtWidgets
+
+from . import (backends, cache, deferred, dispatch, dom, exception_log,
+               exceptions, icons, latency, loader, manifest, profiles,
+               repaint, workers)
+from .info import DesignerInfo
+from .quarantine import get_quarantine
+from .report import measure
+from .utils import env_flag
 
 ENTRYPOINT_WIDGET_KEY = 'qt_designer_widgets'
 ENTRYPOINT_EVENT_KEY = 'qt_designer_event'
+ENTRYPOINT_MANIFEST_KEY = manifest.MANIFEST_GROUP
+LAZY_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_LAZY'
+
+DEFAULT_DESIGNER_INFO = dict(
+    is_container=False,
+    group='Designer Plugin Default',
+    extensions=None,
+    icon=None,
+    tooltip='Designer plugin default tooltip',
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +48,16 @@ class _DesignerHooks(QtCore.QObject):
 
     formEditorSet = QtCore.pyqtSignal(QtCore.QObject)
     formWindowAdded = QtCore.pyqtSignal(QtCore.QObject)
-    uncaughtExceptionRaised = QtCore.pyqtSignal(dict)
+    formWindowRemoved = QtCore.pyqtSignal(QtCore.QObject)
+    # High-rate signals; see the dispatch module for debouncing hooks
+    formChanged = QtCore.pyqtSignal(QtCore.QObject)
+    selectionChanged = QtCore.pyqtSignal(QtCore.QObject)
+    propertyChanged = QtCore.pyqtSignal(str, object)
+    # Emits an exceptions.ExceptionRecord, which holds no frames
+    uncaughtExceptionRaised = QtCore.pyqtSignal(object)
+    # Emits (exc_type, value, traceback); only for hooks that need the live
+    # objects, as keeping them keeps every frame alive
+    uncaughtExceptionRaisedRaw = QtCore.pyqtSignal(object)
 
     def _get_hookable_signals(d):
         return tuple(attr for attr, obj in d.items()
@@ -41,7 +69,68 @@ class _DesignerHooks(QtCore.QObject):
         super().__init__()
         self._form_editor = None
         self._update_timer = None
+        self.repaint_scheduler = None
+        self._preview_scheduler = None
+        self._worker_pool = None
+        self.exception_throttle = exceptions.get_exception_throttle()
+        self.exception_sink = exception_log.get_exception_sink()
+        self._exception_summary_timer = None
         self._event_handlers = {}
+        self.deferred_loader = None
+        # createWidget() latency statistics, if instrumentation is enabled
+        self.widget_stats = latency.get_widget_stats()
+
+    @property
+    def preview_scheduler(self):
+        """The shared scheduler for live-preview widgets, created on demand"""
+        if self._preview_scheduler is None:
+            self._preview_scheduler = repaint.PreviewScheduler(
+                max_rate=repaint.get_preview_max_rate(), parent=self)
+        return self._preview_scheduler
+
+    @property
+    def worker_pool(self):
+        """The shared worker pool for event hooks, created on demand"""
+        if self._worker_pool is None:
+            self._worker_pool = workers.WorkerPool(parent=self)
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._worker_pool.shutdown)
+        return self._worker_pool
+
+    def submit(self, fn, *args, callback=None, error_callback=None,
+               form=None, **kwargs):
+        """
+        Run ``fn(*args, **kwargs)`` on the worker pool, delivering the
+        result to ``callback`` on the GUI thread.
+
+        Work submitted with a ``form`` is cancelled when that form window
+        is closed.  See :meth:`workers.WorkerPool.submit`.
+
+        Returns
+        -------
+        task : workers.WorkerTask
+        """
+        return self.worker_pool.submit(fn, *args, callback=callback,
+                                       error_callback=error_callback,
+                                       form=form, **kwargs)
+
+    def get_hook_dispatcher(self, signal_name):
+        """
+        The dispatcher calling the entry point hooks of a signal, connected
+        to it on first use.
+
+        Returns
+        -------
+        dispatcher : dispatch.SignalDispatcher
+        """
+        dispatcher = self._event_handlers.get(signal_name)
+        if dispatcher is None:
+            signal = getattr(self, signal_name)
+            dispatcher = dispatch.SignalDispatcher(signal_name, parent=self)
+            signal.connect(dispatcher)
+            self._event_handlers[signal_name] = dispatcher
+        return dispatcher
 
     @property
     def form_editor(self):
@@ -62,10 +151,22 @@ class _DesignerHooks(QtCore.QObject):
 
         manager = self.form_window_manager
         if manager:
+            manager.formWindowAdded.connect(self._connect_form_window)
             manager.formWindowAdded.connect(self.formWindowAdded.emit)
+            manager.formWindowRemoved.connect(self._form_window_removed)
+            for idx in range(manager.formWindowCount()):
+                self._connect_form_window(manager.formWindow(idx))
+
+        property_editor = self.form_editor.propertyEditor()
+        if property_editor:
+            property_editor.propertyChanged.connect(self.propertyChanged.emit)
 
-        if not self._update_timer:
-            self._start_kicker()
+        if env_flag(repaint.POLL_ENV_VAR):
+            if not self._update_timer:
+                self._start_kicker()
+        elif self.repaint_scheduler is None:
+            self.repaint_scheduler = repaint.RepaintScheduler(parent=self)
+            self.repaint_scheduler.attach(self.form_editor)
 
     @property
     def form_window_manager(self):
@@ -82,31 +183,110 @@ class _DesignerHooks(QtCore.QObject):
 
         return manager.activeFormWindow()
 
+    def _connect_form_window(self, form):
+        form.changed.connect(functools.partial(self.formChanged.emit, form))
+        form.geometryChanged.connect(
+            functools.partial(self.formChanged.emit, form))
+        form.selectionChanged.connect(
+            functools.partial(self.selectionChanged.emit, form))
+
+    def _form_window_removed(self, form):
+        if self._worker_pool is not None:
+            self._worker_pool.cancel_form(form)
+        self.formWindowRemoved.emit(form)
+
     def _update_widgets(self):
         widget = self.active_form
         if widget:
             widget.update()
 
     def _handle_exceptions(self, exc_type, value, trace):
-        tb = ''.join(traceback.format_exception(exc_type, value, trace))
-        print(f"""
+        fingerprint = exceptions.get_fingerprint(exc_type, value, trace)
+        if not self.exception_throttle.should_report(fingerprint):
+            # Only counted; summarized periodically
+            self._schedule_exception_summary()
+            return
+
+        record = exceptions.ExceptionRecord(
+            exc_type, value, trace, fingerprint=fingerprint,
+            count=self.exception_throttle.count(fingerprint),
+            form=self._get_active_form_filename(),
+        )
+        # The traceback is rendered by the exception log thread, if enabled
+        self._write_exception_report(
+            functools.partial(self._format_exception_report, record), record)
+        self.uncaughtExceptionRaised.emit(record)
+        if self.receivers(self.uncaughtExceptionRaisedRaw) > 0:
+            self.uncaughtExceptionRaisedRaw.emit((exc_type, value, trace))
+
+    @staticmethod
+    def _format_exception_report(record):
+        return f"""
 
 Uncaught exception occurred while running Qt Designer:
 ------------------------------------------------------
-{tb}
+{record.traceback}
 ------------------------------------------------------
-""", file=sys.stderr)
-        self.uncaughtExceptionRaised.emit(
-            dict(traceback=tb, exc_type=exc_type,
-                 value=value, trace=trace)
-        )
+"""
+
+    def _get_active_form_filename(self):
+        try:
+            form = self.active_form
+            return form.fileName() if form else None
+        except Exception:
+            return None
+
+    def _write_exception_report(self, text, record=None):
+        """
+        Write from the exception log thread, if enabled, or to stderr.
+
+        ``text`` may be a callable, returning the text when it is written.
+        """
+        if self.exception_sink is not None:
+            self.exception_sink.put(record=record, text=text)
+        else:
+            print(text() if callable(text) else text, file=sys.stderr)
+
+    def _schedule_exception_summary(self, interval_ms=10000):
+        if self._exception_summary_timer is None:
+            self._exception_summary_timer = QtCore.QTimer(self)
+            self._exception_summary_timer.setSingleShot(True)
+            self._exception_summary_timer.setInterval(interval_ms)
+            self._exception_summary_timer.timeout.connect(
+                self._report_suppressed_exceptions)
+
+        if not self._exception_summary_timer.isActive():
+            self._exception_summary_timer.start()
+
+    def _report_suppressed_exceptions(self):
+        suppressed = self.exception_throttle.take_suppressed()
+        if suppressed:
+            self._write_exception_report(
+                self.exception_throttle.format_summary(suppressed),
+                dict(time=time.time(), suppressed=[
+                    dict(fingerprint=fingerprint, suppressed=count,
+                         total=total)
+                    for fingerprint, (count, total) in suppressed.items()
+                ]))
 
     def _start_kicker(self):
+        """Poll for repaints; only used if requested by the environment."""
         self._update_timer = QtCore.QTimer()
         self._update_timer.setInterval(100)
         self._update_timer.timeout.connect(self._update_widgets)
         self._update_timer.start()
 
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._pause_kicker)
+
+    def _pause_kicker(self, state):
+        """Stop polling while the application is in the background."""
+        if state == QtCore.Qt.ApplicationActive:
+            self._update_timer.start()
+        else:
+            self._update_timer.stop()
+
 
 class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
     """
@@ -114,24 +294,27 @@ class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
     """
 
     _info = None
+    _dom_xml = None
 
     def __init__(self):
         """
         Set up the plugin using the class info in cls
         """
         super().__init__()
-        if self._info is None or not isinstance(self._info, dict):
+        if self._info is None or not isinstance(self._info,
+                                                collections.abc.Mapping):
             raise RuntimeError('DesignerPluginWrapper should be subclassed, '
                                'with _info set as a dictionary')
+        if not isinstance(self._info, DesignerInfo):
+            type(self)._info = DesignerInfo(self._info)
 
         self.initialized = False
         self.manager = None
-        self._icon = self._info['icon'] or QtGui.QIcon()
 
     @classmethod
     def info(cls):
-        """Information about the wrapped widget"""
-        return dict(cls._info)
+        """Information about the wrapped widget, as a new dictionary"""
+        return cls._info.copy()
 
     def initialize(self, core):
         """
@@ -177,11 +360,36 @@ class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
         :param parent: Parent widget of instantiated widget
         :type parent:  QWidget
         """
-        widget = self.widget_class(parent=parent)
+        designer_hooks = get_designer_hooks()
+        stats = designer_hooks.widget_stats
+        if stats is not None:
+            widget = self._create_instrumented_widget(parent, stats)
+        else:
+            widget = self.widget_class(parent=parent)
+
+            if hasattr(widget, 'init_for_designer'):
+                # if inspect.signature() ... see if it will accept an info arg
+                # The read-only info record is shared by all instances
+                widget.init_for_designer(self._info)
+
+        preview_rate = self._info.get('preview_rate')
+        if preview_rate:
+            designer_hooks.preview_scheduler.register(widget, preview_rate)
+        return widget
+
+    def _create_instrumented_widget(self, parent, stats):
+        """createWidget(), recording the latency of each stage in stats"""
+        widget_class = self.widget_class
+        name = widget_class.__name__
+
+        t0 = time.perf_counter()
+        widget = widget_class(parent=parent)
+        stats.add(name, 'constructor', time.perf_counter() - t0)
 
         if hasattr(widget, 'init_for_designer'):
-            # if inspect.signature() ... see if it will accept an info arg
-            widget.init_for_designer(dict(self._info))
+            t0 = time.perf_counter()
+            widget.init_for_designer(self._info)
+            stats.add(name, 'init', time.perf_counter() - t0)
 
         return widget
 
@@ -208,7 +416,9 @@ class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
         A longer description of the widget for Qt Designer. By default, this
         is the entire class docstring.
         """
-        return self._info.get('whatsthis', self.widget_class.__doc__ or '')
+        if 'whatsthis' in self._info:
+            return self._info['whatsthis']
+        return self.widget_class.__doc__ or ''
 
     def isContainer(self):
         """
@@ -219,23 +429,24 @@ class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
     def icon(self):
         """
         Return a QIcon to represent this widget in Qt Designer.
+
+        The icon is created on first use and shared by all plugins with the
+        same icon source.  See :mod:`.icons`.
         """
-        return self._icon
+        return icons.get_icon(self._info.get('icon'))
 
     def domXml(self):
         """
         XML Description of the widget's properties.
+
+        This is generated once per plugin class.  See :mod:`.dom`.
         """
-        name = self.name()
-        tooltip = self.toolTip()
+        cls = type(self)
         # TODO: hook here?
-        return (f"""\
-<widget class="{name}" name="{name}">
- <property name="toolTip" >
-  <string>{tooltip}</string>
- </property>
-</widget>
-""")
+        if cls.__dict__.get('_dom_xml') is None:
+            cls._dom_xml = dom.make_dom_xml(self.name(), self._info,
+                                            widget_cls=self._info.get('cls'))
+        return cls._dom_xml
 
     def includeFile(self):
         """
@@ -247,38 +458,212 @@ class DesignerPluginWrapper(QtDesigner.QPyDesignerCustomWidgetPlugin):
     def from_class(cls, widget_cls, designer_info=None):
         assert not isinstance(cls, QtDesigner.QPyDesignerCustomWidgetPlugin)
 
-        info = dict(
-            cls=widget_cls,
-            is_container=False,
-            group='Designer Plugin Default',
-            extensions=None,
-            icon=None,
-            tooltip='Designer plugin default tooltip',
+        info = make_designer_info(widget_cls, designer_info=designer_info)
+        dom_xml = dom.make_dom_xml(widget_cls.__name__, info,
+                                   widget_cls=widget_cls)
+        return type(f'{cls.__name__}_WrappedDesignerPlugin',
+                    (DesignerPluginWrapper, ),
+                    dict(_info=info, _dom_xml=dom_xml)
+                    )
+
+
+class LazyDesignerPluginWrapper(DesignerPluginWrapper):
+    """
+    Designer plugin which defers importing the widget until first use.
+
+    ``name()``, ``group()``, ``toolTip()``, ``icon()``, ``isContainer()`` and
+    ``includeFile()`` are answered from the entry point metadata.  The widget
+    module is only imported on the first ``createWidget()`` or
+    ``whatsThis()``, or when the full ``info()`` is requested.
+    """
+
+    _entry = None
+    _designer_info = None
+    _loaded = False
+
+    @property
+    def widget_class(self):
+        """The widget class, imported on first access"""
+        self._load()
+        return self._info['cls']
+
+    @classmethod
+    def info(cls):
+        """Information about the wrapped widget, importing it if necessary"""
+        cls._load()
+        return cls._info.copy()
+
+    @classmethod
+    def _load(cls):
+        if cls._loaded:
+            return
+
+        logger.debug('Loading deferred widget entry: %s', cls._entry.name)
+        widget_cls = cls._entry.load()
+        cls._info = cls._info.replace(
+            make_designer_info(widget_cls, designer_info=cls._designer_info)
         )
+        # Regenerate with the property types of the widget class
+        cls._dom_xml = None
+        cls._loaded = True
 
-        try:
-            if designer_info is None:
-                designer_info = widget_cls.get_designer_info()
-        except Exception as ex:
-            raise ValueError(
-                f'No designer info for widget for wrapping '
-                f'{widget_cls.__name__}'
-            ) from ex
+    def createWidget(self, parent):
+        """
+        Import the widget class, if necessary, and instantiate it with the
+        given parent.
 
-        try:
-            info.update(**designer_info)
-        except Exception:
-            raise ValueError(
-                f'Invalid designer info for widget for wrapping '
-                f'{widget_cls.__name__}: {designer_info}'
-            ) from None
+        :param parent: Parent widget of instantiated widget
+        :type parent:  QWidget
+        """
+        self._load()
+        return super().createWidget(parent)
 
-        return type(f'{cls.__name__}_WrappedDesignerPlugin',
-                    (DesignerPluginWrapper, ),
-                    dict(_info=info)
+    def name(self):
+        """
+        Return the class name of the widget, from the entry point.
+        """
+        return self._info['name']
+
+    def includeFile(self):
+        """
+        Include the entry point module for the generated qt code
+        """
+        return self._info['include_file']
+
+    def whatsThis(self):
+        """
+        A longer description of the widget for Qt Designer, from the
+        manifest.  The class docstring is only used once the widget has
+        been imported, as Designer asks for this when registering plugins.
+        """
+        if 'whatsthis' in self._info or self._loaded:
+            return super().whatsThis()
+        return ''
+
+    @classmethod
+    def from_entry(cls, entry, designer_info=None):
+        """
+        Create a lazy plugin class from an entry point, without loading it.
+
+        Parameters
+        ----------
+        entry : entrypoints.EntryPoint
+            The widget entry point.
+        designer_info : dict, optional
+            Static designer information, from a manifest.  This is used in
+            place of ``get_designer_info()`` once the widget is imported.
+        """
+        info = dict(DEFAULT_DESIGNER_INFO)
+        info.update(
+            name=(entry.object_name or entry.module_name).split('.')[-1],
+            include_file=entry.module_name,
+        )
+        info.update(designer_info or {})
+        return type(f'{cls.__name__}_{info["name"]}_LazyDesignerPlugin',
+                    (LazyDesignerPluginWrapper, ),
+                    dict(_info=DesignerInfo(info), _entry=entry,
+                         _designer_info=designer_info)
+                    )
+
+
+class DesignerPluginCollection(
+        QtDesigner.QPyDesignerCustomWidgetCollectionPlugin):
+    """
+    A single designer plugin exposing a collection of wrapped widgets.
+
+    Exporting one collection from the designer plugin module, in place of
+    one plugin class per widget, means Designer's plugin loader creates a
+    single object.  The per-widget plugin objects are created when Designer
+    first asks for the collection's widgets.
+    """
+
+    _plugins = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._widgets = None
+
+    @classmethod
+    def plugin_classes(cls):
+        """The plugin classes in the collection, keyed by entry name"""
+        return dict(cls._plugins or {})
+
+    def customWidgets(self):
+        """
+        The plugin objects of the collection, created on the first call.
+        """
+        if self._widgets is None:
+            self._widgets = []
+            for name, plugin_cls in (self._plugins or {}).items():
+                try:
+                    self._widgets.append(plugin_cls())
+                except Exception:
+                    logger.exception('Failed to create designer plugin: %s',
+                                     name)
+        return list(self._widgets)
+
+    @classmethod
+    def from_plugins(cls, plugins):
+        """
+        Create a collection plugin class.
+
+        Parameters
+        ----------
+        plugins : dict
+            Entry name to plugin class, as returned by
+            :func:`enumerate_widgets`.
+        """
+        return type(f'{cls.__name__}_Collection',
+                    (cls, ),
+                    dict(_plugins=dict(plugins))
                     )
 
 
+def make_designer_info(widget_cls, designer_info=None):
+    """
+    Create the designer information dictionary for a widget class.
+
+    Parameters
+    ----------
+    widget_cls : type
+        The widget class.
+    designer_info : dict, optional
+        The designer information.  Defaults to the result of
+        ``widget_cls.get_designer_info()``.
+
+    Returns
+    -------
+    info : info.DesignerInfo
+        The read-only designer information, with defaults filled in.
+
+    Raises
+    ------
+    ValueError
+        If the designer information is missing or invalid.
+    """
+    info = dict(DEFAULT_DESIGNER_INFO)
+    info['cls'] = widget_cls
+
+    try:
+        if designer_info is None:
+            designer_info = widget_cls.get_designer_info()
+    except Exception as ex:
+        raise ValueError(
+            f'No designer info for widget for wrapping '
+            f'{widget_cls.__name__}'
+        ) from ex
+
+    try:
+        info.update(**designer_info)
+    except Exception:
+        raise ValueError(
+            f'Invalid designer info for widget for wrapping '
+            f'{widget_cls.__name__}: {designer_info}'
+        ) from None
+
+    return DesignerInfo(info)
+
+
 class ExtensionFactory(QtDesigner.QExtensionFactory):
     # def __init__(self, parent=None):
     #     super().__init__(parent=parent)
@@ -301,77 +686,313 @@ class ExtensionFactory(QtDesigner.QExtensionFactory):
         return None
 
 
-def enumerate_widgets():
+def is_designer_group(group):
+    """Is ``group`` an entry point group used for designer discovery?"""
+    return (group in (ENTRYPOINT_WIDGET_KEY, ENTRYPOINT_MANIFEST_KEY) or
+            group.startswith(f'{ENTRYPOINT_EVENT_KEY}.'))
+
+
+def get_group_filter(profile=None):
+    """
+    Get the entry point group filter for ``profile``.
+
+    Parameters
+    ----------
+    profile : profiles.Profile, optional
+        Only accept the event groups of signals allowed by the profile.
+
+    Returns
+    -------
+    group_filter : callable
+        Called with a group name, returning True for designer groups.
+    """
+    if profile is None:
+        return is_designer_group
+
+    def group_filter(group):
+        if not is_designer_group(group):
+            return False
+        if group.startswith(f'{ENTRYPOINT_EVENT_KEY}.'):
+            return profile.allows_signal(group.split('.', 1)[1])
+        return True
+
+    return group_filter
+
+
+def _get_profile(profile):
+    if profile is None:
+        return profiles.get_profile()
+    if isinstance(profile, str):
+        return profiles.get_profile(profile)
+    return profile
+
+
+def scan_entry_points(path=None, backend=None, profile=None):
+    """
+    Scan the distributions on ``path`` for all designer entry points.
+
+    Each distribution's entry point metadata is read once, and every
+    ``qt_designer_widgets``, ``qt_designer_manifest`` and
+    ``qt_designer_event.*`` group is bucketed in that single pass.
+
+    Parameters
+    ----------
+    path : list of str, optional
+        Defaults to ``sys.path``.
+    backend : str or backends.DiscoveryBackend, optional
+        The discovery backend.  See :func:`backends.get_backend`.
+    profile : str or profiles.Profile, optional
+        Only scan the distributions, entries and event signals of this
+        profile.  Defaults to the ``PYQT_DESIGNER_PLUGIN_PROFILE``
+        environment variable.
+
+    Returns
+    -------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    """
+    backend = backends.get_backend(backend)
+    profile = _get_profile(profile)
+    if profile is None:
+        return backend.scan(is_designer_group, path=path)
+
+    table = backend.scan(get_group_filter(profile), path=path,
+                         distribution_filter=profile.allows_distribution)
+    return profile.filter_table(table)
+
+
+def get_entry_point_table(path=None, use_cache=None, backend=None,
+                          profile=None):
+    """
+    Get the designer entry point table, using the on-disk cache if possible.
+
+    Parameters
+    ----------
+    path : list of str, optional
+        Defaults to ``sys.path``.
+    use_cache : bool, optional
+        Defaults to the setting from the environment.  See
+        :func:`cache.cache_enabled`.
+    backend : str or backends.DiscoveryBackend, optional
+        The discovery backend.  See :func:`backends.get_backend`.
+    profile : str or profiles.Profile, optional
+        The plugin profile.  See :func:`scan_entry_points`.
+
+    Returns
+    -------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    """
+    backend = backends.get_backend(backend)
+    profile = _get_profile(profile)
+    if use_cache is None:
+        use_cache = cache.cache_enabled()
+
+    if not use_cache or not backend.cacheable:
+        return scan_entry_points(path=path, backend=backend, profile=profile)
+
+    extra = [backend.name]
+    if profile is not None:
+        extra.append(profile.key)
+    fingerprint = cache.compute_fingerprint(path=path, extra=extra)
+    table = cache.load_table(fingerprint)
+    if table is not None:
+        logger.debug('Using cached entry point table')
+        return table
+
+    table = scan_entry_points(path=path, backend=backend, profile=profile)
+    cache.save_table(fingerprint, table)
+    return table
+
+
+def enumerate_widgets(table=None, lazy=None, parallel=None, report=None,
+                      quarantine=None, budget=None):
+    """
+    Enumerate and wrap all widgets from the ``qt_designer_widgets`` group.
+
+    Widgets described by a ``qt_designer_manifest`` use that static
+    information rather than calling ``get_designer_info()``.
+
+    Parameters
+    ----------
+    table : dict, optional
+        The entry point table.  Defaults to :func:`get_entry_point_table`.
+    lazy : bool, optional
+        Defer importing each widget until Designer first uses it.  Defaults
+        to the ``PYQT_DESIGNER_PLUGIN_LAZY`` environment variable.
+    parallel : int, optional
+        The number of threads used to load widget entry points.  See
+        :func:`loader.load_entries`.
+    report : report.LoadReport, optional
+        Record the time and memory used to load and wrap each widget.
+    quarantine : quarantine.Quarantine, optional
+        Skip entries that previously failed, and record new failures.
+        Defaults to the quarantine, if enabled by the
+        ``PYQT_DESIGNER_PLUGIN_QUARANTINE`` environment variable.
+    budget : float, optional
+        Startup time budget, in seconds.  Once exhausted, the remaining
+        widgets described by a manifest are registered as lazy plugins and
+        imported later from the Qt event loop; others are still loaded
+        immediately.  Defaults to the ``PYQT_DESIGNER_PLUGIN_BUDGET``
+        environment variable.
+
+    Returns
+    -------
+    widgets : dict
+        Entry point name to designer plugin class.
+    """
+    if table is None:
+        table = get_entry_point_table()
+    if lazy is None:
+        lazy = env_flag(LAZY_ENV_VAR)
+    if quarantine is None:
+        quarantine = get_quarantine()
+    if budget is None:
+        budget = deferred.get_startup_budget()
+
+    deadline = time.monotonic() + budget if budget else None
+    manifests = manifest.load_manifests(
+        table.get(ENTRYPOINT_MANIFEST_KEY, []))
     widgets = {}
+    to_load = []
 
-    for entry in entrypoints.get_group_all(ENTRYPOINT_WIDGET_KEY):
+    for entry in table.get(ENTRYPOINT_WIDGET_KEY, []):
         logger.info('Found widget: %s', entry.name)
-        try:
-            widget_cls = entry.load()
-        except Exception:
-            logger.exception("Failed to load %s entry: %s",
-                             ENTRYPOINT_WIDGET_KEY, entry.name)
-            continue
-
+        if lazy:
+            designer_info = manifest.get_designer_info(manifests, entry)
+            widgets[entry.name] = LazyDesignerPluginWrapper.from_entry(
+                entry, designer_info=designer_info)
+        else:
+            to_load.append((ENTRYPOINT_WIDGET_KEY, entry))
+
+    if deadline is not None:
+        # Only widgets with manifest information can be deferred, as
+        # Designer reads their group and container status at startup.  Load
+        # the others first, while the budget lasts.
+        to_load.sort(key=lambda item: manifest.get_designer_info(
+            manifests, item[1]) is not None)
+
+    def add_widget(entry, widget_cls):
+        designer_info = manifest.get_designer_info(manifests, entry)
         if not isinstance(widget_cls,
                           QtDesigner.QPyDesignerCustomWidgetPlugin):
             try:
-                widget_cls = DesignerPluginWrapper.from_class(widget_cls)
+                with measure(report, 'wrap', ENTRYPOINT_WIDGET_KEY,
+                             entry.name):
+                    widget_cls = DesignerPluginWrapper.from_class(
+                        widget_cls, designer_info=designer_info)
             except Exception as ex:
                 logger.warning('Failed to add class %s: %s',
                                widget_cls, ex, exc_info=ex)
-                continue
+                if quarantine is not None:
+                    quarantine.add(ENTRYPOINT_WIDGET_KEY, entry, ex)
+                return
 
         widgets[entry.name] = widget_cls
 
+    deferred_items = []
+    for _, entry, widget_cls in loader.load_entries(
+            to_load, parallel=parallel, report=report, quarantine=quarantine,
+            deadline=deadline, deferred=deferred_items):
+        add_widget(entry, widget_cls)
+
+    unlisted = [(key, entry) for key, entry in deferred_items
+                if manifest.get_designer_info(manifests, entry) is None]
+    if unlisted:
+        logger.warning(
+            'Startup budget exceeded, but loading widgets without manifest '
+            'information now, so that the widget box describes them: %s',
+            ', '.join(entry.name for _, entry in unlisted))
+        for _, entry, widget_cls in loader.load_entries(
+                unlisted, parallel=parallel, report=report,
+                quarantine=quarantine):
+            add_widget(entry, widget_cls)
+        deferred_items = [item for item in deferred_items
+                          if item not in unlisted]
+
+    if deferred_items:
+        plugins = []
+        for _, entry in deferred_items:
+            designer_info = manifest.get_designer_info(manifests, entry)
+            plugin = LazyDesignerPluginWrapper.from_entry(
+                entry, designer_info=designer_info)
+            widgets[entry.name] = plugin
+            plugins.append(plugin)
+
+        designer_hooks = get_designer_hooks()
+        designer_hooks.deferred_loader = deferred.DeferredLoader(
+            plugins, parent=designer_hooks)
+        designer_hooks.deferred_loader.start()
+
     return widgets
 
 
-def enumerate_events_by_key(key):
-    for entry in entrypoints.get_group_all(key):
-        try:
-            target = entry.load()
-        except Exception:
-            logger.exception("Failed to load %s entry: %s",
-                             key, entry.name)
-            continue
+def enumerate_events_by_key(key, table=None, parallel=None, report=None,
+                            quarantine=None):
+    if table is None:
+        table = get_entry_point_table()
+    if quarantine is None:
+        quarantine = get_quarantine()
 
+    items = [(key, entry) for entry in table.get(key, [])]
+    for _, entry, target in loader.load_entries(items, parallel=parallel,
+                                                report=report,
+                                                quarantine=quarantine):
         yield entry, target
 
 
-def enumerate_events_by_signal_name(signal_name):
-    yield from enumerate_events_by_key(f'{ENTRYPOINT_EVENT_KEY}.{signal_name}')
+def enumerate_events_by_signal_name(signal_name, table=None, parallel=None,
+                                    report=None, quarantine=None):
+    yield from enumerate_events_by_key(f'{ENTRYPOINT_EVENT_KEY}.{signal_name}',
+                                       table=table, parallel=parallel,
+                                       report=report, quarantine=quarantine)
 
 
-def enumerate_all_events():
-    designer_hooks = get_designer_hooks()
-    for signal_name in designer_hooks.hookable_signals:
-        for event in enumerate_events_by_signal_name(signal_name):
-            yield signal_name, event
-
+def enumerate_all_events(table=None, parallel=None, report=None,
+                         quarantine=None):
+    if table is None:
+        table = get_entry_point_table()
+    if quarantine is None:
+        quarantine = get_quarantine()
 
-def connect_events():
+    designer_hooks = get_designer_hooks()
+    signal_names = {f'{ENTRYPOINT_EVENT_KEY}.{signal_name}': signal_name
+                    for signal_name in designer_hooks.hookable_signals}
+    items = [(key, entry)
+             for key in signal_names
+             for entry in table.get(key, [])]
+    for key, entry, target in loader.load_entries(items, parallel=parallel,
+                                                  report=report,
+                                                  quarantine=quarantine):
+        yield signal_names[key], (entry, target)
+
+
+def connect_events(table=None, parallel=None, report=None, quarantine=None):
     designer_hooks = get_designer_hooks()
     results = {'discovered': {},
                'connected': {},
+               'handlers': {},
                }
 
-    designer_hooks = get_designer_hooks()
-    for signal_name, (entry, target) in enumerate_all_events():
+    for signal_name, (entry, target) in enumerate_all_events(
+            table=table, parallel=parallel, report=report,
+            quarantine=quarantine):
         if signal_name not in results['discovered']:
             results['discovered'][signal_name] = 0
             results['connected'][signal_name] = 0
+            results['handlers'][signal_name] = []
 
         results['discovered'][signal_name] += 1
-        signal = getattr(designer_hooks, signal_name)
         try:
-            signal.connect(target)
+            dispatcher = designer_hooks.get_hook_dispatcher(signal_name)
+            handler = dispatcher.add(target, name=entry.name)
         except Exception:
             logger.exception("Failed to load %s entry: %s",
                              signal_name, entry.name)
             continue
 
         results['connected'][signal_name] += 1
+        results['handlers'][signal_name].append(handler)
         try:
             if not hasattr(target, '_entrypoint_signal_connected'):
                 target._entrypoint_signal_connected = {}
@@ -0,0 +1,90 @@
+"""
+Loading of deferred widget plugins from the Qt event loop.
+
+When the startup budget of :func:`core.enumerate_widgets` is exhausted, the
+remaining widgets are registered as lazy plugins.  A :class:`DeferredLoader`
+then imports them one at a time from the event loop, so that each slice of
+work runs between user interactions.
+"""
+import logging
+import time
+
+from PyQt5 import QtCore
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_BUDGET'
+
+
+def get_startup_budget():
+    """
+    The startup budget requested by the environment, in seconds.
+
+    Returns
+    -------
+    budget : float or None
+        None if there is no budget.
+    """
+    budget = env_number(BUDGET_ENV_VAR, None)
+    return budget if budget is not None and budget > 0 else None
+
+
+class DeferredLoader(QtCore.QObject):
+    """
+    Import deferred lazy plugins from the event loop, one per slice.
+
+    Plugins used by Designer before their turn are imported on demand, and
+    skipped here.
+
+    Parameters
+    ----------
+    plugins : list of core.LazyDesignerPluginWrapper subclasses
+        The plugin classes to load.
+    interval_ms : int, optional
+        Time between slices.
+    parent : QtCore.QObject, optional
+        The parent object.
+    """
+
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, plugins, interval_ms=10, parent=None):
+        super().__init__(parent=parent)
+        self.pending = list(plugins)
+        self.failed = []
+        self.elapsed = 0.0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.load_next)
+
+    def start(self):
+        """Start loading from the event loop."""
+        if self.pending:
+            logger.info('Deferring the load of %d widget(s)',
+                        len(self.pending))
+            self._timer.start()
+
+    def load_next(self):
+        """Load the next pending plugin."""
+        while self.pending:
+            plugin = self.pending.pop(0)
+            if plugin._loaded:
+                continue
+
+            t0 = time.perf_counter()
+            try:
+                plugin._load()
+            except Exception as ex:
+                logger.error('Failed to load deferred widget entry: %s',
+                             plugin._entry.name, exc_info=ex)
+                self.failed.append(plugin)
+            self.elapsed += time.perf_counter() - t0
+            break
+
+        if not self.pending:
+            self._timer.stop()
+            logger.info('Deferred widgets loaded in %.2f s', self.elapsed)
+            self.finished.emit()
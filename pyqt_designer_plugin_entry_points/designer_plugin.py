@@ -1,6 +1,13 @@
 import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import preflight, watcher
 
 print("* pyqt_designer_plugin_entry_points hook *")
 
-globals().update(**pyqt_designer_plugin_entry_points.enumerate_widgets())
-print(pyqt_designer_plugin_entry_points.connect_events())
+_core = pyqt_designer_plugin_entry_points.core
+_table = preflight.apply_preflight(_core.get_entry_point_table())
+# Only the collection is exported: Designer's plugin loader creates every
+# plugin class found in this namespace.
+DesignerPluginCollection = _core.DesignerPluginCollection.from_plugins(
+    pyqt_designer_plugin_entry_points.enumerate_widgets(table=_table))
+print(pyqt_designer_plugin_entry_points.connect_events(table=_table))
+_watcher = watcher.start_watcher(table=_table)
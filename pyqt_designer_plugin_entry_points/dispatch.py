@@ -0,0 +1,432 @@
+"""
+Dispatch policies for event hooks.
+
+By default, a hook connected by :func:`core.connect_events` is called on
+every emission of its signal.  Hooks on high-rate signals, such as
+``propertyChanged`` or ``selectionChanged`` during a drag, may declare a
+different policy with a decorator::
+
+    from pyqt_designer_plugin_entry_points import dispatch
+
+    @dispatch.debounce(200)
+    def property_changed(name, value):
+        '''Called once edits pause for 200 ms, with the last edit.'''
+
+    @dispatch.batch
+    def selection_changed(events):
+        '''Called once per event loop pass, with a list of argument tuples.'''
+
+Policies:
+
+* ``immediate`` - called for every emission (the default)
+* ``debounce(ms)`` - called once, with the arguments of the last emission,
+  after no further emissions for ``ms`` milliseconds
+* ``batch`` - called once per event loop pass with the list of emissions
+  accumulated since, each a tuple of the signal arguments
+
+All hooks of a signal are called by a single :class:`SignalDispatcher`,
+which times each call and logs, rather than propagates, its exceptions, so
+one failing hook does not affect the others.  A hook is disabled once it
+fails ``PYQT_DESIGNER_PLUGIN_HOOK_MAX_ERRORS`` times in a row (defaults to
+5), or takes longer than ``PYQT_DESIGNER_PLUGIN_HOOK_SLOW_MS`` (defaults to
+50) ``PYQT_DESIGNER_PLUGIN_HOOK_MAX_SLOW`` times in a row (defaults to 5).
+Setting a limit to 0 turns it off.
+"""
+import inspect
+import logging
+import time
+
+from PyQt5 import QtCore
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+IMMEDIATE = 'immediate'
+DEBOUNCE = 'debounce'
+BATCH = 'batch'
+
+_POLICY_ATTR = '_designer_dispatch_policy'
+
+SLOW_MS_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_HOOK_SLOW_MS'
+MAX_SLOW_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_HOOK_MAX_SLOW'
+MAX_ERRORS_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_HOOK_MAX_ERRORS'
+
+DEFAULT_SLOW_MS = 50
+DEFAULT_MAX_SLOW = 5
+DEFAULT_MAX_ERRORS = 5
+
+
+class DispatchPolicy:
+    """
+    How a hook is called when its signal is emitted.
+
+    Parameters
+    ----------
+    kind : str
+        ``'immediate'``, ``'debounce'`` or ``'batch'``.
+    delay_ms : int, optional
+        The quiet period of a debounced hook.
+    """
+
+    __slots__ = ('kind', 'delay_ms')
+
+    def __init__(self, kind=IMMEDIATE, delay_ms=0):
+        if kind not in (IMMEDIATE, DEBOUNCE, BATCH):
+            raise ValueError(f'Unknown dispatch policy: {kind!r}')
+        self.kind = kind
+        self.delay_ms = int(delay_ms)
+
+    def __repr__(self):
+        if self.kind == DEBOUNCE:
+            return f'<DispatchPolicy {self.kind} {self.delay_ms} ms>'
+        return f'<DispatchPolicy {self.kind}>'
+
+
+def _set_policy(func, policy):
+    setattr(func, _POLICY_ATTR, policy)
+    return func
+
+
+def immediate(func):
+    """Call the hook on every emission."""
+    return _set_policy(func, DispatchPolicy(IMMEDIATE))
+
+
+def debounce(delay_ms):
+    """Call the hook with the last emission, once emissions pause."""
+    def wrapper(func):
+        return _set_policy(func, DispatchPolicy(DEBOUNCE, delay_ms))
+    return wrapper
+
+
+def batch(func):
+    """Call the hook once per event loop pass, with the list of emissions."""
+    return _set_policy(func, DispatchPolicy(BATCH))
+
+
+def get_policy(target):
+    """The dispatch policy declared by ``target``, defaulting to immediate."""
+    return getattr(target, _POLICY_ATTR, None) or DispatchPolicy(IMMEDIATE)
+
+
+class _Dispatcher(QtCore.QObject):
+    """Collects emissions for a hook, calling it from a timer."""
+
+    def __init__(self, target, delay_ms=0, parent=None):
+        super().__init__(parent=parent)
+        self.target = target
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} target={self.target!r}>'
+
+
+class DebounceDispatcher(_Dispatcher):
+    """Call the hook with the last arguments, after a quiet period."""
+
+    def __init__(self, target, delay_ms, parent=None):
+        super().__init__(target, delay_ms=delay_ms, parent=parent)
+        self._args = None
+
+    def __call__(self, *args):
+        self._args = args
+        # Each emission restarts the quiet period
+        self._timer.start()
+
+    def flush(self):
+        """Call the hook now, if an emission is pending."""
+        self._timer.stop()
+        args, self._args = self._args, None
+        if args is not None:
+            self.target(*args)
+
+
+class BatchDispatcher(_Dispatcher):
+    """Call the hook once per event loop pass, with all emissions."""
+
+    def __init__(self, target, parent=None):
+        super().__init__(target, delay_ms=0, parent=parent)
+        self._events = []
+
+    def __call__(self, *args):
+        self._events.append(args)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Call the hook now, if emissions are pending."""
+        self._timer.stop()
+        events, self._events = self._events, []
+        if events:
+            self.target(events)
+
+
+def make_dispatcher(target, policy=None, parent=None):
+    """
+    Wrap ``target`` according to its dispatch policy.
+
+    Parameters
+    ----------
+    target : callable
+        The hook.
+    policy : DispatchPolicy, optional
+        Defaults to the policy declared by ``target``.
+    parent : QtCore.QObject, optional
+        The parent of the dispatcher, which must outlive the connection.
+
+    Returns
+    -------
+    slot : callable
+        ``target`` itself for immediate dispatch, or a dispatcher.
+    """
+    if policy is None:
+        policy = get_policy(target)
+    if policy.kind == DEBOUNCE:
+        return DebounceDispatcher(target, policy.delay_ms, parent=parent)
+    if policy.kind == BATCH:
+        return BatchDispatcher(target, parent=parent)
+    return target
+
+
+def get_max_args(target):
+    """
+    The number of positional arguments ``target`` accepts.
+
+    Returns
+    -------
+    max_args : int or None
+        None if the target accepts any number, or its signature is unknown.
+    """
+    try:
+        signature = inspect.signature(target)
+    except (TypeError, ValueError):
+        return None
+
+    count = 0
+    for param in signature.parameters.values():
+        if param.kind == param.VAR_POSITIONAL:
+            return None
+        if param.kind in (param.POSITIONAL_ONLY,
+                          param.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+
+class HookBudget:
+    """
+    The limits past which a hook is disabled.
+
+    Parameters
+    ----------
+    slow_ms : int, optional
+        A call taking longer than this, in milliseconds, is slow.
+    max_slow : int, optional
+        Disable a hook after this many slow calls in a row.  0 for no limit.
+    max_errors : int, optional
+        Disable a hook after this many failed calls in a row.  0 for no
+        limit.
+    """
+
+    __slots__ = ('slow_ms', 'max_slow', 'max_errors')
+
+    def __init__(self, slow_ms=DEFAULT_SLOW_MS, max_slow=DEFAULT_MAX_SLOW,
+                 max_errors=DEFAULT_MAX_ERRORS):
+        self.slow_ms = slow_ms
+        self.max_slow = max_slow
+        self.max_errors = max_errors
+
+
+def get_hook_budget():
+    """The hook budget configured by the environment."""
+    return HookBudget(
+        slow_ms=env_number(SLOW_MS_ENV_VAR, DEFAULT_SLOW_MS, type_=int,
+                           minimum=0),
+        max_slow=env_number(MAX_SLOW_ENV_VAR, DEFAULT_MAX_SLOW, type_=int,
+                            minimum=0),
+        max_errors=env_number(MAX_ERRORS_ENV_VAR, DEFAULT_MAX_ERRORS,
+                              type_=int, minimum=0),
+    )
+
+
+class HookHandler:
+    """
+    A hook connected to a designer signal, with its call statistics.
+
+    Calling the handler calls the hook, timing it and logging its
+    exceptions.  The statistics are live; they are updated by every call.
+
+    Parameters
+    ----------
+    signal_name : str
+        The name of the designer hooks signal.
+    name : str
+        The entry point name.
+    target : callable
+        The hook.
+    budget : HookBudget
+        The limits past which the hook is disabled.
+    max_args : int, optional
+        The number of positional arguments the hook accepts.  Further signal
+        arguments are dropped, as PyQt does for directly connected slots.
+        None passes every argument.
+    """
+
+    def __init__(self, signal_name, name, target, budget, max_args=None):
+        self.signal_name = signal_name
+        self.max_args = max_args
+        self.name = name
+        self.target = target
+        self.budget = budget
+        self.calls = 0
+        self.errors = 0
+        self.slow_calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.disabled = False
+        self.disabled_reason = None
+        self._error_streak = 0
+        self._slow_streak = 0
+
+    @property
+    def mean_time(self):
+        """The mean call duration, in seconds"""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def __call__(self, *args):
+        if self.disabled:
+            return
+
+        if self.max_args is not None:
+            args = args[:self.max_args]
+
+        t0 = time.perf_counter()
+        try:
+            self.target(*args)
+        except Exception:
+            failed = True
+            logger.exception('Designer %s hook %s failed', self.signal_name,
+                             self.name)
+        else:
+            failed = False
+        self._record(time.perf_counter() - t0, failed)
+
+    def _record(self, elapsed, failed):
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+        budget = self.budget
+        if failed:
+            self.errors += 1
+            self._error_streak += 1
+        else:
+            self._error_streak = 0
+
+        if elapsed * 1e3 > budget.slow_ms:
+            self.slow_calls += 1
+            self._slow_streak += 1
+        else:
+            self._slow_streak = 0
+
+        if budget.max_errors and self._error_streak >= budget.max_errors:
+            self.disable(f'{self._error_streak} failures in a row')
+        elif budget.max_slow and self._slow_streak >= budget.max_slow:
+            self.disable(f'{self._slow_streak} calls in a row over '
+                         f'{budget.slow_ms} ms')
+
+    def disable(self, reason='disabled'):
+        """Stop calling the hook."""
+        if self.disabled:
+            return
+        self.disabled = True
+        self.disabled_reason = reason
+        logger.warning('Disabled designer %s hook %s: %s', self.signal_name,
+                       self.name, reason)
+
+    def enable(self):
+        """Call the hook again, with a clean record."""
+        self.disabled = False
+        self.disabled_reason = None
+        self._error_streak = 0
+        self._slow_streak = 0
+
+    def to_dict(self):
+        """The statistics as a dictionary."""
+        return dict(name=self.name, calls=self.calls, errors=self.errors,
+                    slow_calls=self.slow_calls, total_time=self.total_time,
+                    max_time=self.max_time, disabled=self.disabled,
+                    disabled_reason=self.disabled_reason)
+
+    def __repr__(self):
+        return (f'<HookHandler {self.signal_name}:{self.name} '
+                f'calls={self.calls} errors={self.errors} '
+                f'max_time={self.max_time:.4f} disabled={self.disabled}>')
+
+
+class SignalDispatcher(QtCore.QObject):
+    """
+    Call every hook of one designer signal.
+
+    The dispatcher is connected to the signal once; hooks are added to it
+    rather than connected directly, and are called through a
+    :class:`HookHandler` according to their dispatch policy.
+
+    Parameters
+    ----------
+    signal_name : str
+        The name of the signal.
+    budget : HookBudget, optional
+        Defaults to :func:`get_hook_budget`.
+    parent : QtCore.QObject, optional
+        The parent object, which must outlive the connection.
+    """
+
+    def __init__(self, signal_name, budget=None, parent=None):
+        super().__init__(parent=parent)
+        self.signal_name = signal_name
+        self.budget = budget or get_hook_budget()
+        self.handlers = []
+        self._slots = {}
+
+    def add(self, target, name=None):
+        """
+        Add a hook.
+
+        Parameters
+        ----------
+        target : callable
+            The hook.
+        name : str, optional
+            The entry point name.  Defaults to the hook's qualified name.
+
+        Returns
+        -------
+        handler : HookHandler
+        """
+        if name is None:
+            name = getattr(target, '__qualname__', repr(target))
+        handler = HookHandler(self.signal_name, name, target, self.budget,
+                              max_args=get_max_args(target))
+        slot = make_dispatcher(handler, policy=get_policy(target),
+                               parent=self)
+        self.handlers.append(handler)
+        self._slots[handler] = slot
+        return handler
+
+    def remove(self, target):
+        """Remove every handler of ``target``."""
+        for handler in [handler for handler in self.handlers
+                        if handler.target is target]:
+            self.handlers.remove(handler)
+            slot = self._slots.pop(handler)
+            if isinstance(slot, QtCore.QObject):
+                slot.deleteLater()
+
+    def __call__(self, *args):
+        for handler in list(self.handlers):
+            if not handler.disabled:
+                self._slots[handler](*args)
@@ -0,0 +1,156 @@
+"""
+Generation of the ``domXml()`` widget description for designer plugins.
+
+Besides the tooltip, widgets may declare a default ``geometry`` and default
+``properties`` in their designer information::
+
+    dict(group='Motors',
+         geometry=(0, 0, 200, 40),
+         properties=dict(text='Motor', alignment='Qt::AlignLeft'))
+
+``geometry`` is either ``(width, height)`` or ``(x, y, width, height)``.
+Property values are written as the matching Qt Designer element.  When the
+widget class is available, the element type is taken from its
+``QMetaObject`` property (e.g., ``enum`` and ``set`` for enumerations);
+otherwise it follows the Python type of the value.  Properties unknown to
+the widget class are written as dynamic properties.
+"""
+import logging
+from xml.sax.saxutils import escape, quoteattr
+
+logger = logging.getLogger(__name__)
+
+# QMetaProperty type name to Qt Designer property element
+_META_TYPE_ELEMENTS = {
+    'QString': 'string',
+    'bool': 'bool',
+    'int': 'number',
+    'uint': 'number',
+    'qlonglong': 'number',
+    'qulonglong': 'number',
+    'double': 'double',
+    'float': 'double',
+    'QRect': 'rect',
+    'QSize': 'size',
+    'QPoint': 'point',
+}
+
+
+def _python_element(value):
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'number'
+    if isinstance(value, float):
+        return 'double'
+    return 'string'
+
+
+def get_property_elements(widget_cls, names):
+    """
+    Look up the Qt Designer element types of properties of ``widget_cls``.
+
+    Parameters
+    ----------
+    widget_cls : type
+        The widget class, with a ``staticMetaObject``.
+    names : iterable of str
+        The property names.
+
+    Returns
+    -------
+    elements : dict
+        Property name to element type, or None where the type has no known
+        element.  Properties not declared by the class are omitted.
+    """
+    meta = widget_cls.staticMetaObject
+    elements = {}
+    for name in names:
+        index = meta.indexOfProperty(name)
+        if index < 0:
+            continue
+
+        prop = meta.property(index)
+        if prop.isEnumType():
+            elements[name] = 'set' if prop.isFlagType() else 'enum'
+        else:
+            elements[name] = _META_TYPE_ELEMENTS.get(prop.typeName())
+    return elements
+
+
+def _format_value(element, value):
+    if element == 'bool':
+        return f'<bool>{"true" if value else "false"}</bool>'
+    if element == 'rect':
+        x, y, width, height = value
+        return (f'<rect><x>{int(x)}</x><y>{int(y)}</y>'
+                f'<width>{int(width)}</width>'
+                f'<height>{int(height)}</height></rect>')
+    if element == 'size':
+        width, height = value
+        return (f'<size><width>{int(width)}</width>'
+                f'<height>{int(height)}</height></size>')
+    if element == 'point':
+        x, y = value
+        return f'<point><x>{int(x)}</x><y>{int(y)}</y></point>'
+    return f'<{element}>{escape(str(value))}</{element}>'
+
+
+def _format_property(name, element, value, dynamic=False):
+    stdset = ' stdset="0"' if dynamic else ''
+    return (f' <property name={quoteattr(name)}{stdset}>\n'
+            f'  {_format_value(element, value)}\n'
+            f' </property>\n')
+
+
+def make_dom_xml(name, info, widget_cls=None):
+    """
+    Create the ``domXml()`` description of a widget.
+
+    Parameters
+    ----------
+    name : str
+        The widget class name.
+    info : mapping
+        The designer information, with ``tooltip`` and optionally
+        ``geometry`` and ``properties``.
+    widget_cls : type, optional
+        The widget class, used to look up property types.
+
+    Returns
+    -------
+    xml : str
+    """
+    properties = dict(info.get('properties') or {})
+    properties.setdefault('toolTip', info.get('tooltip') or '')
+
+    elements = {}
+    if widget_cls is not None:
+        elements = get_property_elements(widget_cls, properties)
+
+    lines = [f'<widget class={quoteattr(name)} name={quoteattr(name)}>\n']
+    geometry = info.get('geometry')
+    if geometry:
+        try:
+            if len(geometry) == 2:
+                geometry = (0, 0) + tuple(geometry)
+            lines.append(_format_property('geometry', 'rect', geometry))
+        except (TypeError, ValueError):
+            logger.warning('Invalid default geometry of %s: %r', name,
+                           geometry)
+
+    for prop_name, value in properties.items():
+        dynamic = widget_cls is not None and prop_name not in elements
+        if dynamic:
+            logger.debug('%s has no property %r; adding it as a dynamic '
+                         'property', name, prop_name)
+        element = elements.get(prop_name) or _python_element(value)
+        try:
+            lines.append(_format_property(prop_name, element, value,
+                                          dynamic=dynamic))
+        except (TypeError, ValueError):
+            logger.warning('Invalid default for property %r of %s: %r',
+                           prop_name, name, value)
+
+    lines.append('</widget>\n')
+    return ''.join(lines)
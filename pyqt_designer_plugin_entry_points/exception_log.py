@@ -0,0 +1,199 @@
+"""
+Asynchronous, structured log of uncaught exceptions.
+
+When ``PYQT_DESIGNER_PLUGIN_EXCEPTION_LOG`` names a file, uncaught exception
+reports are handed to a background writer thread rather than written to
+stderr from the GUI thread.  The writer appends one JSON record per line to
+the log, rotating it once it would exceed the size in bytes given by
+``PYQT_DESIGNER_PLUGIN_EXCEPTION_LOG_SIZE``, and echoes the human-readable
+report to stderr.
+
+Records are queued in a bounded buffer; when exceptions arrive faster than
+they can be written, the oldest queued records are dropped rather than
+blocking Designer.
+"""
+import atexit
+import collections
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+LOG_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_EXCEPTION_LOG'
+LOG_SIZE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_EXCEPTION_LOG_SIZE'
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_QUEUE_SIZE = 256
+
+
+class ExceptionLogSink:
+    """
+    Write exception records to rotating JSONL files from a worker thread.
+
+    Parameters
+    ----------
+    filename : str
+        The log filename.  Rotated logs are ``filename.1``,
+        ``filename.2``, ...
+    max_bytes : int, optional
+        Rotate the log before it grows beyond this size.
+    backup_count : int, optional
+        The number of rotated logs to keep.
+    queue_size : int, optional
+        The maximum number of queued records.
+    echo : bool, optional
+        Echo the text of each report to stderr.
+    """
+
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES,
+                 backup_count=DEFAULT_BACKUP_COUNT,
+                 queue_size=DEFAULT_QUEUE_SIZE, echo=True):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.echo = echo
+        self.dropped = 0
+        self._queue = collections.deque(maxlen=queue_size)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._busy = False
+        self._thread = threading.Thread(
+            target=self._run, name='designer-exception-log', daemon=True)
+        self._thread.start()
+
+    def put(self, record=None, text=None):
+        """
+        Queue a record and its text without blocking.
+
+        Parameters
+        ----------
+        record : dict or exceptions.ExceptionRecord, optional
+            The record to append to the log.  Exception records are
+            rendered by the writer thread.
+        text : str or callable, optional
+            Text to echo to stderr, or a callable returning it, called by
+            the writer thread.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append((record, text))
+            self._condition.notify()
+
+    def flush(self, timeout=None):
+        """Wait until all queued records are written."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = (None if deadline is None
+                             else deadline - time.monotonic())
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        """Write the remaining records and stop the writer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                items = list(self._queue)
+                self._queue.clear()
+                dropped, self.dropped = self.dropped, 0
+                self._busy = True
+
+            try:
+                self._write(items, dropped)
+            except Exception:
+                logger.exception('Failed to write exception log %s',
+                                 self.filename)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, items, dropped):
+        lines = []
+        if dropped:
+            lines.append(json.dumps(dict(time=time.time(),
+                                         dropped=dropped)))
+        for record, text in items:
+            if text is not None and self.echo:
+                sys.stderr.write(f'{text() if callable(text) else text}\n')
+            if hasattr(record, 'to_dict'):
+                record = record.to_dict()
+            if record is not None:
+                lines.append(json.dumps(record, default=repr))
+
+        if self.echo:
+            sys.stderr.flush()
+        if not lines:
+            return
+
+        data = ''.join(f'{line}\n' for line in lines).encode('utf-8')
+        self._rotate(len(data))
+        with open(self.filename, 'ab') as f:
+            f.write(data)
+
+    def _rotate(self, incoming):
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError:
+            return
+
+        if size + incoming <= self.max_bytes or not size:
+            return
+
+        for idx in range(self.backup_count - 1, 0, -1):
+            source = f'{self.filename}.{idx}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.filename}.{idx + 1}')
+        if self.backup_count > 0:
+            os.replace(self.filename, f'{self.filename}.1')
+        else:
+            os.remove(self.filename)
+
+
+def get_exception_sink():
+    """
+    Create the exception log sink, if enabled by the environment.
+
+    Returns
+    -------
+    sink : ExceptionLogSink or None
+    """
+    filename = os.environ.get(LOG_ENV_VAR, '').strip()
+    if not filename:
+        return None
+
+    max_bytes = env_number(LOG_SIZE_ENV_VAR, DEFAULT_MAX_BYTES, type_=int,
+                           minimum=0)
+
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(filename)),
+                    exist_ok=True)
+    except OSError as ex:
+        logger.warning('Unable to create exception log directory: %s', ex)
+        return None
+
+    sink = ExceptionLogSink(filename, max_bytes=max_bytes)
+    atexit.register(sink.close)
+    return sink
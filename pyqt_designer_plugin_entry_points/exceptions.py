@@ -0,0 +1,279 @@
+"""
+Deduplication and rate limiting of uncaught exception reports.
+
+Exceptions are fingerprinted by type and the frame that raised them.  The
+first few exceptions of each fingerprint are reported in full; repeats only
+increment a counter, and the suppressed counts are summarized periodically.
+Full reports are further limited per fingerprint and globally, so a widget
+raising in ``paintEvent`` cannot flood Designer with tracebacks.
+
+Reports are :class:`ExceptionRecord` instances, which hold summarized frames
+rather than the traceback itself, so that hooks keeping them do not keep
+every frame and its local variables alive.
+"""
+import collections.abc
+import logging
+import time
+import traceback
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+REPORTS_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_EXCEPTION_REPORTS'
+RATE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_EXCEPTION_RATE'
+GLOBAL_RATE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_EXCEPTION_GLOBAL_RATE'
+
+DEFAULT_FULL_REPORTS = 3
+DEFAULT_RATE = 1.0
+DEFAULT_GLOBAL_RATE = 5.0
+
+
+def get_fingerprint(exc_type, value, trace):
+    """
+    Fingerprint an exception by its type and raising frame.
+
+    Returns
+    -------
+    fingerprint : tuple
+        ``(type name, filename, line number, function name)``.  The location
+        is empty if there is no traceback.
+    """
+    type_name = f'{exc_type.__module__}.{exc_type.__qualname__}'
+    if trace is None:
+        return (type_name, '', 0, '')
+
+    while trace.tb_next is not None:
+        trace = trace.tb_next
+    code = trace.tb_frame.f_code
+    return (type_name, code.co_filename, trace.tb_lineno, code.co_name)
+
+
+def format_fingerprint(fingerprint):
+    """A one-line description of an exception fingerprint."""
+    type_name, filename, lineno, function = fingerprint
+    if not filename:
+        return type_name
+    return f'{type_name} at {filename}:{lineno} in {function}'
+
+
+class ExceptionRecord(collections.abc.Mapping):
+    """
+    A compact, frame-free record of an uncaught exception.
+
+    Only the file name, line number and function of each frame are kept.
+    The text traceback is rendered on first access, reading the source
+    lines then.
+
+    The record is also a read-only mapping, like the dictionary previously
+    emitted by ``uncaughtExceptionRaised``, except for the live ``value``
+    and ``trace``; connect to ``uncaughtExceptionRaisedRaw`` for those.
+
+    Parameters
+    ----------
+    exc_type : type
+        The exception type.
+    value : BaseException
+        The exception.
+    trace : traceback
+        The traceback.
+    fingerprint : tuple, optional
+        See :func:`get_fingerprint`.
+    count : int, optional
+        The number of exceptions with the same fingerprint so far.
+    form : str, optional
+        The file name of the active form.
+    """
+
+    _keys = ('exc_type', 'message', 'traceback', 'fingerprint', 'count',
+             'form', 'time')
+    _removed_keys = ('value', 'trace')
+
+    __slots__ = ('exc_type', 'message', 'fingerprint', 'count', 'form',
+                 'time', '_exception', '_traceback')
+
+    def __init__(self, exc_type, value, trace, fingerprint=None, count=1,
+                 form=None):
+        self.exc_type = exc_type
+        self.message = str(value)
+        self.fingerprint = (fingerprint or
+                            get_fingerprint(exc_type, value, trace))
+        self.count = count
+        self.form = form
+        self.time = time.time()
+        self._exception = traceback.TracebackException(
+            exc_type, value, trace, lookup_lines=False)
+        self._traceback = None
+
+    @property
+    def type_name(self):
+        """The qualified name of the exception type"""
+        return self.fingerprint[0]
+
+    @property
+    def frames(self):
+        """The frames, as ``(filename, line number, function)`` tuples"""
+        return [(frame.filename, frame.lineno, frame.name)
+                for frame in self._exception.stack]
+
+    @property
+    def traceback(self):
+        """The rendered text traceback"""
+        if self._traceback is None:
+            self._traceback = ''.join(self._exception.format())
+        return self._traceback
+
+    def to_dict(self):
+        """The record as a JSON-serializable dictionary."""
+        return dict(time=self.time, fingerprint=self.fingerprint,
+                    exc_type=self.type_name, message=self.message,
+                    count=self.count, traceback=self.traceback,
+                    form=self.form)
+
+    def __getitem__(self, key):
+        if key in self._keys:
+            return getattr(self, key)
+        if key in self._removed_keys:
+            raise KeyError(
+                f'{key!r} is no longer included in exception records, which '
+                f'do not keep frames alive; connect to '
+                f'uncaughtExceptionRaisedRaw for the live exception'
+            )
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return (f'<ExceptionRecord {format_fingerprint(self.fingerprint)} '
+                f'count={self.count}>')
+
+
+class RateLimiter:
+    """
+    A token bucket allowing ``rate`` events per second, in bursts of up to
+    ``burst``.
+    """
+
+    __slots__ = ('rate', 'burst', 'tokens', 'last')
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.last = None
+
+    def allow(self, now=None):
+        """Take a token, if one is available."""
+        if now is None:
+            now = time.monotonic()
+        if self.last is not None:
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class _FingerprintState:
+    __slots__ = ('count', 'reported', 'suppressed', 'limiter')
+
+    def __init__(self, rate):
+        self.count = 0
+        self.reported = 0
+        self.suppressed = 0
+        self.limiter = RateLimiter(rate)
+
+
+class ExceptionThrottle:
+    """
+    Decide which uncaught exceptions are reported in full.
+
+    Parameters
+    ----------
+    full_reports : int, optional
+        The number of full reports per fingerprint.
+    rate : float, optional
+        The maximum full reports per second, per fingerprint.
+    global_rate : float, optional
+        The maximum full reports per second, over all fingerprints.
+    """
+
+    def __init__(self, full_reports=DEFAULT_FULL_REPORTS, rate=DEFAULT_RATE,
+                 global_rate=DEFAULT_GLOBAL_RATE):
+        self.full_reports = full_reports
+        self.rate = rate
+        self._global_limiter = RateLimiter(global_rate)
+        self._states = {}
+
+    def should_report(self, fingerprint, now=None):
+        """
+        Count an exception, and decide whether to report it in full.
+
+        Returns
+        -------
+        report : bool
+            False if the exception should only be counted.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        state = self._states.get(fingerprint)
+        if state is None:
+            state = self._states[fingerprint] = _FingerprintState(self.rate)
+        state.count += 1
+
+        if (state.reported < self.full_reports and
+                state.limiter.allow(now) and
+                self._global_limiter.allow(now)):
+            state.reported += 1
+            return True
+
+        state.suppressed += 1
+        return False
+
+    def count(self, fingerprint):
+        """The total number of exceptions seen with ``fingerprint``."""
+        state = self._states.get(fingerprint)
+        return state.count if state is not None else 0
+
+    def take_suppressed(self):
+        """
+        The exceptions suppressed since the last call.
+
+        Returns
+        -------
+        suppressed : dict
+            Fingerprint to ``(suppressed count, total count)``.
+        """
+        suppressed = {}
+        for fingerprint, state in self._states.items():
+            if state.suppressed:
+                suppressed[fingerprint] = (state.suppressed, state.count)
+                state.suppressed = 0
+        return suppressed
+
+    def format_summary(self, suppressed):
+        """Format the result of :meth:`take_suppressed`."""
+        return '\n'.join(
+            f'Suppressed {count} repeat(s) of {format_fingerprint(fp)} '
+            f'({total} total)'
+            for fp, (count, total) in sorted(suppressed.items(),
+                                             key=lambda item: -item[1][0])
+        )
+
+
+def get_exception_throttle():
+    """Create the exception throttle configured by the environment."""
+    return ExceptionThrottle(
+        full_reports=env_number(REPORTS_ENV_VAR, DEFAULT_FULL_REPORTS,
+                                type_=int, minimum=0),
+        rate=env_number(RATE_ENV_VAR, DEFAULT_RATE, minimum=0),
+        global_rate=env_number(GLOBAL_RATE_ENV_VAR, DEFAULT_GLOBAL_RATE,
+                               minimum=0),
+    )
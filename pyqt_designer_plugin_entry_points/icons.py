@@ -0,0 +1,179 @@
+"""
+Process-wide, lazily decoded cache of designer plugin icons.
+
+Plugin icons are given in the designer information as a ``QIcon``, a file
+path, a Qt resource name (``:/...``) or a theme icon name (``theme:name``).
+Icons are only created when Designer first asks a plugin for its icon, and
+plugins sharing a source share one ``QIcon``.
+
+SVG icons are rasterized at each requested size, only once shown, and the
+pixmaps stored in the on-disk cache directory keyed by the file and its
+modification time, so later sessions load PNGs rather than rendering the
+SVGs again.  Icons of widget box groups that stay collapsed are never
+decoded.
+"""
+import hashlib
+import logging
+import os
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from . import cache
+
+logger = logging.getLogger(__name__)
+
+THEME_PREFIX = 'theme:'
+
+_ICONS = {}
+
+
+def get_icon_key(source):
+    """
+    The cache key of an icon source.
+
+    Returns
+    -------
+    key : tuple or None
+        None if there is no icon.
+    """
+    if not source:
+        return None
+    if source.startswith(THEME_PREFIX):
+        return ('theme', source[len(THEME_PREFIX):])
+    if source.startswith(':') or source.startswith('qrc:'):
+        return ('resource', source)
+    return ('file', os.path.normcase(os.path.realpath(source)))
+
+
+def _get_raster_filename(path, size):
+    st = os.stat(path)
+    digest = hashlib.sha1(
+        f'{path}:{st.st_size}:{st.st_mtime_ns}'.encode('utf-8')
+    ).hexdigest()
+    return os.path.join(cache.get_cache_dir(), 'icons',
+                        f'{digest}-{size}.png')
+
+
+def _render_svg(path, filename, size):
+    from PyQt5 import QtSvg
+
+    renderer = QtSvg.QSvgRenderer(path)
+    if not renderer.isValid():
+        raise ValueError(f'Invalid SVG icon: {path}')
+
+    image = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    try:
+        renderer.render(painter)
+    finally:
+        painter.end()
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmp_filename = f'{filename}.{os.getpid()}.tmp.png'
+    if not image.save(tmp_filename, 'PNG'):
+        raise OSError(f'Unable to write {tmp_filename}')
+    os.replace(tmp_filename, filename)
+
+
+class SvgRasterIconEngine(QtGui.QIconEngine):
+    """
+    Icon engine rasterizing an SVG file on demand, through the on-disk
+    pixmap cache.
+
+    Nothing is read until a pixmap of the icon is first requested.
+
+    Parameters
+    ----------
+    path : str
+        The SVG filename.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._pixmaps = {}
+
+    def _load_pixmap(self, size):
+        filename = _get_raster_filename(self.path, size)
+        if not os.path.exists(filename):
+            _render_svg(self.path, filename, size)
+        return QtGui.QPixmap(filename)
+
+    def pixmap(self, size, mode, state):
+        side = max(1, min(size.width(), size.height()))
+        pixmap = self._pixmaps.get(side)
+        if pixmap is None:
+            try:
+                pixmap = self._load_pixmap(side)
+            except Exception as ex:
+                logger.debug('Unable to rasterize SVG icon %s: %s',
+                             self.path, ex)
+                pixmap = QtGui.QPixmap()
+            self._pixmaps[side] = pixmap
+
+        if mode != QtGui.QIcon.Normal and not pixmap.isNull():
+            app = QtWidgets.QApplication.instance()
+            if isinstance(app, QtWidgets.QApplication):
+                return app.style().generatedIconPixmap(
+                    mode, pixmap, QtWidgets.QStyleOption())
+        return pixmap
+
+    def paint(self, painter, rect, mode, state):
+        painter.drawPixmap(rect, self.pixmap(rect.size(), mode, state))
+
+    def actualSize(self, size, mode, state):
+        side = min(size.width(), size.height())
+        return QtCore.QSize(side, side)
+
+    def clone(self):
+        return SvgRasterIconEngine(self.path)
+
+    def key(self):
+        return 'pyqt_designer_plugin_svg_raster'
+
+
+def _create_icon(key):
+    kind, name = key
+    if kind == 'theme':
+        return QtGui.QIcon.fromTheme(name)
+
+    if (kind == 'file' and name.lower().endswith('.svg') and
+            cache.cache_enabled()):
+        return QtGui.QIcon(SvgRasterIconEngine(name))
+
+    return QtGui.QIcon(name)
+
+
+def get_icon(source):
+    """
+    Get the shared icon for ``source``.
+
+    Parameters
+    ----------
+    source : QtGui.QIcon, str or None
+        A ``QIcon`` is returned as-is.  Strings are file paths, Qt resource
+        names (``:/...``) or theme icon names (``theme:name``).
+
+    Returns
+    -------
+    icon : QtGui.QIcon
+        An empty icon if there is no source.
+    """
+    if isinstance(source, QtGui.QIcon):
+        return source
+
+    key = get_icon_key(source)
+    if key is None:
+        key = ('empty', '')
+
+    icon = _ICONS.get(key)
+    if icon is None:
+        icon = QtGui.QIcon() if key[0] == 'empty' else _create_icon(key)
+        _ICONS[key] = icon
+    return icon
+
+
+def clear():
+    """Release the in-memory icon cache."""
+    _ICONS.clear()
@@ -0,0 +1,63 @@
+"""
+The immutable designer information record shared by plugins and widgets.
+"""
+import collections.abc
+
+
+class DesignerInfo(collections.abc.Mapping):
+    """
+    Read-only designer information for a wrapped widget.
+
+    A single record is built when a plugin is wrapped, and is shared by
+    ``info()`` and every ``init_for_designer()`` call, rather than copied for
+    each widget instance.  It supports the read-only dictionary interface;
+    use :meth:`copy` for a mutable dictionary, or :meth:`replace` for an
+    updated record.
+
+    Parameters
+    ----------
+    *args, **kwargs :
+        As for ``dict``.
+    """
+
+    __slots__ = ('_data', )
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, '_data', dict(*args, **kwargs))
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __reduce__(self):
+        return (type(self), (self._data, ))
+
+    def copy(self):
+        """A mutable dictionary copy of the information."""
+        return dict(self._data)
+
+    def replace(self, *args, **kwargs):
+        """A new record, with the given items updated."""
+        data = dict(self._data)
+        data.update(*args, **kwargs)
+        return type(self)(data)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._data!r})'
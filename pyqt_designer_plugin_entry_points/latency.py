@@ -0,0 +1,174 @@
+"""
+``createWidget()`` latency instrumentation, per wrapped widget class.
+
+When enabled with the ``PYQT_DESIGNER_PLUGIN_INSTRUMENT`` environment
+variable, each ``createWidget()`` call times the widget constructor and
+``init_for_designer()`` separately.  The times are kept in fixed-size,
+logarithmic histograms, and calls slower than the threshold set by
+``PYQT_DESIGNER_PLUGIN_SLOW_MS`` are logged as warnings.
+
+The statistics are available from
+``core.get_designer_hooks().widget_stats``, and are logged on exit, or
+written as JSON to the file named by ``PYQT_DESIGNER_PLUGIN_STATS_FILE``.
+"""
+import atexit
+import json
+import logging
+import math
+import os
+
+from .utils import env_flag, env_number
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENT_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_INSTRUMENT'
+SLOW_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_SLOW_MS'
+STATS_FILE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_STATS_FILE'
+
+DEFAULT_SLOW_MS = 100.0
+STAGES = ('constructor', 'init')
+
+# Bucket ``i`` holds times below 2 ** i microseconds; the last bucket holds
+# everything slower (over half a minute).
+_BUCKET_COUNT = 26
+
+
+class LatencyHistogram:
+    """
+    Call count, total, maximum and log2-bucketed distribution of latencies.
+    """
+
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * _BUCKET_COUNT
+
+    def add(self, elapsed):
+        """Add a latency, in seconds."""
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        micros = int(elapsed * 1e6)
+        self.buckets[min(micros.bit_length(), _BUCKET_COUNT - 1)] += 1
+
+    @property
+    def mean(self):
+        """The mean latency, in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """
+        Approximate a latency percentile, in seconds.
+
+        The result is the upper bound of the bucket holding the percentile,
+        and so is within a factor of two.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for idx, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min((2 ** idx) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self):
+        return dict(count=self.count, total=self.total, mean=self.mean,
+                    max=self.max, p50=self.percentile(0.5),
+                    p95=self.percentile(0.95), buckets=list(self.buckets))
+
+
+class WidgetStats:
+    """
+    ``createWidget()`` latency histograms, per widget class and stage.
+
+    Parameters
+    ----------
+    slow_threshold : float, optional
+        Log a warning for any stage slower than this, in seconds.
+    """
+
+    def __init__(self, slow_threshold=DEFAULT_SLOW_MS / 1e3):
+        self.slow_threshold = slow_threshold
+        self.histograms = {}
+
+    def add(self, class_name, stage, elapsed):
+        """Record the latency of ``stage`` for ``class_name``."""
+        key = (class_name, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.add(elapsed)
+
+        if self.slow_threshold is not None and elapsed > self.slow_threshold:
+            logger.warning('Slow %s of %s: %.1f ms', stage, class_name,
+                           elapsed * 1e3)
+
+    def to_dict(self):
+        """The statistics, as ``{class_name: {stage: histogram_dict}}``"""
+        stats = {}
+        for (class_name, stage), histogram in sorted(self.histograms.items()):
+            stats.setdefault(class_name, {})[stage] = histogram.to_dict()
+        return stats
+
+    def format_table(self):
+        """Format the statistics as a table, by total time."""
+        lines = [f'{"Count":>7} {"Total (ms)":>11} {"Mean (ms)":>10} '
+                 f'{"p95 (ms)":>9} {"Max (ms)":>9} {"Stage":<11} Class']
+        for (class_name, stage), histogram in sorted(
+                self.histograms.items(), key=lambda item: item[1].total,
+                reverse=True):
+            lines.append(
+                f'{histogram.count:>7} {histogram.total * 1e3:>11.1f} '
+                f'{histogram.mean * 1e3:>10.2f} '
+                f'{histogram.percentile(0.95) * 1e3:>9.2f} '
+                f'{histogram.max * 1e3:>9.2f} {stage:<11} {class_name}'
+            )
+        return '\n'.join(lines)
+
+    def dump(self, filename=None):
+        """
+        Log the statistics, or write them to ``filename`` as JSON.
+        """
+        if not self.histograms:
+            return
+
+        if not filename:
+            logger.info('createWidget latency:\n%s', self.format_table())
+            return
+
+        try:
+            with open(filename, 'wt') as f:
+                json.dump(self.to_dict(), f, indent=1)
+        except Exception as ex:
+            logger.warning('Unable to write widget stats %s: %s', filename,
+                           ex)
+
+
+def get_slow_threshold():
+    """The slow call warning threshold from the environment, in seconds."""
+    threshold = env_number(SLOW_ENV_VAR, DEFAULT_SLOW_MS)
+    return threshold / 1e3 if threshold > 0 else None
+
+
+def get_widget_stats():
+    """
+    Create the widget statistics, if enabled by the environment, and dump
+    them on exit.
+
+    Returns
+    -------
+    stats : WidgetStats or None
+    """
+    if not env_flag(INSTRUMENT_ENV_VAR):
+        return None
+
+    stats = WidgetStats(slow_threshold=get_slow_threshold())
+    atexit.register(stats.dump, os.environ.get(STATS_FILE_ENV_VAR))
+    return stats
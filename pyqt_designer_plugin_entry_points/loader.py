@@ -0,0 +1,159 @@
+"""
+Loading of entry points, optionally on a bounded thread pool.
+
+Entry point loading is dominated by imports, much of which is spent on I/O
+(stat and read calls on network filesystems, loading compiled extensions).
+Independent entry points may be loaded on a thread pool, while results and
+errors are still reported in the order of the entry point table.
+"""
+import concurrent.futures
+import importlib
+import logging
+import time
+
+from .report import measure
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_PARALLEL'
+
+# Raised by the import system when two threads import modules that depend on
+# each other.  Such entries are retried on the calling thread.
+_ImportDeadlockError = getattr(importlib._bootstrap, '_DeadlockError', ())
+
+
+def get_parallel_workers():
+    """
+    The number of loader threads requested by the environment.
+
+    Returns
+    -------
+    workers : int
+        0 to load entries sequentially.
+    """
+    return max(env_number(PARALLEL_ENV_VAR, 0, type_=int), 0)
+
+
+def _load_entry(key, entry, report=None):
+    """Load an entry, returning (object, exception)."""
+    try:
+        with measure(report, 'load', key, entry.name):
+            return entry.load(), None
+    except Exception as ex:
+        return None, ex
+
+
+def log_load_failure(key, entry, ex):
+    """Log a failure to load an entry point."""
+    logger.error("Failed to load %s entry: %s", key, entry.name,
+                 exc_info=ex)
+
+
+def _deadline_passed(deadline):
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _sequential_results(items, report, deadline, deferred):
+    for idx, (key, entry) in enumerate(items):
+        if _deadline_passed(deadline):
+            deferred.extend(items[idx:])
+            return
+        yield key, entry, _load_entry(key, entry, report)
+
+
+def _parallel_results(items, workers, report, deadline, deferred):
+    # Without a deadline, everything is submitted at once.  Otherwise,
+    # entries are submitted in waves so that the deadline can be checked.
+    wave_size = len(items) if deadline is None else workers
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='designer_entry_loader') as executor:
+        for start in range(0, len(items), wave_size):
+            if _deadline_passed(deadline):
+                deferred.extend(items[start:])
+                return
+
+            wave = items[start:start + wave_size]
+            futures = [executor.submit(_load_entry, key, entry, report)
+                       for key, entry in wave]
+            for (key, entry), future in zip(wave, futures):
+                obj, ex = future.result()
+                if isinstance(ex, _ImportDeadlockError):
+                    logger.debug('Import deadlock loading %s; retrying',
+                                 entry.name)
+                    obj, ex = _load_entry(key, entry, report)
+                yield key, entry, (obj, ex)
+
+
+def load_entries(items, parallel=None, report=None, quarantine=None,
+                 deadline=None, deferred=None):
+    """
+    Load entry points, skipping and logging those that fail.
+
+    Parameters
+    ----------
+    items : iterable of (key, entrypoints.EntryPoint)
+        The entry point group name and entry point to load.
+    parallel : int, optional
+        The number of loader threads.  0 or 1 loads each entry in turn on the
+        calling thread.  Defaults to the ``PYQT_DESIGNER_PLUGIN_PARALLEL``
+        environment variable.
+    report : report.LoadReport, optional
+        Record the time and memory used to load each entry.
+    quarantine : quarantine.Quarantine, optional
+        Skip entries in quarantine, and quarantine entries that fail.
+    deadline : float, optional
+        A ``time.monotonic()`` value after which no further entries are
+        started.
+    deferred : list, optional
+        Filled with the (key, entry) items not started before the deadline.
+
+    Yields
+    ------
+    key : str
+        The entry point group name.
+    entry : entrypoints.EntryPoint
+        The entry point.
+    obj : object
+        The loaded object.
+    """
+    if parallel is None:
+        parallel = get_parallel_workers()
+
+    items = list(items)
+    if quarantine is not None:
+        items = [(key, entry) for key, entry in items
+                 if not _is_quarantined(quarantine, key, entry)]
+
+    if deferred is None:
+        deferred = []
+
+    if parallel > 1 and len(items) > 1:
+        results = _parallel_results(items, min(parallel, len(items)),
+                                    report, deadline, deferred)
+    else:
+        results = _sequential_results(items, report, deadline, deferred)
+
+    try:
+        for key, entry, (obj, ex) in results:
+            if ex is not None:
+                log_load_failure(key, entry, ex)
+                if quarantine is not None:
+                    quarantine.add(key, entry, ex)
+                continue
+            yield key, entry, obj
+    finally:
+        if quarantine is not None:
+            quarantine.save()
+
+
+def _is_quarantined(quarantine, key, entry):
+    record = quarantine.get(key, entry)
+    if record is None:
+        return False
+
+    logger.warning('Skipping quarantined %s entry: %s (%s %s): %s',
+                   key, entry.name, entry.distro.name, entry.distro.version,
+                   record['error'])
+    return True
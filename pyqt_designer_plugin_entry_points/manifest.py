@@ -0,0 +1,185 @@
+"""
+Static designer information manifests.
+
+A distribution may describe its widgets without any plugin code being
+executed by shipping a JSON manifest as package data and referencing it from
+the ``qt_designer_manifest`` entry point group::
+
+    entry_points={
+        'qt_designer_widgets': [
+            'MyWidget = my_package.widgets:MyWidget',
+        ],
+        'qt_designer_manifest': [
+            'my_package = my_package:designer_manifest.json',
+        ],
+    }
+
+The manifest maps ``qt_designer_widgets`` entry point names of the same
+distribution to their designer information::
+
+    {
+        "MyWidget": {
+            "group": "My widgets",
+            "tooltip": "A widget of mine",
+            "icon": "icons/my_widget.svg",
+            "is_container": false
+        }
+    }
+
+Relative icon paths are resolved against the directory of the manifest.
+Widgets not listed in a manifest fall back to ``get_designer_info()``.
+
+The manifest filename is given as the entry point object name, so it may only
+contain letters, digits, underscores and dots, and must be directly inside
+the package: ``my_package:designer_manifest.json``, not
+``my_package:designer-manifest.json`` or ``my_package:data/designer.json``.
+"""
+import json
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_GROUP = 'qt_designer_manifest'
+
+
+def find_package_dir(module_name, path=None):
+    """
+    Find the directory containing ``module_name`` without importing it.
+
+    Parameters
+    ----------
+    module_name : str
+        The dotted module or package name.
+    path : list of str, optional
+        Defaults to ``sys.path``.
+
+    Returns
+    -------
+    directory : str or None
+        The package directory, or the directory containing a single-file
+        module.  None if it could not be found.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        module_path = list(getattr(module, '__path__', []))
+        if module_path:
+            return module_path[0]
+        if getattr(module, '__file__', None):
+            return os.path.dirname(module.__file__)
+
+    parts = module_name.split('.')
+    for folder in (path if path is not None else sys.path):
+        candidate = os.path.join(folder or os.curdir, *parts)
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate + '.py'):
+            return os.path.dirname(candidate)
+
+    return None
+
+
+def read_manifest(filename):
+    """
+    Read a designer manifest file.
+
+    Parameters
+    ----------
+    filename : str
+        The JSON manifest filename.
+
+    Returns
+    -------
+    manifest : dict
+        Entry point name to designer information.
+
+    Raises
+    ------
+    ValueError
+        If the manifest is not a mapping of names to mappings.
+    """
+    with open(filename, 'rt') as f:
+        manifest = json.load(f)
+
+    if not isinstance(manifest, dict) or not all(
+            isinstance(info, dict) for info in manifest.values()):
+        raise ValueError(
+            f'Designer manifest {filename} should map entry point names to '
+            f'designer information dictionaries'
+        )
+
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    for info in manifest.values():
+        icon = info.get('icon')
+        if isinstance(icon, str) and icon and not os.path.isabs(icon):
+            info['icon'] = os.path.join(base_dir, icon)
+
+    return manifest
+
+
+def get_distribution_name(entry):
+    """The name of the distribution providing ``entry``, if known"""
+    return entry.distro.name if entry.distro is not None else None
+
+
+def log_bad_entry(name, value, distro=None):
+    """Log a ``qt_designer_manifest`` entry point that could not be parsed."""
+    distro_name = distro.name if distro is not None else 'unknown'
+    logger.error(
+        'Invalid designer manifest entry point %r = %r of distribution %s: '
+        'it should be "package:filename", where the filename only contains '
+        'letters, digits, underscores and dots, and is directly inside the '
+        'package (e.g. "my_package:designer_manifest.json")',
+        name, value, distro_name
+    )
+
+
+def get_manifest_filename(entry, path=None):
+    """The manifest filename referenced by a ``qt_designer_manifest`` entry"""
+    package_dir = find_package_dir(entry.module_name, path=path)
+    if package_dir is None:
+        return None
+    return os.path.join(package_dir, entry.object_name or 'designer.json')
+
+
+def load_manifests(entries, path=None):
+    """
+    Load all designer manifests referenced by the given entry points.
+
+    Parameters
+    ----------
+    entries : list of entrypoints.EntryPoint
+        Entries from the ``qt_designer_manifest`` group.
+    path : list of str, optional
+        Defaults to ``sys.path``.
+
+    Returns
+    -------
+    manifests : dict
+        Keyed on (distribution name, widget entry point name), with the
+        designer information as values.
+    """
+    manifests = {}
+    for entry in entries:
+        filename = get_manifest_filename(entry, path=path)
+        try:
+            if filename is None:
+                raise FileNotFoundError(
+                    f'Package {entry.module_name} not found')
+            manifest = read_manifest(filename)
+        except Exception as ex:
+            logger.warning('Failed to read designer manifest %s (%s): %s',
+                           entry.name, filename, ex)
+            continue
+
+        distro_name = get_distribution_name(entry)
+        for name, info in manifest.items():
+            manifests[(distro_name, name)] = info
+
+    return manifests
+
+
+def get_designer_info(manifests, entry):
+    """The static designer information for a widget entry, if any"""
+    return manifests.get((get_distribution_name(entry), entry.name))
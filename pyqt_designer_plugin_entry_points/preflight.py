@@ -0,0 +1,286 @@
+"""
+Subprocess-isolated preflight of plugin imports.
+
+A plugin that segfaults or hangs while being imported takes Qt Designer down
+with it.  Preflight imports each widget and event entry point in its own
+worker process, under the offscreen QPA platform and with a timeout, and
+records a verdict for each:
+
+* ``ok`` - imported successfully
+* ``failed`` - raised an exception
+* ``crashed`` - the worker process died
+* ``timeout`` - the import did not finish in time
+
+The workers run concurrently, spreading the cost across all cores.  The
+verdicts are stored in the cache directory, keyed by distribution version,
+and :func:`apply_preflight` removes every entry that did not pass from the
+entry point table before anything is imported in-process.
+"""
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from . import cache
+from .core import ENTRYPOINT_EVENT_KEY, ENTRYPOINT_WIDGET_KEY
+from .utils import atomic_write_json, env_flag
+
+logger = logging.getLogger(__name__)
+
+PREFLIGHT_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_PREFLIGHT'
+PREFLIGHT_VERSION = 1
+RESULT_MARKER = 'PYQT_DESIGNER_PLUGIN_PREFLIGHT_RESULT:'
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_CRASHED = 'crashed'
+STATUS_TIMEOUT = 'timeout'
+
+
+def _is_preflight_group(group):
+    return (group == ENTRYPOINT_WIDGET_KEY or
+            group.startswith(f'{ENTRYPOINT_EVENT_KEY}.'))
+
+
+def get_verdict_key(row):
+    """The key identifying an entry point row in the verdict manifest"""
+    return '|'.join(str(row.get(item)) for item in
+                    ('group', 'name', 'module', 'attr', 'distribution',
+                     'version'))
+
+
+def _get_worker_env():
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    # Use the same import path as this process
+    env['PYTHONPATH'] = os.pathsep.join(path or os.curdir
+                                        for path in sys.path)
+    return env
+
+
+def _parse_result(output):
+    for line in reversed(output.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    return None
+
+
+def check_entry(row, timeout=30.0):
+    """
+    Import a single entry point in a worker process.
+
+    Parameters
+    ----------
+    row : dict
+        The entry point, as a cache row.  See :func:`cache.entry_to_row`.
+    timeout : float, optional
+        Time to allow for the import, in seconds.
+
+    Returns
+    -------
+    verdict : dict
+        The row with ``status``, ``elapsed`` and ``error`` added.
+    """
+    verdict = dict(row, status=STATUS_CRASHED, elapsed=None, error=None)
+    args = [sys.executable, '-m', __name__, '--worker', json.dumps(row)]
+    t0 = time.monotonic()
+    try:
+        proc = subprocess.run(args, env=_get_worker_env(), timeout=timeout,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True)
+    except subprocess.TimeoutExpired:
+        verdict.update(status=STATUS_TIMEOUT, elapsed=timeout,
+                       error=f'Import did not finish within {timeout} s')
+        return verdict
+
+    result = _parse_result(proc.stdout)
+    if result is None:
+        stderr = proc.stderr.strip().splitlines()
+        verdict.update(
+            elapsed=time.monotonic() - t0,
+            error=(f'Worker exited with code {proc.returncode}: '
+                   f'{stderr[-1] if stderr else "no output"}'),
+        )
+    else:
+        verdict.update(result)
+    return verdict
+
+
+def run_preflight(table, processes=None, timeout=30.0, verdicts=None):
+    """
+    Preflight the widget and event entry points of ``table``.
+
+    Parameters
+    ----------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    processes : int, optional
+        The number of concurrent worker processes.  Defaults to the number
+        of CPUs.
+    timeout : float, optional
+        Time to allow for each import, in seconds.
+    verdicts : dict, optional
+        Previous verdicts to reuse.  Entries with a verdict are not checked
+        again.
+
+    Returns
+    -------
+    verdicts : dict
+        Verdict key to verdict, for every entry of the table.
+    """
+    verdicts = dict(verdicts or {})
+    rows = [cache.entry_to_row(group, entry)
+            for group, entries in table.items()
+            if _is_preflight_group(group)
+            for entry in entries]
+    rows = [row for row in rows if get_verdict_key(row) not in verdicts]
+    if not rows:
+        return verdicts
+
+    processes = processes or os.cpu_count() or 1
+    logger.info('Preflight of %d entries with %d workers', len(rows),
+                processes)
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(processes, len(rows))) as executor:
+        for verdict in executor.map(
+                lambda row: check_entry(row, timeout=timeout), rows):
+            verdicts[get_verdict_key(verdict)] = verdict
+            if verdict['status'] != STATUS_OK:
+                logger.warning('Preflight %s of %s entry %s: %s',
+                               verdict['status'], verdict['group'],
+                               verdict['name'], verdict['error'])
+    return verdicts
+
+
+def filter_table(table, verdicts):
+    """
+    Remove entries from ``table`` that did not pass preflight.
+
+    Entries of groups that are not preflighted are kept.
+    """
+    filtered = {}
+    for group, entries in table.items():
+        if not _is_preflight_group(group):
+            filtered[group] = list(entries)
+            continue
+
+        filtered[group] = [
+            entry for entry in entries
+            if verdicts.get(
+                get_verdict_key(cache.entry_to_row(group, entry)), {}
+            ).get('status') == STATUS_OK
+        ]
+    return filtered
+
+
+def get_manifest_filename():
+    """The per-environment verdict manifest filename"""
+    return cache.get_cache_filename('preflight')
+
+
+def load_verdicts(filename=None):
+    """Load the verdict manifest, returning an empty dict on failure."""
+    filename = filename or get_manifest_filename()
+    try:
+        with open(filename, 'rt') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as ex:
+        logger.debug('Unable to read preflight manifest %s: %s', filename,
+                     ex)
+        return {}
+
+    if manifest.get('version') != PREFLIGHT_VERSION:
+        return {}
+    return {get_verdict_key(verdict): verdict
+            for verdict in manifest.get('verdicts', [])}
+
+
+def save_verdicts(verdicts, filename=None):
+    """Save the verdict manifest."""
+    filename = filename or get_manifest_filename()
+    manifest = dict(version=PREFLIGHT_VERSION,
+                    verdicts=list(verdicts.values()))
+    # Write atomically, as a concurrent Designer launch may be reading it
+    try:
+        atomic_write_json(filename, manifest, indent=1)
+    except Exception as ex:
+        logger.warning('Unable to save preflight manifest %s: %s', filename,
+                       ex)
+
+
+def apply_preflight(table, enabled=None, refresh=False, **kwargs):
+    """
+    Preflight ``table``, if enabled, and return only the entries that pass.
+
+    Verdicts are reused for entries whose distribution version is unchanged.
+
+    Parameters
+    ----------
+    table : dict
+        Dictionary of group name to list of EntryPoint.
+    enabled : bool, optional
+        Defaults to the ``PYQT_DESIGNER_PLUGIN_PREFLIGHT`` environment
+        variable.
+    refresh : bool, optional
+        Check every entry again, ignoring previous verdicts.
+    **kwargs :
+        Passed to :func:`run_preflight`.
+
+    Returns
+    -------
+    table : dict
+        The filtered table.
+    """
+    if enabled is None:
+        enabled = env_flag(PREFLIGHT_ENV_VAR)
+    if not enabled:
+        return table
+
+    previous = {} if refresh else load_verdicts()
+    verdicts = run_preflight(table, verdicts=previous, **kwargs)
+    if verdicts != previous:
+        save_verdicts(verdicts)
+    return filter_table(table, verdicts)
+
+
+def _worker_main(row_json):
+    """Import one entry point in a worker process."""
+    from PyQt5 import QtWidgets
+
+    row = json.loads(row_json)
+    entry = cache.entry_from_row(row)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    t0 = time.perf_counter()
+    try:
+        entry.load()
+    except Exception as ex:
+        result = dict(status=STATUS_FAILED,
+                      error=f'{type(ex).__name__}: {ex}')
+    else:
+        result = dict(status=STATUS_OK)
+    result['elapsed'] = time.perf_counter() - t0
+
+    print(f'{RESULT_MARKER}{json.dumps(result)}', flush=True)
+    app.quit()
+    return 0
+
+
+def _create_arg_parser():
+    parser = argparse.ArgumentParser(
+        description='Import a designer plugin entry point in a preflight '
+                    'worker process'
+    )
+    parser.add_argument('--worker', metavar='ENTRY_JSON', required=True,
+                        help='The entry point, as a JSON cache row')
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(_worker_main(_create_arg_parser().parse_args().worker))
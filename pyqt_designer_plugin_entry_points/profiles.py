@@ -0,0 +1,184 @@
+"""
+Named plugin profiles, restricting which distributions and entries are
+scanned.
+
+Profiles are defined in a JSON file, by default
+``$XDG_CONFIG_HOME/pyqt_designer_plugin_entry_points/profiles.json``::
+
+    {
+        "beamline_a": {
+            "distributions": ["pydm", "beamline-a-widgets"],
+            "entries": ["BeamlineA*", "PyDM*"],
+            "signals": ["formWindowAdded"]
+        }
+    }
+
+and selected with the ``PYQT_DESIGNER_PLUGIN_PROFILE`` environment variable.
+Each restriction is optional; an omitted key allows everything.  Entry name
+patterns use shell-style wildcards, and apply to widget and event hook
+entries only.
+"""
+import fnmatch
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_PROFILE'
+PROFILES_FILE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_PROFILES'
+
+# The widget and event hook groups, whose entry names are matched against
+# the profile's entry patterns.  Other groups, such as manifests, are kept
+# for every allowed distribution.
+ENTRY_PATTERN_GROUPS = ('qt_designer_widgets', 'qt_designer_event')
+
+
+def normalize_distribution_name(name):
+    """Normalize a distribution name for comparison, as in PEP 503."""
+    return re.sub(r'[-_.]+', '-', name or '').lower()
+
+
+class Profile:
+    """
+    A named restriction on the distributions, entries and event signals
+    used for discovery.
+
+    Parameters
+    ----------
+    name : str
+        The profile name.
+    distributions : list of str, optional
+        The allowed distribution names.
+    entries : list of str, optional
+        Shell-style patterns of the allowed widget and event hook entry
+        point names.
+    signals : list of str, optional
+        The allowed event signal names.
+    """
+
+    def __init__(self, name, distributions=None, entries=None, signals=None):
+        self.name = name
+        self.distributions = (
+            None if distributions is None
+            else frozenset(normalize_distribution_name(dist)
+                           for dist in distributions)
+        )
+        self.entries = None if entries is None else tuple(entries)
+        self.signals = None if signals is None else frozenset(signals)
+
+    @property
+    def key(self):
+        """A string identifying the profile contents, for caching."""
+        return json.dumps(
+            [self.name,
+             sorted(self.distributions or []) or None,
+             list(self.entries or []) or None,
+             sorted(self.signals or []) or None],
+        )
+
+    def allows_distribution(self, name):
+        """Is the distribution ``name`` part of the profile?"""
+        return (self.distributions is None or
+                normalize_distribution_name(name) in self.distributions)
+
+    def allows_entry(self, name):
+        """Is the entry point ``name`` part of the profile?"""
+        return self.entries is None or any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self.entries
+        )
+
+    def allows_signal(self, signal_name):
+        """Is the event signal ``signal_name`` part of the profile?"""
+        return self.signals is None or signal_name in self.signals
+
+    def filter_table(self, table):
+        """Remove entries outside of the profile from ``table``."""
+        filtered = {}
+        for group, entries in table.items():
+            match_names = group.split('.', 1)[0] in ENTRY_PATTERN_GROUPS
+            filtered[group] = [
+                entry for entry in entries
+                if (not match_names or self.allows_entry(entry.name)) and (
+                    entry.distro is None or
+                    self.allows_distribution(entry.distro.name))
+            ]
+        return filtered
+
+    def __repr__(self):
+        return (f'<Profile {self.name!r} distributions={self.distributions} '
+                f'entries={self.entries} signals={self.signals}>')
+
+
+def get_profiles_filename():
+    """The profile definition filename."""
+    filename = os.environ.get(PROFILES_FILE_ENV_VAR)
+    if filename:
+        return filename
+
+    base = os.environ.get('XDG_CONFIG_HOME') or os.path.join(
+        os.path.expanduser('~'), '.config')
+    return os.path.join(base, 'pyqt_designer_plugin_entry_points',
+                        'profiles.json')
+
+
+def load_profiles(filename=None):
+    """
+    Load the profile definitions.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Defaults to :func:`get_profiles_filename`.
+
+    Returns
+    -------
+    profiles : dict
+        Profile name to :class:`Profile`.
+    """
+    filename = filename or get_profiles_filename()
+    with open(filename, 'rt') as f:
+        definitions = json.load(f)
+
+    return {
+        name: Profile(name,
+                      distributions=definition.get('distributions'),
+                      entries=definition.get('entries'),
+                      signals=definition.get('signals'))
+        for name, definition in definitions.items()
+    }
+
+
+def get_profile(name=None, filename=None):
+    """
+    Get the selected profile.
+
+    Parameters
+    ----------
+    name : str, optional
+        The profile name.  Defaults to the ``PYQT_DESIGNER_PLUGIN_PROFILE``
+        environment variable.
+    filename : str, optional
+        The profile definition filename.
+
+    Returns
+    -------
+    profile : Profile or None
+        None if no profile is selected, or if it could not be loaded, in
+        which case nothing is restricted.
+    """
+    if name is None:
+        name = os.environ.get(PROFILE_ENV_VAR, '').strip()
+    if not name:
+        return None
+
+    try:
+        return load_profiles(filename)[name]
+    except KeyError:
+        logger.error('Plugin profile %r is not defined; loading all plugins',
+                     name)
+    except Exception as ex:
+        logger.error('Failed to load plugin profiles (%s); loading all '
+                     'plugins', ex)
+    return None
@@ -0,0 +1,175 @@
+"""
+Persistent quarantine of entry points that failed to load.
+
+Entries that fail to load are recorded by distribution name and version.
+On later launches they are skipped with a one-line summary, rather than
+paying for the failing import and its traceback every time.  Installing a
+different version of the distribution releases its entries automatically;
+:func:`clear` (or ``settings --retry``) releases them explicitly.
+"""
+import json
+import logging
+import time
+
+from . import cache
+from .utils import atomic_write_json, env_flag
+
+logger = logging.getLogger(__name__)
+
+QUARANTINE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_QUARANTINE'
+QUARANTINE_VERSION = 1
+
+
+def _get_distro(entry):
+    distro = entry.distro
+    if distro is None or not distro.name:
+        return None, None
+    return distro.name, distro.version
+
+
+class Quarantine:
+    """
+    Quarantined entry points, keyed by distribution name and version.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Defaults to the per-environment file in the cache directory.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename or cache.get_cache_filename('quarantine')
+        self.distributions = {}
+        self._modified = False
+        self._read()
+
+    def _read(self):
+        try:
+            with open(self.filename, 'rt') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as ex:
+            logger.debug('Unable to read quarantine %s: %s', self.filename,
+                         ex)
+            return
+
+        if data.get('version') == QUARANTINE_VERSION:
+            self.distributions = data.get('distributions', {})
+
+    def save(self):
+        """Save the quarantine, if it was modified."""
+        if not self._modified:
+            return
+
+        data = dict(version=QUARANTINE_VERSION,
+                    distributions=self.distributions)
+        try:
+            atomic_write_json(self.filename, data, indent=1)
+        except Exception as ex:
+            logger.warning('Unable to save quarantine %s: %s', self.filename,
+                           ex)
+            return
+
+        self._modified = False
+
+    def get(self, key, entry):
+        """
+        Get the quarantine record for an entry.
+
+        Records of a different version of the distribution are discarded.
+
+        Parameters
+        ----------
+        key : str
+            The entry point group name.
+        entry : entrypoints.EntryPoint
+            The entry point.
+
+        Returns
+        -------
+        record : dict or None
+            With the keys ``error`` and ``time``.
+        """
+        distro_name, version = _get_distro(entry)
+        dist_info = self.distributions.get(distro_name)
+        if dist_info is None:
+            return None
+
+        if dist_info.get('version') != version:
+            logger.info('Releasing quarantined entries of %s %s; now %s',
+                        distro_name, dist_info.get('version'), version)
+            del self.distributions[distro_name]
+            self._modified = True
+            return None
+
+        return dist_info['entries'].get(f'{key}:{entry.name}')
+
+    def add(self, key, entry, ex):
+        """
+        Quarantine an entry which failed with exception ``ex``.
+
+        Entries without distribution information are not quarantined.
+        """
+        distro_name, version = _get_distro(entry)
+        if distro_name is None:
+            return
+
+        dist_info = self.distributions.get(distro_name)
+        if dist_info is None or dist_info.get('version') != version:
+            dist_info = dict(version=version, entries={})
+            self.distributions[distro_name] = dist_info
+
+        dist_info['entries'][f'{key}:{entry.name}'] = dict(
+            error=f'{type(ex).__name__}: {ex}',
+            time=time.time(),
+        )
+        self._modified = True
+
+    def clear(self, distributions=None):
+        """
+        Release quarantined entries.
+
+        Parameters
+        ----------
+        distributions : list of str, optional
+            Only release the entries of these distributions.
+        """
+        if distributions is None:
+            distributions = list(self.distributions)
+
+        for distro_name in distributions:
+            if self.distributions.pop(distro_name, None) is not None:
+                self._modified = True
+
+    def __iter__(self):
+        for distro_name, dist_info in self.distributions.items():
+            for entry_key, record in dist_info['entries'].items():
+                yield distro_name, dist_info['version'], entry_key, record
+
+
+def quarantine_enabled():
+    """Is the quarantine enabled by the environment?"""
+    return env_flag(QUARANTINE_ENV_VAR)
+
+
+def get_quarantine():
+    """The quarantine, if enabled by the environment, or None."""
+    if quarantine_enabled():
+        return Quarantine()
+    return None
+
+
+def clear(distributions=None):
+    """
+    Release quarantined entries, so they are loaded again on the next
+    launch.
+
+    Parameters
+    ----------
+    distributions : list of str, optional
+        Only release the entries of these distributions.
+    """
+    quarantine = Quarantine()
+    quarantine.clear(distributions)
+    quarantine.save()
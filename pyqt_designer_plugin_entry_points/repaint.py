@@ -0,0 +1,300 @@
+"""
+Event-driven repainting of the widgets on Designer forms.
+
+Rather than repainting the active form on a fixed timer, the
+:class:`RepaintScheduler` listens to the change signals of the form window
+manager, each form window and the property editor, and repaints only the
+affected widgets:
+
+* property edits - the object shown in the property editor
+* widgets added to a form - the new widget
+* selection changes - the newly and previously selected widgets
+* form contents, geometry or active form changes - the form's main
+  container
+
+Repaints are coalesced into a single pass from the event loop, and are held
+while the application is in the background.
+
+Widgets that animate in Designer, such as strip charts, declare a
+``preview_rate`` in their designer information, in repaints per second.
+Their instances are repainted by the shared :class:`PreviewScheduler`.
+"""
+import functools
+import logging
+import time
+import weakref
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+POLL_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_REPAINT_POLL'
+PREVIEW_MAX_RATE_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_PREVIEW_MAX_RATE'
+DEFAULT_PREVIEW_MAX_RATE = 30.0
+
+
+def _is_application_active():
+    app = QtGui.QGuiApplication.instance()
+    return (app is None or
+            app.applicationState() == QtCore.Qt.ApplicationActive)
+
+
+class RepaintScheduler(QtCore.QObject):
+    """
+    Repaint form widgets in response to Designer change signals.
+
+    Parameters
+    ----------
+    delay_ms : int, optional
+        Time to collect further changes before repainting.
+    parent : QtCore.QObject, optional
+        The parent object.
+    """
+
+    def __init__(self, delay_ms=0, parent=None):
+        super().__init__(parent=parent)
+        self._pending = set()
+        self._selected = {}
+        self._property_editor = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(
+                self._application_state_changed)
+
+    @property
+    def pending(self):
+        """The widgets waiting to be repainted"""
+        return set(self._pending)
+
+    def attach(self, form_editor):
+        """
+        Connect to the change signals of a Designer form editor.
+
+        Parameters
+        ----------
+        form_editor : QtDesigner.QDesignerFormEditorInterface
+        """
+        manager = form_editor.formWindowManager()
+        if manager:
+            manager.formWindowAdded.connect(self.add_form_window)
+            manager.formWindowRemoved.connect(self.remove_form_window)
+            manager.activeFormWindowChanged.connect(self.schedule_form)
+            for idx in range(manager.formWindowCount()):
+                self.add_form_window(manager.formWindow(idx))
+
+        editor = form_editor.propertyEditor()
+        if editor:
+            self._property_editor = editor
+            editor.propertyChanged.connect(self._property_changed)
+
+    def add_form_window(self, form):
+        """Connect to the change signals of a form window."""
+        schedule_form = functools.partial(self._form_changed, form)
+        form.changed.connect(schedule_form)
+        form.geometryChanged.connect(schedule_form)
+        form.widgetRemoved.connect(schedule_form)
+        form.widgetManaged.connect(self.schedule)
+        form.selectionChanged.connect(
+            functools.partial(self._selection_changed, form))
+        self.schedule_form(form)
+
+    def remove_form_window(self, form):
+        """Forget a form window that was closed."""
+        self._selected.pop(form, None)
+
+    def schedule(self, widget):
+        """Repaint ``widget`` on the next pass."""
+        if not isinstance(widget, QtWidgets.QWidget):
+            return
+
+        self._pending.add(widget)
+        if _is_application_active():
+            self._timer.start()
+
+    def schedule_form(self, form):
+        """Repaint the main container of ``form`` on the next pass."""
+        if form is None:
+            return
+        self.schedule(form.mainContainer() or form)
+
+    def _form_changed(self, form, *args):
+        self.schedule_form(form)
+
+    def _property_changed(self, name, value):
+        self.schedule(self._property_editor.object())
+
+    def _selection_changed(self, form):
+        cursor = form.cursor()
+        selected = []
+        if cursor is not None:
+            selected = [cursor.selectedWidget(idx)
+                        for idx in range(cursor.selectedWidgetCount())]
+
+        # Repaint the previous selection as well, to clear its handles
+        for widget in self._selected.get(form, []) + selected:
+            self.schedule(widget)
+        self._selected[form] = selected
+
+    def _application_state_changed(self, state):
+        if state == QtCore.Qt.ApplicationActive and self._pending:
+            self._timer.start()
+
+    def flush(self):
+        """Repaint the pending widgets now."""
+        pending, self._pending = self._pending, set()
+        for widget in pending:
+            try:
+                widget.update()
+            except RuntimeError:
+                # The widget was deleted in the meantime
+                ...
+
+
+def get_preview_max_rate():
+    """The preview repaint rate cap from the environment, in Hz."""
+    max_rate = env_number(PREVIEW_MAX_RATE_ENV_VAR, DEFAULT_PREVIEW_MAX_RATE,
+                          minimum=0)
+    if not max_rate:
+        logger.warning('Invalid %s setting: %r', PREVIEW_MAX_RATE_ENV_VAR,
+                       max_rate)
+        return DEFAULT_PREVIEW_MAX_RATE
+    return max_rate
+
+
+class _PreviewGroup:
+    """Live widget instances sharing a refresh interval"""
+
+    __slots__ = ('interval', 'widgets', 'next_due')
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.widgets = weakref.WeakSet()
+        self.next_due = 0.0
+
+
+class PreviewScheduler(QtCore.QObject):
+    """
+    Periodically repaint the live instances of animated designer widgets.
+
+    A single timer serves every registered widget.  Widgets are grouped by
+    refresh interval, and each tick repaints the groups that are due, so
+    Qt merges their ``update()`` calls into one paint pass.  The tick rate,
+    and so the total repaint rate, is capped at ``max_rate``; faster
+    requests are slowed down to it.
+
+    Instances are tracked weakly and dropped once deleted.  Nothing runs
+    while no instances are registered, or while the application is in the
+    background.
+
+    Parameters
+    ----------
+    max_rate : float, optional
+        The maximum repaint rate, in Hz.
+    parent : QtCore.QObject, optional
+        The parent object.
+    """
+
+    def __init__(self, max_rate=DEFAULT_PREVIEW_MAX_RATE, parent=None):
+        super().__init__(parent=parent)
+        self.max_rate = max_rate
+        self._groups = {}
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.tick)
+
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(
+                self._application_state_changed)
+
+    @property
+    def widgets(self):
+        """All registered live widget instances"""
+        return [widget for group in self._groups.values()
+                for widget in group.widgets]
+
+    @property
+    def interval(self):
+        """The tick interval, in seconds, or None if idle"""
+        intervals = [group.interval for group in self._groups.values()
+                     if group.widgets]
+        return min(intervals) if intervals else None
+
+    def register(self, widget, rate):
+        """
+        Repaint ``widget`` periodically.
+
+        Parameters
+        ----------
+        widget : QtWidgets.QWidget
+            The widget instance.
+        rate : float
+            The requested repaint rate, in Hz.
+        """
+        try:
+            rate = min(float(rate), self.max_rate)
+        except (TypeError, ValueError):
+            logger.warning('Invalid preview rate for %s: %r',
+                           type(widget).__name__, rate)
+            return
+
+        if rate <= 0:
+            return
+
+        # Round to whole milliseconds, so that similar rates share a group
+        interval = round(1000.0 / rate) / 1000.0
+        group = self._groups.get(interval)
+        if group is None:
+            group = self._groups[interval] = _PreviewGroup(interval)
+        group.widgets.add(widget)
+        self._update_timer()
+
+    def _update_timer(self):
+        interval = self.interval
+        if interval is None:
+            self._timer.stop()
+            return
+
+        self._timer.setInterval(max(1, int(interval * 1000)))
+        if not self._timer.isActive() and _is_application_active():
+            self._timer.start()
+
+    def _application_state_changed(self, state):
+        if state == QtCore.Qt.ApplicationActive:
+            self._update_timer()
+        else:
+            self._timer.stop()
+
+    def tick(self):
+        """Repaint the widgets of every group that is due."""
+        now = time.monotonic()
+        # Serve groups due within half a tick, rather than a tick late
+        slack = (self.interval or 0.0) / 2
+        idle = []
+        for interval, group in self._groups.items():
+            if not group.widgets:
+                idle.append(interval)
+                continue
+            if group.next_due > now + slack:
+                continue
+
+            group.next_due = now + interval
+            for widget in list(group.widgets):
+                try:
+                    if widget.isVisible():
+                        widget.update()
+                except RuntimeError:
+                    group.widgets.discard(widget)
+
+        if idle:
+            for interval in idle:
+                del self._groups[interval]
+            self._update_timer()
@@ -0,0 +1,152 @@
+"""
+Per-entry load timing and memory accounting.
+"""
+import contextlib
+import sys
+import time
+import tracemalloc
+
+
+class LoadRecord:
+    """
+    Timing and memory information for one step of loading an entry point.
+
+    Attributes
+    ----------
+    stage : str
+        The step that was measured, such as ``'load'`` for ``entry.load()``
+        or ``'wrap'`` for ``DesignerPluginWrapper.from_class``.
+    key : str
+        The entry point group name.
+    name : str
+        The entry point name.
+    elapsed : float
+        Wall time, in seconds.
+    new_modules : int
+        The number of modules newly added to ``sys.modules``.
+    memory_delta : int or None
+        Change in traced memory, in bytes, if memory was tracked.
+    failed : bool
+        True if the step raised.
+    """
+
+    __slots__ = ('stage', 'key', 'name', 'elapsed', 'new_modules',
+                 'memory_delta', 'failed')
+
+    def __init__(self, stage, key, name, elapsed=0.0, new_modules=0,
+                 memory_delta=None, failed=False):
+        self.stage = stage
+        self.key = key
+        self.name = name
+        self.elapsed = elapsed
+        self.new_modules = new_modules
+        self.memory_delta = memory_delta
+        self.failed = failed
+
+    def __repr__(self):
+        return (f'<LoadRecord {self.stage} {self.key}:{self.name} '
+                f'elapsed={self.elapsed:.4f} new_modules={self.new_modules} '
+                f'memory_delta={self.memory_delta} failed={self.failed}>')
+
+
+class LoadReport:
+    """
+    A report of load timing and memory use, per entry point.
+
+    Pass an instance as ``report`` to :func:`core.enumerate_widgets` or
+    :func:`core.connect_events` to fill it in.
+
+    When entries are loaded in parallel, module counts and memory deltas
+    include the work of other loader threads running at the same time.
+
+    Parameters
+    ----------
+    track_memory : bool, optional
+        Record memory deltas with ``tracemalloc``, starting it if necessary.
+        This slows down imports considerably.
+    """
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.records = []
+        self._started_tracing = False
+
+    def _get_memory(self):
+        if not self.track_memory:
+            return None
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return tracemalloc.get_traced_memory()[0]
+
+    @contextlib.contextmanager
+    def measure(self, stage, key, name):
+        """
+        Measure a step of loading the entry point ``key``:``name``.
+
+        Yields
+        ------
+        record : LoadRecord
+            The record, added to the report when the step completes.
+        """
+        record = LoadRecord(stage, key, name)
+        memory = self._get_memory()
+        module_count = len(sys.modules)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record.failed = True
+            raise
+        finally:
+            record.elapsed = time.perf_counter() - t0
+            record.new_modules = len(sys.modules) - module_count
+            if memory is not None:
+                record.memory_delta = self._get_memory() - memory
+            self.records.append(record)
+
+    def stop(self):
+        """Stop memory tracing, if this report started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @property
+    def total_time(self):
+        """The total time of all recorded steps, in seconds"""
+        return sum(record.elapsed for record in self.records)
+
+    def sorted_records(self):
+        """All records, slowest first"""
+        return sorted(self.records, key=lambda record: record.elapsed,
+                      reverse=True)
+
+    def format_table(self):
+        """Format the report as a table, slowest first."""
+        lines = [f'{"Time (ms)":>10} {"Modules":>8} {"Memory (KiB)":>13} '
+                 f'{"Stage":<6} Entry']
+        for record in self.sorted_records():
+            if record.memory_delta is None:
+                memory = '-'
+            else:
+                memory = f'{record.memory_delta / 1024:.1f}'
+            failed = ' (failed)' if record.failed else ''
+            lines.append(
+                f'{record.elapsed * 1e3:>10.1f} {record.new_modules:>8} '
+                f'{memory:>13} {record.stage:<6} '
+                f'{record.key}:{record.name}{failed}'
+            )
+        lines.append(f'{self.total_time * 1e3:>10.1f} total')
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def measure(report, stage, key, name):
+    """Measure a step with ``report``, if one is given."""
+    if report is None:
+        yield None
+        return
+
+    with report.measure(stage, key, name) as record:
+        yield record
@@ -1,30 +1,120 @@
+import argparse
 import sys
 
-from . import core
+from . import backends, core, preflight, quarantine
+from .report import LoadReport
 
 
-def list_widgets(file=sys.stdout):
+def list_widgets(file=sys.stdout, table=None, report=None):
     print(file=file)
     print('Widgets', file=file)
     print('-------', file=file)
-    for name, wrapped_cls in core.enumerate_widgets().items():
+    for name, wrapped_cls in core.enumerate_widgets(table=table,
+                                                    report=report).items():
         cls = wrapped_cls.info()['cls']
         print(f'{name} ({cls.__module__}.{cls.__name__})', file=file)
 
 
-def list_connections(file=sys.stdout):
+def list_connections(file=sys.stdout, table=None, report=None):
     print(file=file)
     print('Events hooked', file=file)
     print('-------------', file=file)
-    for name, (event, func) in core.enumerate_all_events():
+    for name, (event, func) in core.enumerate_all_events(table=table,
+                                                         report=report):
         print(f'{name}: {event.module_name}.{event.object_name} {func}',
               file=file)
 
 
-def main(file=sys.stdout):
-    list_widgets(file=file)
-    list_connections(file=file)
+def list_load_report(report, file=sys.stdout):
+    print(file=file)
+    print('Load timing', file=file)
+    print('-----------', file=file)
+    print(report.format_table(), file=file)
+
+
+def list_quarantine(file=sys.stdout):
+    print(file=file)
+    print('Quarantined entries', file=file)
+    print('-------------------', file=file)
+    for distro_name, version, entry_key, record in quarantine.Quarantine():
+        print(f'{distro_name} {version} {entry_key}: {record["error"]}',
+              file=file)
+
+
+def list_preflight(verdicts, file=sys.stdout):
+    print(file=file)
+    print('Preflight', file=file)
+    print('---------', file=file)
+    for verdict in sorted(verdicts.values(),
+                          key=lambda verdict: (verdict['status'] != 'ok',
+                                               verdict['group'],
+                                               verdict['name'])):
+        elapsed = verdict['elapsed']
+        elapsed = f'{elapsed * 1e3:.1f} ms' if elapsed is not None else '-'
+        error = f': {verdict["error"]}' if verdict['error'] else ''
+        print(f'{verdict["status"]:<8} {elapsed:>10} '
+              f'{verdict["group"]}:{verdict["name"]}{error}', file=file)
+
+
+def main(file=sys.stdout, timing=False, memory=False, backend=None,
+         write_index=None, retry=None, preflight_only=False):
+    if retry is not None:
+        quarantine.clear(retry or None)
+        print('Released quarantined entries of: '
+              f'{", ".join(retry) or "all distributions"}', file=file)
+
+    table = core.get_entry_point_table(backend=backend)
+    if write_index is not None:
+        backends.write_static_index(table, write_index)
+        print(f'Wrote static index: {write_index}', file=file)
+        return
+
+    if preflight_only:
+        verdicts = preflight.run_preflight(table)
+        preflight.save_verdicts(verdicts)
+        list_preflight(verdicts, file=file)
+        return
+
+    table = preflight.apply_preflight(table)
+
+    report = LoadReport(track_memory=memory) if (timing or memory) else None
+    try:
+        list_widgets(file=file, table=table, report=report)
+        list_connections(file=file, table=table, report=report)
+    finally:
+        if report is not None:
+            report.stop()
+
+    if quarantine.quarantine_enabled():
+        list_quarantine(file=file)
+
+    if report is not None:
+        list_load_report(report, file=file)
+
+
+def _create_arg_parser():
+    parser = argparse.ArgumentParser(
+        description='List the widgets and events provided by entry points'
+    )
+    parser.add_argument('--timing', action='store_true',
+                        help='Show the time taken to load each entry point')
+    parser.add_argument('--memory', action='store_true',
+                        help='Include memory use with the timing report '
+                             '(slow)')
+    parser.add_argument('--backend', choices=list(backends.BACKENDS),
+                        help='The entry point discovery backend')
+    parser.add_argument('--write-index', metavar='FILENAME',
+                        help='Write a static index for the "static" '
+                             'discovery backend and exit')
+    parser.add_argument('--preflight', dest='preflight_only',
+                        action='store_true',
+                        help='Import every entry point in an isolated worker '
+                             'process, save the verdicts and exit')
+    parser.add_argument('--retry', nargs='*', metavar='DISTRIBUTION',
+                        help='Release quarantined entries of the given '
+                             'distributions (or all) before loading')
+    return parser
 
 
 if __name__ == '__main__':
-    main()
+    main(**vars(_create_arg_parser().parse_args()))
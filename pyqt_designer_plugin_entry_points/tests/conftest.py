@@ -1,11 +1,17 @@
+import os
+
 import entrypoints
+import pytest
+
+from .. import cache, core
 
 
 def get_entrypoint_object(entry_name, item):
-    class EntrypointStubObject:
-        name = entry_name
+    class EntrypointStubObject(entrypoints.EntryPoint):
+        load_count = 0
 
         def load(self):
+            self.load_count += 1
             if isinstance(item, Exception):
                 raise item
             return item
@@ -13,12 +19,62 @@ def get_entrypoint_object(entry_name, item):
         def __repr__(self):
             return f'<EntrypointStubObject name={self.name} item={item}>'
 
-    return EntrypointStubObject()
+    return EntrypointStubObject(
+        entry_name,
+        getattr(item, '__module__', 'test_module'),
+        getattr(item, '__name__', entry_name),
+        distro=entrypoints.Distribution('test_distribution', '1.0'),
+    )
 
 
 def patch_entrypoint(monkeypatch, object_dict):
-    def get_group_all(key):
-        for name, obj in object_dict.get(key, {}).items():
-            yield get_entrypoint_object(name, obj)
+    def scan_entry_points(path=None, backend=None, profile=None):
+        return {
+            key: [get_entrypoint_object(name, obj)
+                  for name, obj in objects.items()]
+            for key, objects in object_dict.items()
+        }
+
+    monkeypatch.setattr(core, 'scan_entry_points', scan_entry_points)
+
+
+def make_distribution(site_dir, name, version, entry_points):
+    dist_info = site_dir / f'{name}-{version}.dist-info'
+    dist_info.mkdir(parents=True)
+    (dist_info / 'METADATA').write_text(
+        f'Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n'
+    )
+    lines = []
+    for group, entries in entry_points.items():
+        lines.append(f'[{group}]')
+        lines.extend(f'{key} = {value}' for key, value in entries.items())
+    (dist_info / 'entry_points.txt').write_text('\n'.join(lines) + '\n')
+    return dist_info
+
+
+@pytest.fixture(autouse=True)
+def no_entrypoint_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, '0')
+    monkeypatch.setenv(cache.CACHE_DIR_ENV_VAR, str(tmp_path / 'cache'))
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5 import QtWidgets
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
 
-    monkeypatch.setattr(entrypoints, 'get_group_all', get_group_all)
+@pytest.fixture
+def hook_dispatchers(monkeypatch, qapp):
+    """Fresh designer hook dispatchers, disconnected after the test."""
+    hooks = core.get_designer_hooks()
+    dispatchers = {}
+    monkeypatch.setattr(hooks, '_event_handlers', dispatchers)
+    yield dispatchers
+    for signal_name, dispatcher in dispatchers.items():
+        getattr(hooks, signal_name).disconnect(dispatcher)
+        dispatcher.deleteLater()
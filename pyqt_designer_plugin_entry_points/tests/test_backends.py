@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import backends
+
+from .conftest import make_distribution
+
+logger = logging.getLogger(__name__)
+
+core = pyqt_designer_plugin_entry_points.core
+WIDGET_KEY = core.ENTRYPOINT_WIDGET_KEY
+EVENT_KEY = core.ENTRYPOINT_EVENT_KEY
+
+
+def summarize(table):
+    return {
+        group: sorted((entry.name, entry.module_name, entry.object_name,
+                       entry.distro.name, entry.distro.version)
+                      for entry in entries)
+        for group, entries in table.items()
+    }
+
+
+@pytest.fixture
+def site_path(tmp_path):
+    site_dir = tmp_path / 'site'
+    make_distribution(site_dir, 'dist_a', '1.0',
+                      {WIDGET_KEY: {'WidgetA': 'mod_a:WidgetA'},
+                       'console_scripts': {'script_a': 'mod_a:main'}})
+    make_distribution(site_dir, 'dist_b', '2.0',
+                      {f'{EVENT_KEY}.formWindowAdded': {
+                          'hook_b': 'mod_b.hooks:form_added'}})
+    make_distribution(site_dir, 'dist_c', '3.0',
+                      {'console_scripts': {'script_c': 'mod_c:main'}})
+    return [str(site_dir)]
+
+
+@pytest.mark.parametrize('backend', ['entrypoints', 'importlib'])
+def test_backends_equivalent(site_path, backend):
+    expected = {
+        WIDGET_KEY: [('WidgetA', 'mod_a', 'WidgetA', 'dist_a', '1.0')],
+        f'{EVENT_KEY}.formWindowAdded': [
+            ('hook_b', 'mod_b.hooks', 'form_added', 'dist_b', '2.0')],
+    }
+    table = core.get_entry_point_table(path=site_path, backend=backend)
+    assert summarize(table) == expected
+
+
+def test_static_index(monkeypatch, site_path, tmp_path):
+    table = core.get_entry_point_table(path=site_path)
+    index_filename = str(tmp_path / 'index.json')
+    backends.write_static_index(table, index_filename)
+
+    monkeypatch.setenv(backends.BACKEND_ENV_VAR, 'static')
+    monkeypatch.setenv(backends.INDEX_ENV_VAR, index_filename)
+    assert summarize(core.get_entry_point_table()) == summarize(table)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        backends.get_backend('unknown')
+
+
+@pytest.mark.parametrize('backend', ['entrypoints', 'importlib'])
+def test_bad_manifest_entry(tmp_path, caplog, backend):
+    site_dir = tmp_path / 'site'
+    make_distribution(
+        site_dir, 'bad_manifest_dist', '1.0',
+        {WIDGET_KEY: {'WidgetA': 'mod_a:WidgetA'},
+         core.ENTRYPOINT_MANIFEST_KEY: {
+             'manifest': 'mod_a:designer-manifest.json'}})
+
+    with pytest.warns(Warning):
+        table = backends.get_backend(backend).scan(
+            core.is_designer_group, path=[str(site_dir)])
+
+    assert not table.get(core.ENTRYPOINT_MANIFEST_KEY)
+    (record, ) = [record for record in caplog.records
+                  if record.levelno == logging.ERROR]
+    message = record.getMessage()
+    assert 'bad_manifest_dist' in message
+    assert 'package:filename' in message
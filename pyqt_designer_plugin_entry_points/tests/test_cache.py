@@ -0,0 +1,49 @@
+import logging
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import cache
+
+from .conftest import make_distribution
+
+logger = logging.getLogger(__name__)
+
+WIDGET_KEY = pyqt_designer_plugin_entry_points.core.ENTRYPOINT_WIDGET_KEY
+
+
+def test_cache_roundtrip(monkeypatch, tmp_path):
+    site_dir = tmp_path / 'site'
+    make_distribution(site_dir, 'dist_a', '1.0',
+                      {WIDGET_KEY: {'WidgetA': 'mod_a:WidgetA'}})
+    path = [str(site_dir)]
+
+    core = pyqt_designer_plugin_entry_points.core
+    table = core.get_entry_point_table(path=path, use_cache=True)
+    (entry, ) = table[WIDGET_KEY]
+    assert (entry.name, entry.module_name, entry.object_name) == (
+        'WidgetA', 'mod_a', 'WidgetA')
+
+    def no_scan(path=None, backend=None, profile=None):
+        raise RuntimeError('Should have used the cache')
+
+    # A warm start should not walk the distributions at all
+    monkeypatch.setattr(core, 'scan_entry_points', no_scan)
+    table = core.get_entry_point_table(path=path, use_cache=True)
+    (entry, ) = table[WIDGET_KEY]
+    assert entry.name == 'WidgetA'
+    assert (entry.distro.name, entry.distro.version) == ('dist_a', '1.0')
+
+
+def test_cache_fingerprint_changes(tmp_path):
+    site_dir = tmp_path / 'site'
+    make_distribution(site_dir, 'dist_a', '1.0',
+                      {WIDGET_KEY: {'WidgetA': 'mod_a:WidgetA'}})
+    path = [str(site_dir)]
+
+    fingerprint = cache.compute_fingerprint(path=path)
+    assert fingerprint == cache.compute_fingerprint(path=path)
+
+    make_distribution(site_dir, 'dist_b', '1.0',
+                      {WIDGET_KEY: {'WidgetB': 'mod_b:WidgetB'}})
+    assert fingerprint != cache.compute_fingerprint(path=path)
+
+    assert cache.load_table(fingerprint) is None
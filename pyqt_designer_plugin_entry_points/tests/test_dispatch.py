@@ -0,0 +1,196 @@
+import logging
+import time
+
+import pytest
+from PyQt5 import QtCore, QtWidgets
+
+import pyqt_designer_plugin_entry_points
+from .. import core, dispatch
+from . import conftest
+
+logger = logging.getLogger(__name__)
+
+EVENT_KEY = core.ENTRYPOINT_EVENT_KEY
+
+
+def process_events(duration):
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        QtWidgets.QApplication.processEvents()
+        time.sleep(0.001)
+
+
+class Emitter(QtCore.QObject):
+    changed = QtCore.pyqtSignal(str, object)
+
+
+def test_policies():
+    def hook(*args):
+        ...
+
+    assert dispatch.get_policy(hook).kind == dispatch.IMMEDIATE
+    assert dispatch.make_dispatcher(hook) is hook
+
+    assert dispatch.get_policy(dispatch.batch(hook)).kind == dispatch.BATCH
+    policy = dispatch.get_policy(dispatch.debounce(50)(hook))
+    assert policy.kind == dispatch.DEBOUNCE
+    assert policy.delay_ms == 50
+
+    with pytest.raises(ValueError):
+        dispatch.DispatchPolicy('sometimes')
+
+
+def test_debounce(qapp):
+    calls = []
+
+    @dispatch.debounce(20)
+    def hook(name, value):
+        calls.append((name, value))
+
+    emitter = Emitter()
+    emitter.changed.connect(dispatch.make_dispatcher(hook, parent=emitter))
+    for value in range(100):
+        emitter.changed.emit('value', value)
+
+    assert calls == []
+    process_events(0.2)
+    assert calls == [('value', 99)]
+
+
+def test_batch(qapp):
+    calls = []
+
+    @dispatch.batch
+    def hook(events):
+        calls.append(events)
+
+    emitter = Emitter()
+    emitter.changed.connect(dispatch.make_dispatcher(hook, parent=emitter))
+    for value in range(3):
+        emitter.changed.emit('value', value)
+
+    process_events(0.05)
+    assert calls == [[('value', 0), ('value', 1), ('value', 2)]]
+
+    emitter.changed.emit('other', None)
+    process_events(0.05)
+    assert calls[1:] == [[('other', None)]]
+
+
+def test_connect_events_policy(monkeypatch, hook_dispatchers):
+    calls = []
+
+    @dispatch.debounce(10)
+    def property_changed(name, value):
+        calls.append((name, value))
+
+    signal_name = 'propertyChanged'
+    conftest.patch_entrypoint(
+        monkeypatch,
+        {f'{EVENT_KEY}.{signal_name}': dict(property_changed=property_changed)}
+    )
+
+    results = pyqt_designer_plugin_entry_points.connect_events()
+    assert results['connected'][signal_name] == 1
+    assert property_changed._entrypoint_signal_connected[signal_name]
+
+    hooks = core.get_designer_hooks()
+    for value in range(10):
+        hooks.propertyChanged.emit('text', value)
+    process_events(0.1)
+    assert calls == [('text', 9)]
+
+
+def test_error_isolation(caplog):
+    calls = []
+
+    def failing(value):
+        raise ValueError(value)
+
+    dispatcher = dispatch.SignalDispatcher(
+        'formChanged', budget=dispatch.HookBudget(max_errors=3))
+    failing_handler = dispatcher.add(failing)
+    handler = dispatcher.add(calls.append, name='append')
+
+    for value in range(5):
+        dispatcher(value)
+
+    assert calls == [0, 1, 2, 3, 4]
+    assert handler.calls == 5
+    assert handler.errors == 0
+    assert handler.total_time >= handler.max_time > 0
+    assert failing_handler.calls == 3
+    assert failing_handler.errors == 3
+    assert failing_handler.disabled
+    assert 'Disabled designer formChanged hook' in caplog.text
+
+    failing_handler.enable()
+    dispatcher(5)
+    assert failing_handler.calls == 4
+    assert not failing_handler.disabled
+
+
+def test_slow_hook_disabled():
+    budget = dispatch.HookBudget(slow_ms=5, max_slow=2, max_errors=0)
+    dispatcher = dispatch.SignalDispatcher('formChanged', budget=budget)
+    durations = [0.02, 0, 0.02, 0.02, 0.02]
+
+    def hook():
+        duration = durations.pop(0)
+        if duration:
+            time.sleep(duration)
+
+    handler = dispatcher.add(hook)
+    for _ in range(5):
+        dispatcher()
+
+    # The fast call broke the first streak of slow calls
+    assert handler.calls == 4
+    assert handler.slow_calls == 3
+    assert handler.max_time >= 0.02
+    assert handler.disabled
+    assert handler.to_dict()['disabled_reason'] == (
+        '2 calls in a row over 5 ms')
+
+
+def test_connect_events_stats(monkeypatch, hook_dispatchers):
+    def form_changed(form):
+        raise RuntimeError('hook failure')
+
+    signal_name = 'formChanged'
+    conftest.patch_entrypoint(
+        monkeypatch,
+        {f'{EVENT_KEY}.{signal_name}': dict(form_changed=form_changed)}
+    )
+
+    results = pyqt_designer_plugin_entry_points.connect_events()
+    (handler, ) = results['handlers'][signal_name]
+    assert handler.name == 'form_changed'
+
+    core.get_designer_hooks().formChanged.emit(QtCore.QObject())
+    assert handler.calls == 1
+    assert handler.errors == 1
+    assert hook_dispatchers[signal_name].handlers == [handler]
+
+
+def test_extra_arguments_dropped(qapp):
+    calls = []
+
+    def no_args():
+        calls.append(())
+
+    def one_arg(name):
+        calls.append((name, ))
+
+    def any_args(*args):
+        calls.append(args)
+
+    emitter = Emitter()
+    dispatcher = dispatch.SignalDispatcher('propertyChanged', parent=emitter)
+    emitter.changed.connect(dispatcher)
+    handlers = [dispatcher.add(hook) for hook in (no_args, one_arg, any_args)]
+    emitter.changed.emit('text', 1)
+
+    assert calls == [(), ('text', ), ('text', 1)]
+    assert [handler.errors for handler in handlers] == [0, 0, 0]
+    assert dispatch.get_max_args(calls.append) in (1, None)
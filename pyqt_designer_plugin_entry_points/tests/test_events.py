@@ -1,5 +1,7 @@
 import logging
 
+import entrypoints
+
 import pyqt_designer_plugin_entry_points
 
 from . import conftest
@@ -9,7 +11,7 @@ logger = logging.getLogger(__name__)
 EVENT_KEY = pyqt_designer_plugin_entry_points.core.ENTRYPOINT_EVENT_KEY
 
 
-def test_events(monkeypatch):
+def test_events(monkeypatch, hook_dispatchers):
     def callable(arg):
         ...
 
@@ -25,3 +27,32 @@ def test_events(monkeypatch):
     assert results['discovered'][signal_name] == 1
     assert results['connected'][signal_name] == 1
     assert callable._entrypoint_signal_connected[signal_name]
+
+
+def test_single_pass_scan(monkeypatch, tmp_path):
+    core = pyqt_designer_plugin_entry_points.core
+    site_dir = tmp_path / 'site'
+    conftest.make_distribution(
+        site_dir, 'dist_a', '1.0',
+        {core.ENTRYPOINT_WIDGET_KEY: {'WidgetA': 'mod_a:WidgetA'},
+         f'{EVENT_KEY}.formWindowAdded': {'hook_a': 'mod_a:form_added'},
+         f'{EVENT_KEY}.formEditorSet': {'hook_b': 'mod_a:editor_set'},
+         'console_scripts': {'script_a': 'mod_a:main'},
+         }
+    )
+
+    calls = []
+    iter_files_distros = entrypoints.iter_files_distros
+
+    def counting_iter_files_distros(*args, **kwargs):
+        calls.append(args)
+        yield from iter_files_distros(*args, **kwargs)
+
+    monkeypatch.setattr(entrypoints, 'iter_files_distros',
+                        counting_iter_files_distros)
+
+    table = core.get_entry_point_table(path=[str(site_dir)])
+    assert len(calls) == 1
+    assert set(table) == {core.ENTRYPOINT_WIDGET_KEY,
+                          f'{EVENT_KEY}.formWindowAdded',
+                          f'{EVENT_KEY}.formEditorSet'}
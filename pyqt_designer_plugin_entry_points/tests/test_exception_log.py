@@ -0,0 +1,76 @@
+import json
+import logging
+import threading
+
+from .. import core, exception_log, exceptions
+from .test_exceptions import get_exc_info
+
+logger = logging.getLogger(__name__)
+
+
+def read_records(filename):
+    return [json.loads(line) for line in filename.read_text().splitlines()]
+
+
+def test_sink_rotation(tmp_path):
+    filename = tmp_path / 'exceptions.jsonl'
+    sink = exception_log.ExceptionLogSink(str(filename), max_bytes=200,
+                                          backup_count=2, echo=False)
+    try:
+        for idx in range(10):
+            sink.put(dict(index=idx, padding='x' * 50))
+            assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'exceptions.jsonl', 'exceptions.jsonl.1', 'exceptions.jsonl.2']
+    assert all(path.stat().st_size <= 200 for path in tmp_path.iterdir())
+    assert read_records(filename)[-1]['index'] == 9
+
+
+def test_sink_drops_oldest(tmp_path):
+    filename = tmp_path / 'exceptions.jsonl'
+    sink = exception_log.ExceptionLogSink(str(filename), queue_size=3,
+                                          echo=False)
+    # Hold the writer thread while the queue overflows
+    started = threading.Event()
+    release = threading.Event()
+    write = sink._write
+    sink._write = lambda *args: (started.set(), release.wait(5),
+                                 write(*args))
+    try:
+        sink.put(dict(index=-1))
+        assert started.wait(5)
+        for idx in range(10):
+            sink.put(dict(index=idx))
+        release.set()
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    records = read_records(filename)
+    assert records[0]['index'] == -1
+    assert records[1]['dropped'] == 7
+    assert [record['index'] for record in records[2:]] == [7, 8, 9]
+
+
+def test_hooks_exception_log(monkeypatch, qapp, tmp_path, capsys):
+    filename = tmp_path / 'exceptions.jsonl'
+    sink = exception_log.ExceptionLogSink(str(filename))
+    hooks = core.get_designer_hooks()
+    monkeypatch.setattr(hooks, 'exception_sink', sink)
+    monkeypatch.setattr(hooks, 'exception_throttle',
+                        exceptions.ExceptionThrottle())
+    try:
+        hooks._handle_exceptions(*get_exc_info('logged error'))
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    record, = read_records(filename)
+    assert record['exc_type'] == 'builtins.ValueError'
+    assert record['message'] == 'logged error'
+    assert record['form'] is None
+    assert 'raise_error' in record['traceback']
+    assert 'Uncaught exception' in capsys.readouterr().err
@@ -0,0 +1,142 @@
+import gc
+import logging
+import sys
+import weakref
+
+import pytest
+
+from .. import core, exceptions
+
+logger = logging.getLogger(__name__)
+
+
+def raise_error(message):
+    raise ValueError(message)
+
+
+def get_exc_info(message='error'):
+    try:
+        raise_error(message)
+    except ValueError:
+        return sys.exc_info()
+
+
+def test_fingerprint():
+    first = exceptions.get_fingerprint(*get_exc_info('first'))
+    assert first == exceptions.get_fingerprint(*get_exc_info('second'))
+    assert first[0] == 'builtins.ValueError'
+    assert first[3] == 'raise_error'
+    assert 'raise_error' in exceptions.format_fingerprint(first)
+
+
+def test_record_mapping():
+    record = exceptions.ExceptionRecord(*get_exc_info('mapping'))
+    assert 'traceback' in record
+    assert 'value' not in record
+    assert record.get('message') == 'mapping'
+    assert record.get('value') is None
+    assert record['exc_type'] is ValueError
+    assert 'raise_error' in record['traceback']
+
+    as_dict = dict(record)
+    assert set(as_dict) == set(record.keys())
+    assert as_dict['count'] == 1
+
+    with pytest.raises(KeyError, match='uncaughtExceptionRaisedRaw'):
+        record['trace']
+
+
+def test_throttle():
+    throttle = exceptions.ExceptionThrottle(full_reports=3, rate=1.0,
+                                            global_rate=2.0)
+    fp_a, fp_b, fp_c = ('a', '', 0, ''), ('b', '', 0, ''), ('c', '', 0, '')
+
+    # Per-fingerprint rate limit
+    assert throttle.should_report(fp_a, now=0.0)
+    assert not throttle.should_report(fp_a, now=0.1)
+    assert throttle.should_report(fp_a, now=1.1)
+    # Global rate limit
+    assert throttle.should_report(fp_b, now=1.2)
+    assert not throttle.should_report(fp_c, now=1.3)
+    # Only the first few are reported
+    assert throttle.should_report(fp_a, now=10.0)
+    assert not throttle.should_report(fp_a, now=20.0)
+
+    assert throttle.take_suppressed() == {fp_a: (2, 5), fp_c: (1, 1)}
+    assert throttle.take_suppressed() == {}
+
+
+def test_handle_exceptions(monkeypatch, qapp, capsys):
+    hooks = core.get_designer_hooks()
+    monkeypatch.setattr(hooks, 'exception_throttle',
+                        exceptions.ExceptionThrottle(full_reports=2,
+                                                     rate=100.0))
+    reports = []
+    hooks.uncaughtExceptionRaised.connect(reports.append)
+    try:
+        for idx in range(10):
+            hooks._handle_exceptions(*get_exc_info(f'error {idx}'))
+    finally:
+        hooks.uncaughtExceptionRaised.disconnect(reports.append)
+
+    assert [report['count'] for report in reports] == [1, 2]
+    assert capsys.readouterr().err.count('Uncaught exception') == 2
+
+    hooks._exception_summary_timer.stop()
+    hooks._report_suppressed_exceptions()
+    assert 'Suppressed 8 repeat(s) of builtins.ValueError' in (
+        capsys.readouterr().err)
+
+
+class LargeWidget:
+    """Stands in for a widget referenced from a raising frame."""
+
+
+def raise_with_local(ref_list):
+    widget = LargeWidget()
+    ref_list.append(weakref.ref(widget))
+    raise RuntimeError('paint failed')
+
+
+def test_record_frames_collectable(monkeypatch, qapp):
+    hooks = core.get_designer_hooks()
+    monkeypatch.setattr(hooks, 'exception_throttle',
+                        exceptions.ExceptionThrottle())
+    monkeypatch.setattr(hooks, '_write_exception_report',
+                        lambda *args: None)
+    records = []
+    refs = []
+    hooks.uncaughtExceptionRaised.connect(records.append)
+    try:
+        try:
+            raise_with_local(refs)
+        except RuntimeError:
+            hooks._handle_exceptions(*sys.exc_info())
+    finally:
+        hooks.uncaughtExceptionRaised.disconnect(records.append)
+
+    gc.collect()
+    # The hook kept the record, but not the frame or its locals
+    assert refs[0]() is None
+    record, = records
+    assert record.type_name == 'builtins.RuntimeError'
+    assert record.frames[-1][2] == 'raise_with_local'
+    assert record['traceback'] == record.traceback
+    assert "raise RuntimeError('paint failed')" in record.traceback
+
+
+def test_raw_exception_signal(monkeypatch, qapp):
+    hooks = core.get_designer_hooks()
+    monkeypatch.setattr(hooks, 'exception_throttle',
+                        exceptions.ExceptionThrottle())
+    monkeypatch.setattr(hooks, '_write_exception_report',
+                        lambda *args: None)
+    raw = []
+    hooks.uncaughtExceptionRaisedRaw.connect(raw.append)
+    try:
+        exc_info = get_exc_info('raw')
+        hooks._handle_exceptions(*exc_info)
+    finally:
+        hooks.uncaughtExceptionRaisedRaw.disconnect(raw.append)
+
+    assert raw == [exc_info]
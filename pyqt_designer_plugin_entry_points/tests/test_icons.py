@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+from PyQt5 import QtCore, QtGui
+
+from .. import cache, icons
+
+logger = logging.getLogger(__name__)
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    '<rect width="10" height="10" fill="red"/></svg>'
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_icons():
+    icons.clear()
+    yield
+    icons.clear()
+
+
+def test_shared_icons(qapp, tmp_path):
+    filename = tmp_path / 'icon.png'
+    image = QtGui.QImage(8, 8, QtGui.QImage.Format_ARGB32)
+    image.fill(QtCore.Qt.blue)
+    image.save(str(filename))
+
+    icon = icons.get_icon(str(filename))
+    assert icons.get_icon(str(tmp_path / '.' / 'icon.png')) is icon
+    assert not icon.isNull()
+    assert icons.get_icon(None).isNull()
+    assert icons.get_icon(icon) is icon
+
+
+def test_svg_raster_cache(monkeypatch, qapp, tmp_path):
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, '1')
+    filename = tmp_path / 'icon.svg'
+    filename.write_text(SVG)
+    raster_dir = tmp_path / 'cache' / 'icons'
+
+    icon = icons.get_icon(str(filename))
+    # Nothing is decoded until a pixmap is requested
+    assert not raster_dir.exists()
+
+    pixmap = icon.pixmap(16, 16)
+    assert pixmap.size() == QtCore.QSize(16, 16)
+    assert pixmap.toImage().pixelColor(8, 8) == QtGui.QColor('red')
+    assert len(list(raster_dir.glob('*-16.png'))) == 1
+
+    # A new session reads the rasterized pixmap
+    icons.clear()
+    monkeypatch.setattr(icons, '_render_svg', None)
+    pixmap = icons.get_icon(str(filename)).pixmap(16, 16)
+    assert pixmap.toImage().pixelColor(8, 8) == QtGui.QColor('red')
@@ -0,0 +1,52 @@
+import json
+import logging
+import time
+
+from PyQt5 import QtWidgets
+
+from .. import core, latency
+
+logger = logging.getLogger(__name__)
+
+
+def test_histogram():
+    histogram = latency.LatencyHistogram()
+    for elapsed in [0.001] * 95 + [0.5] * 5:
+        histogram.add(elapsed)
+
+    assert histogram.count == 100
+    assert histogram.max == 0.5
+    assert 0.001 <= histogram.percentile(0.5) < 0.002
+    assert 0.001 <= histogram.percentile(0.95) < 0.002
+    assert histogram.percentile(0.99) == 0.5
+
+
+def test_create_widget_stats(monkeypatch, qapp, caplog, tmp_path):
+    class SlowInitWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            return {}
+
+        def init_for_designer(self, info):
+            time.sleep(0.02)
+
+    stats = latency.WidgetStats(slow_threshold=0.01)
+    monkeypatch.setattr(core.get_designer_hooks(), 'widget_stats', stats)
+
+    plugin = core.DesignerPluginWrapper.from_class(SlowInitWidget)()
+    widgets = [plugin.createWidget(None) for _ in range(3)]
+
+    results = core.get_designer_hooks().widget_stats.to_dict()
+    assert set(results['SlowInitWidget']) == {'constructor', 'init'}
+    assert results['SlowInitWidget']['init']['count'] == 3
+    assert results['SlowInitWidget']['init']['mean'] >= 0.02
+    assert 'Slow init of SlowInitWidget' in caplog.text
+    assert 'Slow constructor' not in caplog.text
+
+    filename = tmp_path / 'stats.json'
+    stats.dump(str(filename))
+    assert json.loads(filename.read_text()) == json.loads(
+        json.dumps(results))
+
+    for widget in widgets:
+        widget.deleteLater()
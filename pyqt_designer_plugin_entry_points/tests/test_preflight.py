@@ -0,0 +1,58 @@
+import logging
+import os
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import preflight
+
+from .conftest import make_distribution
+
+logger = logging.getLogger(__name__)
+
+core = pyqt_designer_plugin_entry_points.core
+WIDGET_KEY = core.ENTRYPOINT_WIDGET_KEY
+EVENT_KEY = core.ENTRYPOINT_EVENT_KEY
+
+
+def test_preflight(monkeypatch, tmp_path):
+    site_dir = tmp_path / 'site'
+    make_distribution(
+        site_dir, 'preflight_dist', '1.0',
+        {WIDGET_KEY: {'good': 'preflight_good:Widget',
+                      'broken': 'preflight_broken:Widget',
+                      'crash': 'preflight_crash:Widget',
+                      'hang': 'preflight_hang:Widget'},
+         f'{EVENT_KEY}.formWindowAdded': {'hook': 'preflight_good:hook'},
+         })
+    (site_dir / 'preflight_good.py').write_text(
+        'Widget = object\n\n\ndef hook(form):\n    ...\n')
+    (site_dir / 'preflight_broken.py').write_text(
+        'raise ImportError("missing compiled dependency")\n')
+    (site_dir / 'preflight_crash.py').write_text(
+        'import os\nos.abort()\n')
+    (site_dir / 'preflight_hang.py').write_text(
+        'import time\ntime.sleep(60)\n')
+    monkeypatch.syspath_prepend(str(site_dir))
+
+    table = core.get_entry_point_table(path=[str(site_dir)])
+    verdicts = preflight.run_preflight(table, processes=5, timeout=5)
+    statuses = {verdict['name']: verdict['status']
+                for verdict in verdicts.values()}
+    assert statuses == dict(good='ok', hook='ok', broken='failed',
+                            crash='crashed', hang='timeout')
+
+    filtered = preflight.filter_table(table, verdicts)
+    assert [entry.name for entry in filtered[WIDGET_KEY]] == ['good']
+    assert len(filtered[f'{EVENT_KEY}.formWindowAdded']) == 1
+
+    # Verdicts are reused while the distribution is unchanged
+    preflight.save_verdicts(verdicts)
+    manifest_filename = preflight.get_manifest_filename()
+    assert os.listdir(os.path.dirname(manifest_filename)) == [
+        os.path.basename(manifest_filename)]
+
+    def no_check(row, timeout=None):
+        raise RuntimeError('Should have reused the verdict')
+
+    monkeypatch.setattr(preflight, 'check_entry', no_check)
+    filtered = preflight.apply_preflight(table, enabled=True)
+    assert [entry.name for entry in filtered[WIDGET_KEY]] == ['good']
@@ -0,0 +1,110 @@
+import json
+import logging
+
+import pytest
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import profiles
+
+from .conftest import make_distribution
+
+logger = logging.getLogger(__name__)
+
+core = pyqt_designer_plugin_entry_points.core
+WIDGET_KEY = core.ENTRYPOINT_WIDGET_KEY
+EVENT_KEY = core.ENTRYPOINT_EVENT_KEY
+
+
+def summarize(table):
+    return {group: sorted(entry.name for entry in entries)
+            for group, entries in table.items() if entries}
+
+
+@pytest.fixture
+def site_path(tmp_path):
+    site_dir = tmp_path / 'site'
+    make_distribution(site_dir, 'beamline_a', '1.0',
+                      {WIDGET_KEY: {'BeamlineAMotor': 'bl_a:Motor',
+                                    'Unrelated': 'bl_a:Unrelated'},
+                       f'{EVENT_KEY}.formWindowAdded': {
+                           'hook_a': 'bl_a:form_added'},
+                       f'{EVENT_KEY}.formEditorSet': {
+                           'editor_a': 'bl_a:editor_set'}})
+    make_distribution(site_dir, 'beamline_b', '1.0',
+                      {WIDGET_KEY: {'BeamlineBMotor': 'bl_b:Motor'}})
+    return [str(site_dir)]
+
+
+@pytest.fixture
+def profiles_file(monkeypatch, tmp_path):
+    filename = tmp_path / 'profiles.json'
+    filename.write_text(json.dumps({
+        'beamline_a': {
+            'distributions': ['Beamline-A'],
+            'entries': ['BeamlineA*', 'hook_*'],
+            'signals': ['formWindowAdded'],
+        },
+        'everything': {},
+    }))
+    monkeypatch.setenv(profiles.PROFILES_FILE_ENV_VAR, str(filename))
+    return filename
+
+
+@pytest.mark.parametrize('backend', ['entrypoints', 'importlib'])
+def test_profile_scan(monkeypatch, site_path, profiles_file, backend):
+    monkeypatch.setenv(profiles.PROFILE_ENV_VAR, 'beamline_a')
+    table = core.get_entry_point_table(path=site_path, backend=backend)
+    assert summarize(table) == {
+        WIDGET_KEY: ['BeamlineAMotor'],
+        f'{EVENT_KEY}.formWindowAdded': ['hook_a'],
+    }
+
+
+def test_profile_unrestricted(site_path, profiles_file):
+    table = core.get_entry_point_table(path=site_path, profile='everything')
+    assert summarize(table) == summarize(
+        core.get_entry_point_table(path=site_path))
+    assert summarize(table)[WIDGET_KEY] == [
+        'BeamlineAMotor', 'BeamlineBMotor', 'Unrelated']
+
+
+def test_unknown_profile(site_path, profiles_file, caplog):
+    table = core.get_entry_point_table(path=site_path, profile='unknown')
+    assert 'not defined' in caplog.text
+    assert len(table[WIDGET_KEY]) == 3
+
+
+def test_profile_cache_key(monkeypatch, site_path, profiles_file):
+    monkeypatch.setenv(core.cache.CACHE_ENV_VAR, '1')
+    restricted = core.get_entry_point_table(path=site_path,
+                                            profile='beamline_a')
+    unrestricted = core.get_entry_point_table(path=site_path)
+    assert summarize(restricted) != summarize(unrestricted)
+
+
+def test_profile_keeps_manifest(monkeypatch, tmp_path, profiles_file):
+    site_dir = tmp_path / 'manifest_site'
+    package_dir = site_dir / 'bl_a_manifest'
+    package_dir.mkdir(parents=True)
+    (package_dir / '__init__.py').write_text('')
+    (package_dir / 'designer.json').write_text(json.dumps({
+        'BeamlineAGauge': {'group': 'Beamline A', 'is_container': True}}))
+    make_distribution(
+        site_dir, 'beamline_a', '1.0',
+        {WIDGET_KEY: {'BeamlineAGauge': 'bl_a_manifest.widgets:Gauge',
+                      'Unrelated': 'bl_a_manifest.widgets:Unrelated'},
+         core.ENTRYPOINT_MANIFEST_KEY: {
+             'designer': 'bl_a_manifest:designer.json'}})
+    monkeypatch.syspath_prepend(str(site_dir))
+
+    table = core.get_entry_point_table(path=[str(site_dir)],
+                                       profile='beamline_a')
+    assert summarize(table) == {
+        WIDGET_KEY: ['BeamlineAGauge'],
+        core.ENTRYPOINT_MANIFEST_KEY: ['designer'],
+    }
+
+    widgets = core.enumerate_widgets(table=table, lazy=True)
+    plugin = widgets['BeamlineAGauge']()
+    assert plugin.group() == 'Beamline A'
+    assert plugin.isContainer()
@@ -0,0 +1,45 @@
+import logging
+
+import entrypoints
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import quarantine
+
+from . import conftest
+
+logger = logging.getLogger(__name__)
+
+WIDGET_KEY = pyqt_designer_plugin_entry_points.core.ENTRYPOINT_WIDGET_KEY
+
+
+def test_quarantine(monkeypatch, caplog):
+    monkeypatch.setenv(quarantine.QUARANTINE_ENV_VAR, '1')
+    conftest.patch_entrypoint(
+        monkeypatch, {WIDGET_KEY: dict(broken=ImportError('missing lib'))}
+    )
+    table = pyqt_designer_plugin_entry_points.core.get_entry_point_table()
+    (entry, ) = table[WIDGET_KEY]
+    enumerate_widgets = pyqt_designer_plugin_entry_points.enumerate_widgets
+
+    assert enumerate_widgets(table=table) == {}
+    assert entry.load_count == 1
+
+    # Known-bad entries are skipped with a one-line summary
+    caplog.clear()
+    assert enumerate_widgets(table=table) == {}
+    assert entry.load_count == 1
+    (record, ) = caplog.records
+    assert 'ImportError: missing lib' in record.getMessage()
+    assert record.exc_info is None
+
+    # Upgrading the distribution releases the entry
+    entry.distro = entrypoints.Distribution('test_distribution', '1.1')
+    assert enumerate_widgets(table=table) == {}
+    assert entry.load_count == 2
+    assert enumerate_widgets(table=table) == {}
+    assert entry.load_count == 2
+
+    # As does an explicit retry
+    quarantine.clear(['test_distribution'])
+    assert enumerate_widgets(table=table) == {}
+    assert entry.load_count == 3
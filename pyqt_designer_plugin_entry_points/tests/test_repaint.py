@@ -0,0 +1,174 @@
+import gc
+import logging
+import time
+
+import pytest
+from PyQt5 import QtCore, QtWidgets
+
+from .. import core, repaint
+
+logger = logging.getLogger(__name__)
+
+
+class FakeCursor:
+    def __init__(self, widgets):
+        self.widgets = widgets
+
+    def selectedWidgetCount(self):
+        return len(self.widgets)
+
+    def selectedWidget(self, idx):
+        return self.widgets[idx]
+
+
+class FakeFormWindow(QtWidgets.QWidget):
+    changed = QtCore.pyqtSignal()
+    geometryChanged = QtCore.pyqtSignal()
+    selectionChanged = QtCore.pyqtSignal()
+    widgetManaged = QtCore.pyqtSignal(QtWidgets.QWidget)
+    widgetRemoved = QtCore.pyqtSignal(QtWidgets.QWidget)
+
+    def __init__(self):
+        super().__init__()
+        self.container = QtWidgets.QWidget(self)
+        self.children_ = [QtWidgets.QWidget(self.container)
+                          for _ in range(3)]
+        self.selected = []
+
+    def mainContainer(self):
+        return self.container
+
+    def cursor(self):
+        return FakeCursor(self.selected)
+
+
+class FakeFormWindowManager(QtCore.QObject):
+    formWindowAdded = QtCore.pyqtSignal(QtCore.QObject)
+    formWindowRemoved = QtCore.pyqtSignal(QtCore.QObject)
+    activeFormWindowChanged = QtCore.pyqtSignal(QtCore.QObject)
+
+    def formWindowCount(self):
+        return 0
+
+
+class FakePropertyEditor(QtCore.QObject):
+    propertyChanged = QtCore.pyqtSignal(str, object)
+
+    def __init__(self):
+        super().__init__()
+        self.current = None
+
+    def object(self):
+        return self.current
+
+
+class FakeFormEditor:
+    def __init__(self):
+        self.manager = FakeFormWindowManager()
+        self.editor = FakePropertyEditor()
+
+    def formWindowManager(self):
+        return self.manager
+
+    def propertyEditor(self):
+        return self.editor
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = repaint.RepaintScheduler()
+    form_editor = FakeFormEditor()
+    scheduler.attach(form_editor)
+    form = FakeFormWindow()
+    form_editor.manager.formWindowAdded.emit(form)
+    scheduler.flush()
+    yield scheduler, form_editor, form
+    form.deleteLater()
+
+
+def test_repaint_affected_widgets(scheduler):
+    scheduler, form_editor, form = scheduler
+    widget_a, widget_b, widget_c = form.children_
+
+    form_editor.editor.current = widget_a
+    form_editor.editor.propertyChanged.emit('text', 'value')
+    assert scheduler.pending == {widget_a}
+
+    form.widgetManaged.emit(widget_b)
+    assert scheduler.pending == {widget_a, widget_b}
+    scheduler.flush()
+    assert scheduler.pending == set()
+
+    form.selected = [widget_c]
+    form.selectionChanged.emit()
+    form.selected = [widget_a]
+    form.selectionChanged.emit()
+    assert scheduler.pending == {widget_a, widget_c}
+    scheduler.flush()
+
+    form.widgetRemoved.emit(widget_b)
+    assert scheduler.pending == {form.container}
+
+
+def test_repaint_coalesced(scheduler, monkeypatch):
+    scheduler, form_editor, form = scheduler
+    updated = []
+    monkeypatch.setattr(repaint, '_is_application_active', lambda: True)
+    for widget in form.children_:
+        monkeypatch.setattr(widget, 'update',
+                            lambda widget=widget: updated.append(widget))
+
+    for _ in range(3):
+        for widget in form.children_:
+            form.widgetManaged.emit(widget)
+
+    QtWidgets.QApplication.processEvents()
+    assert sorted(map(id, updated)) == sorted(map(id, form.children_))
+
+
+def test_preview_scheduler(monkeypatch, qapp):
+    updated = []
+
+    class StripChart(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            return dict(preview_rate=1000)
+
+        def update(self):
+            updated.append(self)
+
+    class AlarmIndicator(StripChart):
+        @classmethod
+        def get_designer_info(cls):
+            return dict(preview_rate=2)
+
+    hooks = core.get_designer_hooks()
+    scheduler = repaint.PreviewScheduler(max_rate=20)
+    monkeypatch.setattr(hooks, '_preview_scheduler', scheduler)
+    monkeypatch.setattr(repaint.QtWidgets.QWidget, 'isVisible',
+                        lambda self: True)
+
+    charts = [core.DesignerPluginWrapper.from_class(StripChart)()
+              .createWidget(None) for _ in range(3)]
+    indicator = core.DesignerPluginWrapper.from_class(AlarmIndicator)(
+    ).createWidget(None)
+    static = QtWidgets.QWidget()
+    assert set(scheduler.widgets) == set(charts + [indicator])
+    assert scheduler.interval == 0.05
+    assert scheduler._timer.interval() == 50
+    assert static not in scheduler.widgets
+
+    scheduler.tick()
+    time.sleep(0.05)
+    scheduler.tick()
+    # The indicator is only due every 0.5 s
+    assert len(updated) == 2 * len(charts) + 1
+    assert updated.count(indicator) == 1
+    del updated[:]
+
+    del charts, indicator
+    gc.collect()
+    scheduler.tick()
+    assert scheduler.widgets == []
+    assert scheduler.interval is None
+    assert not scheduler._timer.isActive()
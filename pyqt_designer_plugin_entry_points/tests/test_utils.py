@@ -0,0 +1,43 @@
+import json
+import logging
+import os
+
+import pytest
+
+from ..utils import atomic_write_json, env_number
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = 'PYQT_DESIGNER_PLUGIN_TEST_NUMBER'
+
+
+@pytest.mark.parametrize(
+    'value, kwargs, expected, invalid',
+    [('', {}, 5, False),
+     ('2.5', {}, 2.5, False),
+     ('3', dict(type_=int), 3, False),
+     ('2.5', dict(type_=int), 5, True),
+     ('many', {}, 5, True),
+     ('-1', dict(minimum=0), 5, True),
+     ('0', dict(minimum=0), 0.0, False),
+     ])
+def test_env_number(monkeypatch, caplog, value, kwargs, expected, invalid):
+    monkeypatch.setenv(ENV_VAR, value)
+    number = env_number(ENV_VAR, 5, **kwargs)
+    assert number == expected
+    assert type(number) is type(expected)
+    assert ('Invalid' in caplog.text) == invalid
+
+
+def test_atomic_write_json(tmp_path):
+    filename = str(tmp_path / 'subdir' / 'data.json')
+    atomic_write_json(filename, dict(value=1))
+    with open(filename) as f:
+        assert json.load(f) == dict(value=1)
+
+    # A failed write leaves the previous file, and no temporary file
+    with pytest.raises(TypeError):
+        atomic_write_json(filename, dict(value=object()))
+    with open(filename) as f:
+        assert json.load(f) == dict(value=1)
+    assert os.listdir(os.path.dirname(filename)) == ['data.json']
@@ -0,0 +1,99 @@
+import logging
+import sys
+
+import pyqt_designer_plugin_entry_points
+from pyqt_designer_plugin_entry_points import preflight, watcher
+
+from .conftest import make_distribution
+
+logger = logging.getLogger(__name__)
+
+core = pyqt_designer_plugin_entry_points.core
+EVENT_KEY = core.ENTRYPOINT_EVENT_KEY
+
+
+def test_watcher_new_distribution(monkeypatch, tmp_path, qapp, caplog):
+    site_dir = tmp_path / 'site'
+    make_distribution(site_dir, 'dist_a', '1.0',
+                      {f'{EVENT_KEY}.uncaughtExceptionRaised': {
+                          'hook_a': 'watcher_test_hooks:hook_a'}})
+    (site_dir / 'watcher_test_hooks.py').write_text(
+        'calls = []\n\n\n'
+        'def hook_a(info):\n'
+        '    calls.append(("a", info))\n\n\n'
+        'def hook_b(info):\n'
+        '    calls.append(("b", info))\n'
+    )
+    monkeypatch.syspath_prepend(str(site_dir))
+    path = [str(site_dir)]
+
+    table = core.get_entry_point_table(path=path)
+    dist_watcher = watcher.DistributionWatcher(table=table, path=path)
+    assert dist_watcher.check(folders=path) == {}
+
+    # An upgrade of dist_a which also adds a new hook and widget
+    dist_info = make_distribution(
+        site_dir, 'dist_a', '2.0',
+        {f'{EVENT_KEY}.uncaughtExceptionRaised': {
+            'hook_a': 'watcher_test_hooks:hook_a',
+            'hook_b': 'watcher_test_hooks:hook_b'},
+         core.ENTRYPOINT_WIDGET_KEY: {
+             'NewWidget': 'watcher_test_widgets:NewWidget'}})
+    added = []
+    dist_watcher.widgetsAdded.connect(added.append)
+
+    # Not yet completely installed
+    assert dist_watcher.check(folders=path) == {}
+    (dist_info / 'RECORD').write_text('')
+
+    with caplog.at_level(logging.WARNING):
+        new_table = dist_watcher.check(folders=path)
+    (entry, ) = new_table[f'{EVENT_KEY}.uncaughtExceptionRaised']
+    assert entry.name == 'hook_b'
+    assert 'dist_a was upgraded to 2.0' in caplog.text
+    assert 'hook_a' in caplog.text
+
+    # New widgets are reported, but not imported
+    (widgets, ) = added
+    assert list(widgets) == ['NewWidget']
+    assert 'watcher_test_widgets' not in sys.modules
+
+    import watcher_test_hooks
+    hooks = core.get_designer_hooks()
+    try:
+        hooks.uncaughtExceptionRaised.emit({})
+        assert watcher_test_hooks.calls == [('b', {})]
+    finally:
+        hooks.get_hook_dispatcher('uncaughtExceptionRaised').remove(
+            watcher_test_hooks.hook_b)
+
+
+def test_watcher_preflight(monkeypatch, tmp_path, qapp, hook_dispatchers):
+    site_dir = tmp_path / 'site'
+    site_dir.mkdir()
+    path = [str(site_dir)]
+    dist_watcher = watcher.DistributionWatcher(table={}, path=path)
+
+    dist_info = make_distribution(
+        site_dir, 'dist_crash', '1.0',
+        {f'{EVENT_KEY}.formWindowAdded': {
+            'crash_hook': 'watcher_crash_hooks:hook'}})
+    (dist_info / 'RECORD').write_text('')
+
+    checked = []
+
+    def crashing_check(row, timeout=None):
+        checked.append(row['name'])
+        return dict(row, status=preflight.STATUS_CRASHED, elapsed=0.0,
+                    error='Worker exited with code -6')
+
+    monkeypatch.setenv(preflight.PREFLIGHT_ENV_VAR, '1')
+    monkeypatch.setattr(preflight, 'check_entry', crashing_check)
+    connected = []
+    dist_watcher.eventsConnected.connect(connected.append)
+
+    new_table = dist_watcher.check(folders=path)
+    assert list(new_table) == [f'{EVENT_KEY}.formWindowAdded']
+    assert checked == ['crash_hook']
+    assert connected == []
+    assert 'formWindowAdded' not in hook_dispatchers
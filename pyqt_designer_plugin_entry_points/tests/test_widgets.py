@@ -1,9 +1,14 @@
 import logging
+import sys
+import time
+from xml.etree import ElementTree
 
+import pytest
 from PyQt5 import QtWidgets
 
 import pyqt_designer_plugin_entry_points
 
+from ..report import LoadReport
 from . import conftest
 
 logger = logging.getLogger(__name__)
@@ -53,3 +58,310 @@ def test_invalid_designer_info(monkeypatch):
     )
 
     assert set(pyqt_designer_plugin_entry_points.enumerate_widgets()) == set()
+
+
+def test_lazy_widgets(monkeypatch, qapp):
+    class TestWidget(QtWidgets.QWidget):
+        """Test widget docstring"""
+        @classmethod
+        def get_designer_info(cls):
+            return dict(group='Group name')
+
+    conftest.patch_entrypoint(
+        monkeypatch, {WIDGET_KEY: dict(test_widget=TestWidget)}
+    )
+
+    table = pyqt_designer_plugin_entry_points.core.get_entry_point_table()
+    (entry, ) = table[WIDGET_KEY]
+    widgets = pyqt_designer_plugin_entry_points.enumerate_widgets(
+        table=table, lazy=True)
+    plugin = widgets['test_widget']()
+    assert plugin.name() == 'TestWidget'
+    assert plugin.includeFile() == TestWidget.__module__
+    assert not plugin.isContainer()
+    assert plugin.whatsThis() == ''
+    assert entry.load_count == 0
+
+    widget = plugin.createWidget(None)
+    assert isinstance(widget, TestWidget)
+    assert entry.load_count == 1
+    assert plugin.group() == 'Group name'
+    assert plugin.whatsThis() == 'Test widget docstring'
+
+
+def test_manifest_widgets(monkeypatch, tmp_path, qapp):
+    core = pyqt_designer_plugin_entry_points.core
+    site_dir = tmp_path / 'site'
+    package_dir = site_dir / 'manifest_test_pkg'
+    package_dir.mkdir(parents=True)
+    (package_dir / '__init__.py').write_text('')
+    (package_dir / 'widgets.py').write_text(
+        'from PyQt5 import QtWidgets\n\n\n'
+        'class ManifestWidget(QtWidgets.QWidget):\n'
+        '    ...\n'
+    )
+    (package_dir / 'designer.json').write_text(
+        '{"ManifestWidget": {"group": "Manifest group", '
+        '"tooltip": "Static tooltip", "whatsthis": "Static help", '
+        '"icon": "missing.png"}}'
+    )
+    conftest.make_distribution(
+        site_dir, 'manifest_test_dist', '1.0',
+        {WIDGET_KEY: {
+            'ManifestWidget': 'manifest_test_pkg.widgets:ManifestWidget'},
+         core.ENTRYPOINT_MANIFEST_KEY: {
+             'manifest': 'manifest_test_pkg:designer.json'},
+         }
+    )
+    monkeypatch.syspath_prepend(str(site_dir))
+
+    table = core.get_entry_point_table(path=[str(site_dir)])
+    widgets = pyqt_designer_plugin_entry_points.enumerate_widgets(
+        table=table, lazy=True)
+    plugin = widgets['ManifestWidget']()
+    assert plugin.group() == 'Manifest group'
+    assert plugin.toolTip() == 'Static tooltip'
+    assert plugin.whatsThis() == 'Static help'
+    assert plugin._info['icon'] == str(package_dir / 'missing.png')
+    assert 'manifest_test_pkg.widgets' not in sys.modules
+
+    # Importing the widget uses the manifest in place of get_designer_info()
+    widget = plugin.createWidget(None)
+    assert type(widget).__name__ == 'ManifestWidget'
+    assert plugin.toolTip() == 'Static tooltip'
+
+
+def test_parallel_widgets(monkeypatch, caplog):
+    def make_widget_class(idx):
+        class TestWidget(QtWidgets.QWidget):
+            @classmethod
+            def get_designer_info(cls):
+                return dict(group=f'Group {idx}')
+
+        return TestWidget
+
+    objects = {f'widget{idx}': make_widget_class(idx) for idx in range(8)}
+    objects['widget3'] = ImportError('broken widget')
+    conftest.patch_entrypoint(monkeypatch, {WIDGET_KEY: objects})
+
+    with caplog.at_level(logging.ERROR):
+        widgets = pyqt_designer_plugin_entry_points.enumerate_widgets(
+            parallel=4)
+
+    assert list(widgets) == [name for name in objects if name != 'widget3']
+    assert widgets['widget5']._info['group'] == 'Group 5'
+
+    (record, ) = caplog.records
+    assert record.getMessage() == f'Failed to load {WIDGET_KEY} entry: widget3'
+    assert record.exc_info[0] is ImportError
+
+
+def test_load_report(monkeypatch):
+    class TestWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            return {}
+
+    conftest.patch_entrypoint(
+        monkeypatch, {WIDGET_KEY: dict(test_widget=TestWidget,
+                                       broken_widget=ValueError())}
+    )
+
+    report = LoadReport(track_memory=True)
+    try:
+        pyqt_designer_plugin_entry_points.enumerate_widgets(report=report)
+    finally:
+        report.stop()
+
+    records = {(record.stage, record.name): record
+               for record in report.records}
+    assert set(records) == {('load', 'test_widget'), ('wrap', 'test_widget'),
+                            ('load', 'broken_widget')}
+    assert records[('load', 'broken_widget')].failed
+    assert records[('wrap', 'test_widget')].memory_delta is not None
+    assert 'broken_widget (failed)' in report.format_table()
+
+
+def test_startup_budget(monkeypatch, qapp):
+    class SlowWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            time.sleep(0.05)
+            return {}
+
+    objects = {f'widget{idx}': SlowWidget for idx in range(4)}
+    conftest.patch_entrypoint(monkeypatch, {WIDGET_KEY: objects})
+
+    core = pyqt_designer_plugin_entry_points.core
+    manifest_info = {
+        'widget0': dict(group='Manifest group', is_container=True),
+        'widget1': dict(group='Manifest group', is_container=True),
+        'widget2': dict(group='Manifest group'),
+    }
+    monkeypatch.setattr(core.manifest, 'get_designer_info',
+                        lambda manifests, entry: manifest_info.get(entry.name))
+
+    widgets = pyqt_designer_plugin_entry_points.enumerate_widgets(
+        budget=0.01)
+    assert set(widgets) == set(objects)
+    # widget3 has no manifest information, so it is loaded first, using up
+    # the budget
+    assert not issubclass(widgets['widget3'], core.LazyDesignerPluginWrapper)
+    deferred = [widgets['widget0'], widgets['widget1'], widgets['widget2']]
+    assert all(issubclass(plugin, core.LazyDesignerPluginWrapper) and
+               not plugin._loaded for plugin in deferred)
+
+    # The widget box entries are described by the manifest before loading,
+    # and Designer registering the plugins does not load them
+    for plugin_cls in deferred:
+        plugin = plugin_cls()
+        plugin.name()
+        plugin.group()
+        plugin.isContainer()
+        plugin.icon()
+        plugin.includeFile()
+        plugin.toolTip()
+        plugin.whatsThis()
+        plugin.domXml()
+        assert not plugin_cls._loaded
+
+    plugin = widgets['widget1']()
+    assert plugin.group() == 'Manifest group'
+    assert plugin.isContainer()
+
+    deferred_loader = core.get_designer_hooks().deferred_loader
+    assert deferred_loader.pending == deferred
+    deferred_loader.load_next()
+    assert widgets['widget0']._loaded and not widgets['widget1']._loaded
+    deferred_loader.load_next()
+    deferred_loader.load_next()
+    assert widgets['widget1']._loaded and widgets['widget2']._loaded
+    assert not deferred_loader.pending
+
+
+def test_startup_budget_without_manifest(monkeypatch, qapp, caplog):
+    class SlowWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            time.sleep(0.05)
+            return dict(group='Slow group', is_container=True)
+
+    objects = {f'widget{idx}': SlowWidget for idx in range(2)}
+    conftest.patch_entrypoint(monkeypatch, {WIDGET_KEY: objects})
+
+    core = pyqt_designer_plugin_entry_points.core
+    with caplog.at_level(logging.WARNING):
+        widgets = pyqt_designer_plugin_entry_points.enumerate_widgets(
+            budget=0.01)
+
+    for plugin_cls in widgets.values():
+        assert not issubclass(plugin_cls, core.LazyDesignerPluginWrapper)
+        plugin = plugin_cls()
+        assert plugin.group() == 'Slow group'
+        assert plugin.isContainer()
+    assert 'widget1' in caplog.text
+
+
+def test_shared_info(monkeypatch, qapp):
+    received = []
+
+    class TestWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            return dict(group='Group name')
+
+        def init_for_designer(self, info):
+            received.append(info)
+
+    conftest.patch_entrypoint(
+        monkeypatch, {WIDGET_KEY: dict(test_widget=TestWidget)}
+    )
+    plugin_cls = pyqt_designer_plugin_entry_points.enumerate_widgets()[
+        'test_widget']
+    plugin = plugin_cls()
+    widgets = [plugin.createWidget(None) for _ in range(2)]
+
+    info = plugin_cls._info
+    assert received == [info, info]
+    assert all(item is info for item in received)
+    assert info['group'] == 'Group name'
+    assert dict(info)['cls'] is TestWidget
+    with pytest.raises(TypeError):
+        info['group'] = 'Changed'
+    assert info.replace(group='Changed')['group'] == 'Changed'
+    assert info['group'] == 'Group name'
+
+    # info() returns a mutable, JSON-serializable copy
+    info_dict = plugin_cls.info()
+    assert type(info_dict) is dict
+    info_dict['group'] = 'Changed'
+    assert plugin_cls.info()['group'] == 'Group name'
+
+    for widget in widgets:
+        widget.deleteLater()
+
+
+def test_dom_xml(qapp):
+    class TestLabel(QtWidgets.QLabel):
+        @classmethod
+        def get_designer_info(cls):
+            return dict(
+                tooltip='Position < limit & "moving"',
+                geometry=(120, 30),
+                properties=dict(text='Motor', wordWrap=True, margin=2,
+                                alignment='Qt::AlignLeft', custom_flag=1.5),
+            )
+
+    core = pyqt_designer_plugin_entry_points.core
+    plugin = core.DesignerPluginWrapper.from_class(TestLabel)()
+    xml = plugin.domXml()
+    assert plugin.domXml() is xml
+
+    root = ElementTree.fromstring(xml)
+    assert root.get('class') == 'TestLabel'
+    props = {prop.get('name'): prop for prop in root.findall('property')}
+    assert props['toolTip'].findtext('string') == (
+        'Position < limit & "moving"')
+    assert props['geometry'].findtext('rect/width') == '120'
+    assert props['text'].findtext('string') == 'Motor'
+    assert props['wordWrap'].findtext('bool') == 'true'
+    assert props['margin'].findtext('number') == '2'
+    assert props['alignment'].findtext('set') == 'Qt::AlignLeft'
+    assert props['custom_flag'].findtext('double') == '1.5'
+    assert props['custom_flag'].get('stdset') == '0'
+    assert props['text'].get('stdset') is None
+
+
+@pytest.mark.parametrize('geometry', [(1, 2, 3), ('wide', 30), 5])
+def test_dom_xml_invalid_geometry(qapp, caplog, geometry):
+    core = pyqt_designer_plugin_entry_points.core
+    xml = core.dom.make_dom_xml(
+        'TestLabel', dict(tooltip='Tip', geometry=geometry),
+        widget_cls=QtWidgets.QLabel)
+    props = {prop.get('name')
+             for prop in ElementTree.fromstring(xml).findall('property')}
+    assert props == {'toolTip'}
+    assert 'Invalid default geometry of TestLabel' in caplog.text
+
+
+def test_widget_collection(monkeypatch, qapp):
+    class TestWidget(QtWidgets.QWidget):
+        @classmethod
+        def get_designer_info(cls):
+            return dict(group='Group name')
+
+    conftest.patch_entrypoint(
+        monkeypatch, {WIDGET_KEY: dict(widget_a=TestWidget,
+                                       widget_b=TestWidget)}
+    )
+    core = pyqt_designer_plugin_entry_points.core
+    widgets = pyqt_designer_plugin_entry_points.enumerate_widgets()
+    collection_cls = core.DesignerPluginCollection.from_plugins(widgets)
+    assert collection_cls.plugin_classes() == widgets
+
+    collection = collection_cls()
+    assert collection._widgets is None
+    plugins = collection.customWidgets()
+    assert [type(plugin) for plugin in plugins] == list(widgets.values())
+    assert collection.customWidgets() == plugins
+    assert all(plugin.group() == 'Group name' for plugin in plugins)
@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+
+from PyQt5 import QtCore, QtWidgets
+
+from .. import core, workers
+
+logger = logging.getLogger(__name__)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QtWidgets.QApplication.processEvents()
+        time.sleep(0.001)
+    return condition()
+
+
+def test_result_delivery(qapp):
+    pool = workers.WorkerPool(max_workers=2)
+    results = []
+    errors = []
+
+    def callback(result):
+        results.append((result, threading.current_thread()))
+
+    try:
+        pool.submit(lambda value: (value, threading.current_thread()), 1,
+                    callback=callback)
+        pool.submit(lambda: 1 / 0, error_callback=errors.append)
+        assert wait_for(lambda: results and errors)
+    finally:
+        pool.shutdown(wait=True)
+
+    (value, worker_thread), callback_thread = results[0]
+    assert value == 1
+    assert worker_thread is not threading.main_thread()
+    assert callback_thread is threading.main_thread()
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert pool.pending_tasks() == []
+
+
+def test_cancel_on_form_removed(monkeypatch, qapp):
+    hooks = core.get_designer_hooks()
+    pool = workers.WorkerPool(max_workers=1)
+    monkeypatch.setattr(hooks, '_worker_pool', pool)
+
+    form = QtCore.QObject()
+    other_form = QtCore.QObject()
+    release = threading.Event()
+    started = threading.Event()
+    ran = []
+    delivered = []
+
+    def blocking(name):
+        started.set()
+        release.wait(5)
+        ran.append(name)
+        return name
+
+    try:
+        running = hooks.submit(blocking, 'running', form=form,
+                               callback=delivered.append)
+        queued = hooks.submit(blocking, 'queued', form=form,
+                              callback=delivered.append)
+        other = hooks.submit(blocking, 'other', form=other_form,
+                             callback=delivered.append)
+        assert started.wait(5)
+
+        removed = []
+        hooks.formWindowRemoved.connect(removed.append)
+        hooks._form_window_removed(form)
+        hooks.formWindowRemoved.disconnect(removed.append)
+        assert removed == [form]
+        assert running.cancelled and queued.cancelled
+        assert not other.cancelled
+
+        release.set()
+        assert wait_for(lambda: delivered)
+    finally:
+        pool.shutdown(wait=True)
+
+    assert ran == ['running', 'other']
+    assert delivered == ['other']
@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_flag(name, default=False):
+    """
+    Interpret the environment variable ``name`` as a boolean flag.
+
+    Parameters
+    ----------
+    name : str
+        The environment variable name.
+    default : bool, optional
+        The value to use if the variable is unset or empty.
+
+    Returns
+    -------
+    flag : bool
+    """
+    value = os.environ.get(name, '').strip().lower()
+    if not value:
+        return default
+    return value not in ('0', 'false', 'no', 'off')
+
+
+def env_number(name, default, type_=float, minimum=None):
+    """
+    Interpret the environment variable ``name`` as a number.
+
+    Parameters
+    ----------
+    name : str
+        The environment variable name.
+    default : number or None
+        The value to use if the variable is unset, empty or invalid.
+    type_ : type, optional
+        The number type, ``float`` or ``int``.
+    minimum : number, optional
+        The smallest valid value.
+
+    Returns
+    -------
+    number : number or None
+        Invalid settings are logged, and ``default`` is returned.
+    """
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return default
+
+    try:
+        number = type_(value)
+    except ValueError:
+        number = None
+
+    if number is None or (minimum is not None and number < minimum):
+        logger.warning('Invalid %s setting: %r', name, value)
+        return default
+    return number
+
+
+def atomic_write_json(filename, data, **kwargs):
+    """
+    Write ``data`` as JSON, replacing ``filename`` atomically.
+
+    The data is written to a temporary file in the same directory, which
+    then replaces ``filename``, so that concurrent readers never see a
+    partial file.  The directory is created if necessary.
+
+    Parameters
+    ----------
+    filename : str
+        The file to write.
+    data : object
+        The JSON-serializable data.
+    **kwargs :
+        Passed to ``json.dump``.
+
+    Raises
+    ------
+    Exception
+        Errors writing the file.  The temporary file is removed.
+    """
+    tmp_filename = f'{filename}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(tmp_filename, 'wt') as f:
+            json.dump(data, f, **kwargs)
+        os.replace(tmp_filename, filename)
+    except Exception:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            ...
+        raise
@@ -0,0 +1,225 @@
+"""
+Live detection of plugin distributions installed during a Designer session.
+
+The watcher monitors the directories on ``sys.path`` for new or upgraded
+``.dist-info`` and ``.egg-info`` directories.  Only the entry points of those
+distributions are read; new event hooks are connected to the designer hooks
+immediately, after passing preflight if ``PYQT_DESIGNER_PLUGIN_PREFLIGHT`` is
+enabled.
+
+Qt Designer does not support registering custom widget plugins after
+startup, so new widgets are not imported; they are reported through
+:attr:`widgetsAdded` and appear in the widget box once Designer is
+restarted.
+
+Entries already loaded are not loaded again when their distribution is
+upgraded, as their modules have already been imported.  A warning lists
+them; the new version is used once Designer is restarted.
+"""
+import logging
+import os
+import sys
+
+from PyQt5 import QtCore
+
+from . import backends, core, preflight, profiles
+from .utils import env_flag
+
+logger = logging.getLogger(__name__)
+
+WATCH_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_WATCH'
+_DISTRIBUTION_SUFFIXES = ('.dist-info', '.egg-info')
+
+
+def _entry_key(group, entry):
+    distro_name = entry.distro.name if entry.distro is not None else None
+    return (group, entry.name, distro_name)
+
+
+def _entry_version(entry):
+    return entry.distro.version if entry.distro is not None else None
+
+
+def _list_distributions(folder):
+    """The distribution metadata directory names in ``folder``"""
+    try:
+        return {name for name in os.listdir(folder)
+                if name.endswith(_DISTRIBUTION_SUFFIXES)}
+    except OSError:
+        return set()
+
+
+def _is_complete(dist_dir):
+    """Has the installer finished writing ``dist_dir``?"""
+    if dist_dir.endswith('.dist-info'):
+        # RECORD is the last file written by pip
+        return os.path.exists(os.path.join(dist_dir, 'RECORD'))
+    return True
+
+
+class DistributionWatcher(QtCore.QObject):
+    """
+    Watch for plugin distributions installed or upgraded during a session.
+
+    Parameters
+    ----------
+    table : dict, optional
+        The entry point table that has already been loaded.  Entries in it
+        are not loaded again.
+    path : list of str, optional
+        Defaults to ``sys.path``.
+    delay_ms : int, optional
+        Time to wait for further changes before checking a directory, as
+        installers write many files.
+    parent : QtCore.QObject, optional
+        The parent object.
+    """
+
+    # Entry point name to entry point, of widgets awaiting a restart
+    widgetsAdded = QtCore.pyqtSignal(dict)
+    eventsConnected = QtCore.pyqtSignal(dict)
+
+    def __init__(self, table=None, path=None, delay_ms=1000, parent=None):
+        super().__init__(parent=parent)
+        if path is None:
+            path = sys.path
+
+        self.folders = [folder for folder in dict.fromkeys(path)
+                        if folder and os.path.isdir(folder)]
+        self._known_entries = {
+            _entry_key(group, entry): _entry_version(entry)
+            for group, entries in (table or {}).items()
+            for entry in entries
+        }
+        self._known_distributions = {
+            folder: _list_distributions(folder) for folder in self.folders
+        }
+        self._changed_folders = set()
+        self._profile = profiles.get_profile()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.check)
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        if self.folders:
+            self._watcher.addPaths(self.folders)
+        self._watcher.directoryChanged.connect(self._directory_changed)
+
+    def _directory_changed(self, folder):
+        self._changed_folders.add(folder)
+        self._timer.start()
+
+    def check(self, folders=None):
+        """
+        Check for new distributions, and load any new entry points.
+
+        Parameters
+        ----------
+        folders : list of str, optional
+            The folders to check.  Defaults to those reported as changed.
+
+        Returns
+        -------
+        table : dict
+            The new entries, as an entry point table.
+        """
+        if folders is None:
+            folders = list(self._changed_folders)
+        self._changed_folders.clear()
+
+        table = {}
+        pending = False
+        for folder in folders:
+            known = self._known_distributions.setdefault(folder, set())
+            for name in sorted(_list_distributions(folder) - known):
+                dist_dir = os.path.join(folder, name)
+                if not _is_complete(dist_dir):
+                    # Still being installed; look again later
+                    self._changed_folders.add(folder)
+                    pending = True
+                    continue
+
+                known.add(name)
+                self._add_new_entries(table, dist_dir)
+
+        if pending:
+            self._timer.start()
+
+        if table:
+            self._load(table)
+        return table
+
+    def _add_new_entries(self, table, dist_dir):
+        try:
+            dist_table = backends.scan_distribution(
+                dist_dir, core.get_group_filter(self._profile))
+        except Exception:
+            logger.exception('Failed to read entry points of %s', dist_dir)
+            return
+
+        if self._profile is not None:
+            dist_table = self._profile.filter_table(dist_table)
+
+        upgraded = []
+        for group, entries in dist_table.items():
+            for entry in entries:
+                key = _entry_key(group, entry)
+                version = _entry_version(entry)
+                if key in self._known_entries:
+                    if self._known_entries[key] != version:
+                        self._known_entries[key] = version
+                        upgraded.append(entry)
+                    continue
+                self._known_entries[key] = version
+                table.setdefault(group, []).append(entry)
+
+        if upgraded:
+            logger.warning(
+                'Designer plugin distribution %s was upgraded to %s. Restart '
+                'Designer to use the new version of: %s',
+                upgraded[0].distro.name, upgraded[0].distro.version,
+                ', '.join(entry.name for entry in upgraded)
+            )
+
+    def _load(self, table):
+        # Widgets cannot be registered in the running session, so they are
+        # only reported, not imported
+        widgets = {entry.name: entry
+                   for entry in table.get(core.ENTRYPOINT_WIDGET_KEY, [])}
+        if widgets:
+            logger.warning(
+                'New designer widgets were installed: %s. Restart Designer '
+                'to add them to the widget box.', ', '.join(widgets)
+            )
+            self.widgetsAdded.emit(widgets)
+
+        # Event hooks are imported into Designer, so check them first when
+        # preflight is enabled, as at startup
+        hooks = preflight.apply_preflight(
+            {group: entries for group, entries in table.items()
+             if group.startswith(f'{core.ENTRYPOINT_EVENT_KEY}.')})
+        results = core.connect_events(table=hooks)
+        if results['connected']:
+            logger.info('Connected newly installed event hooks: %s',
+                        results['connected'])
+            self.eventsConnected.emit(results)
+
+
+def start_watcher(table=None, path=None):
+    """
+    Start watching for new plugin distributions, if enabled by the
+    ``PYQT_DESIGNER_PLUGIN_WATCH`` environment variable.
+
+    The watcher is owned by the designer hooks object.
+
+    Returns
+    -------
+    watcher : DistributionWatcher or None
+    """
+    if not env_flag(WATCH_ENV_VAR):
+        return None
+
+    designer_hooks = core.get_designer_hooks()
+    return DistributionWatcher(table=table, path=path, parent=designer_hooks)
@@ -0,0 +1,189 @@
+"""
+A shared worker pool for event hooks.
+
+Hooks run on the GUI thread, so slow work in them - scanning a form for
+PV names, checking names against a database - freezes Designer.  Hooks may
+instead submit the work to the designer hooks' pool::
+
+    def form_added(form):
+        get_designer_hooks().submit(find_pv_names, form.contents(),
+                                    callback=show_pv_names, form=form)
+
+The function runs on a worker thread; its result (or exception) is
+delivered to the callback on the GUI thread.  Work submitted for a form
+window is cancelled when that form is closed: queued work does not run, and
+results of running work are discarded.
+"""
+import concurrent.futures
+import logging
+import os
+import threading
+
+from PyQt5 import QtCore
+
+from .utils import env_number
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV_VAR = 'PYQT_DESIGNER_PLUGIN_WORKERS'
+
+
+def get_worker_count():
+    """The number of hook worker threads, from the environment."""
+    return env_number(WORKERS_ENV_VAR, min(4, os.cpu_count() or 1),
+                      type_=int, minimum=1)
+
+
+class WorkerTask:
+    """
+    Work submitted to a :class:`WorkerPool`.
+
+    Attributes
+    ----------
+    form : QtDesigner.QDesignerFormWindowInterface or None
+        The form window the work belongs to.
+    future : concurrent.futures.Future
+        The future of the function call.
+    """
+
+    __slots__ = ('form', 'future', 'callback', 'error_callback',
+                 '_cancelled')
+
+    def __init__(self, form=None, callback=None, error_callback=None):
+        self.form = form
+        self.future = None
+        self.callback = callback
+        self.error_callback = error_callback
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        """Was the task cancelled?  Long-running work may poll this."""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Cancel the task.  Work which has not started does not run, and the
+        callbacks of running work are not called.
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self):
+        """Has the work finished, or been cancelled?"""
+        return self.future is not None and self.future.done()
+
+    def __repr__(self):
+        return (f'<WorkerTask form={self.form!r} cancelled={self.cancelled} '
+                f'future={self.future!r}>')
+
+
+class WorkerPool(QtCore.QObject):
+    """
+    A bounded pool of worker threads, delivering results to the GUI thread.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The number of worker threads.  Defaults to
+        :func:`get_worker_count`.
+    parent : QtCore.QObject, optional
+        The parent object, which must live in the GUI thread.
+    """
+
+    taskFinished = QtCore.pyqtSignal(object)
+    taskFailed = QtCore.pyqtSignal(object, object)
+    # Emitted from worker threads; queued to the GUI thread
+    _taskDone = QtCore.pyqtSignal(object)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent=parent)
+        self.max_workers = max_workers or get_worker_count()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='designer-hook-worker',
+        )
+        self._tasks = set()
+        self._taskDone.connect(self._deliver, QtCore.Qt.QueuedConnection)
+
+    def submit(self, fn, *args, callback=None, error_callback=None,
+               form=None, **kwargs):
+        """
+        Run ``fn(*args, **kwargs)`` on a worker thread.
+
+        Parameters
+        ----------
+        fn : callable
+            The function.  It must not use widgets or other GUI objects.
+        callback : callable, optional
+            Called on the GUI thread with the result.
+        error_callback : callable, optional
+            Called on the GUI thread with the exception, if ``fn`` raises.
+            By default, the exception is logged.
+        form : QtDesigner.QDesignerFormWindowInterface, optional
+            Cancel the work when this form window is closed.
+
+        Returns
+        -------
+        task : WorkerTask
+        """
+        task = WorkerTask(form=form, callback=callback,
+                          error_callback=error_callback)
+
+        def run():
+            if task.cancelled:
+                return None
+            return fn(*args, **kwargs)
+
+        self._tasks.add(task)
+        task.future = self._executor.submit(run)
+        task.future.add_done_callback(
+            lambda future: self._task_done(task))
+        return task
+
+    def _task_done(self, task):
+        try:
+            self._taskDone.emit(task)
+        except RuntimeError:
+            # The pool was deleted at shutdown
+            ...
+
+    def cancel_form(self, form):
+        """Cancel all work belonging to ``form``."""
+        tasks = self.pending_tasks(form)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.debug('Cancelled %d hook task(s) of a closed form',
+                         len(tasks))
+
+    def pending_tasks(self, form=None):
+        """The undelivered tasks, optionally only those of ``form``."""
+        return [task for task in self._tasks
+                if form is None or task.form is form]
+
+    def _deliver(self, task):
+        self._tasks.discard(task)
+        if task.cancelled or task.future.cancelled():
+            return
+
+        ex = task.future.exception()
+        if ex is not None:
+            self.taskFailed.emit(task, ex)
+            if task.error_callback is not None:
+                task.error_callback(ex)
+            else:
+                logger.error('Designer hook task failed: %s', ex,
+                             exc_info=ex)
+            return
+
+        self.taskFinished.emit(task)
+        if task.callback is not None:
+            task.callback(task.future.result())
+
+    def shutdown(self, wait=False):
+        """Cancel all pending work and stop the worker threads."""
+        for task in self.pending_tasks():
+            task.cancel()
+        self._executor.shutdown(wait=wait)